@@ -0,0 +1,40 @@
+"""
+Memory used by queue player stats at 100k players.
+
+Compares the saved JSON shape (a dict of dicts keyed by string ID) with PlayerStatsTable.
+
+Usage: python -m benchmarks.stats_memory [players]
+"""
+
+import random
+import sys
+import tracemalloc
+
+from sixMans.stats import PlayerStatsTable
+
+
+def make_players(count: int) -> dict[str, dict]:
+    rng = random.Random(0)
+    return {str(rng.randrange(10**17, 10**18)): {"Points": rng.randrange(5000), "GamesPlayed": rng.randrange(500), "Wins": rng.randrange(250)} for _ in range(count)}
+
+
+def measure(build) -> int:
+    tracemalloc.start()
+    obj = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del obj
+    return size
+
+
+def main(count: int):
+    players = make_players(count)
+    as_dicts = measure(lambda: make_players(count))
+    as_table = measure(lambda: PlayerStatsTable(players))
+    print(f"{count} players")
+    print(f"  dict of dicts:    {as_dicts / 1024 / 1024:8.2f} MiB")
+    print(f"  PlayerStatsTable: {as_table / 1024 / 1024:8.2f} MiB ({as_table / as_dicts:.0%})")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,288 @@
+import datetime
+import math
+from array import array
+from typing import Any
+
+WAIT_BUCKETS = (30, 60, 120, 300, 600, 1200, 1800, 3600)  # Upper bounds of the wait histogram buckets (seconds)
+WAIT_BUCKET_COUNT = len(WAIT_BUCKETS) + 1
+ANALYTICS_WINDOW_DAYS = 7  # Days of joins, timeouts, dequeues and waits that queue stats are calculated from
+HOURS_PER_DAY = 24
+HOURS_PER_WEEK = 7 * HOURS_PER_DAY
+DAY_NAMES = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+HEATMAP_SHADES = " ░▒▓█"
+ARRIVAL_SMOOTHING = 0.3  # Weight of the latest week when updating the arrival rate for an hour of the week
+ETA_MAX_HOURS = 12  # Pop estimates beyond this are shown as "more than" (hours)
+
+
+def hour_of_week(at: datetime.datetime) -> int:
+    """Hour of the week in UTC, from 0 (Monday 00:00) to 167 (Sunday 23:00)."""
+    at = at.astimezone(datetime.timezone.utc)
+    return at.weekday() * HOURS_PER_DAY + at.hour
+
+
+def _epoch_hour(at: datetime.datetime) -> int:
+    return int(at.timestamp() // 3600)
+
+
+def _epoch_day(at: datetime.datetime) -> int:
+    return int(at.timestamp() // 86400)
+
+
+def _epoch_hour_of_week(epoch_hour: int) -> int:
+    # The epoch started on a Thursday
+    return (epoch_hour // HOURS_PER_DAY + 3) % 7 * HOURS_PER_DAY + epoch_hour % HOURS_PER_DAY
+
+
+class QueueAnalytics:
+    """
+    Rolling wait time and throughput aggregates for one queue.
+
+    Everything is held in fixed size arrays, so memory use doesn't grow with queue activity:
+
+    - join, timeout, dequeue and wait counts for each of the last `ANALYTICS_WINDOW_DAYS` days, as rings
+      indexed by day, along with a histogram of join to pop wait times for each day (see `WAIT_BUCKETS`,
+      the last bucket is open ended)
+    - pops in each of the last 24 hours, as a ring indexed by hour, and a total of all pops
+    - join and pop counts for each hour of the week
+    - a smoothed join rate for each hour of the week, used to estimate when the queue will pop
+    """
+
+    __slots__ = (
+        "wait_histogram",
+        "daily_wait_total",
+        "daily_popped_players",
+        "daily_joins",
+        "daily_timeouts",
+        "daily_dequeues",
+        "last_day",
+        "pops",
+        "hourly_pops",
+        "last_hour",
+        "join_heatmap",
+        "pop_heatmap",
+        "arrival_rates",
+        "join_hour",
+        "hour_joins",
+        "dirty",
+    )
+
+    def __init__(self, data: dict[str, Any] | None = None):
+        data = data or {}
+        # One row of `len(WAIT_BUCKETS) + 1` buckets per day
+        self.wait_histogram = array("q", data.get("DailyWaitHistogram") or [0] * (ANALYTICS_WINDOW_DAYS * WAIT_BUCKET_COUNT))
+        self.daily_wait_total = array("d", data.get("DailyWaitTotal") or [0.0] * ANALYTICS_WINDOW_DAYS)  # Sum of the waits (seconds)
+        self.daily_popped_players = array("q", data.get("DailyPoppedPlayers") or [0] * ANALYTICS_WINDOW_DAYS)
+        self.daily_joins = array("q", data.get("DailyJoins") or [0] * ANALYTICS_WINDOW_DAYS)
+        self.daily_timeouts = array("q", data.get("DailyTimeouts") or [0] * ANALYTICS_WINDOW_DAYS)
+        self.daily_dequeues = array("q", data.get("DailyDequeues") or [0] * ANALYTICS_WINDOW_DAYS)
+        self.last_day: int = data.get("LastDay", 0)  # Days since the epoch of the newest daily slot
+        self.pops: int = data.get("Pops", 0)
+        self.hourly_pops = array("q", data.get("HourlyPops") or [0] * HOURS_PER_DAY)
+        self.last_hour: int = data.get("LastHour", 0)  # Hours since the epoch of the newest `hourly_pops` slot
+        self.join_heatmap = array("q", data.get("JoinHeatmap") or [0] * HOURS_PER_WEEK)
+        self.pop_heatmap = array("q", data.get("PopHeatmap") or [0] * HOURS_PER_WEEK)
+        self.arrival_rates = array("d", data.get("ArrivalRates") or [0.0] * HOURS_PER_WEEK)  # Joins per hour
+        self.join_hour: int = data.get("JoinHour", 0)  # Hours since the epoch that `hour_joins` is counting
+        self.hour_joins: int = data.get("HourJoins", 0)
+        self.dirty = False  # Changed since it was last saved
+
+    # Events
+
+    def record_join(self, at: datetime.datetime):
+        self.dirty = True
+        self.daily_joins[self._advance_days(at)] += 1
+        self.join_heatmap[hour_of_week(at)] += 1
+        self._roll_arrivals(at)
+        self.hour_joins += 1
+
+    def record_pop(self, waits: list[float], at: datetime.datetime):
+        """A game was created from players who waited `waits` seconds."""
+        self.dirty = True
+        self.pops += 1
+        self.pop_heatmap[hour_of_week(at)] += 1
+        self._advance(at)
+        self.hourly_pops[_epoch_hour(at) % HOURS_PER_DAY] += 1
+        slot = self._advance_days(at)
+        for wait in waits:
+            self.wait_histogram[slot * WAIT_BUCKET_COUNT + self._bucket(wait)] += 1
+            self.daily_wait_total[slot] += wait
+        self.daily_popped_players[slot] += len(waits)
+
+    def record_timeout(self, at: datetime.datetime):
+        self.dirty = True
+        self.daily_timeouts[self._advance_days(at)] += 1
+
+    def record_dequeue(self, at: datetime.datetime):
+        self.dirty = True
+        self.daily_dequeues[self._advance_days(at)] += 1
+
+    # Summaries, over the last `ANALYTICS_WINDOW_DAYS` days unless noted
+
+    def popped_players(self, now: datetime.datetime) -> int:
+        self._advance_days(now)
+        return sum(self.daily_popped_players)
+
+    def average_wait(self, now: datetime.datetime) -> float | None:
+        popped = self.popped_players(now)
+        return sum(self.daily_wait_total) / popped if popped else None
+
+    def wait_percentile(self, percentile: float, now: datetime.datetime) -> int | None:
+        """Upper bound of the histogram bucket holding the given percentile (0-100). None past the last bound."""
+        popped = self.popped_players(now)
+        if not popped:
+            return None
+        target = popped * percentile / 100
+        seen = 0
+        for bucket in range(WAIT_BUCKET_COUNT):
+            seen += sum(self.wait_histogram[bucket::WAIT_BUCKET_COUNT])
+            if seen >= target:
+                return WAIT_BUCKETS[bucket] if bucket < len(WAIT_BUCKETS) else None
+        return None
+
+    def joins(self, now: datetime.datetime) -> int:
+        self._advance_days(now)
+        return sum(self.daily_joins)
+
+    def timeout_rate(self, now: datetime.datetime) -> float:
+        """Share of joins that ended with the player timing out of the queue."""
+        joins = self.joins(now)
+        return sum(self.daily_timeouts) / joins if joins else 0.0
+
+    def dequeue_rate(self, now: datetime.datetime) -> float:
+        """Share of joins that ended with the player leaving or being removed from the queue."""
+        joins = self.joins(now)
+        return sum(self.daily_dequeues) / joins if joins else 0.0
+
+    def pops_since(self, hours: int, now: datetime.datetime) -> int:
+        """Pops in the current and previous `hours - 1` hours, up to 24."""
+        self._advance(now)
+        current = _epoch_hour(now)
+        return sum(self.hourly_pops[(current - h) % HOURS_PER_DAY] for h in range(min(hours, HOURS_PER_DAY)))
+
+    def arrival_rate(self, now: datetime.datetime) -> float:
+        """Expected joins per hour right now. Hours of the week without history use the average of the rest."""
+        self._roll_arrivals(now)
+        rate = self.arrival_rates[hour_of_week(now)]
+        if rate:
+            return rate
+        known = [r for r in self.arrival_rates if r]
+        return sum(known) / len(known) if known else 0.0
+
+    def pop_eta(self, needed: int, now: datetime.datetime) -> float | None:
+        """
+        Seconds until `needed` more players are expected to be waiting, or None without enough history.
+
+        Joins are discounted by the share of players who time out or leave before the queue pops.
+        """
+        if needed <= 0:
+            return 0.0
+        net_rate = self.arrival_rate(now) * max(1 - self.timeout_rate(now) - self.dequeue_rate(now), 0.0)
+        if net_rate <= 0:
+            return None
+        return needed / net_rate * 3600
+
+    def busiest_hours(self, count: int = 3) -> list[int]:
+        """Hours of the week with the most joins, busiest first."""
+        ranked = sorted(range(HOURS_PER_WEEK), key=lambda h: (-self.join_heatmap[h], h))
+        return [h for h in ranked[:count] if self.join_heatmap[h]]
+
+    def render_heatmap(self, heatmap: array | None = None) -> str:
+        """Day by hour text heatmap (UTC), shaded relative to the busiest hour."""
+        heatmap = heatmap if heatmap is not None else self.join_heatmap
+        peak = max(heatmap) or 1
+        top = len(HEATMAP_SHADES) - 1
+        rows = []
+        for day, name in enumerate(DAY_NAMES):
+            hours = heatmap[day * HOURS_PER_DAY : (day + 1) * HOURS_PER_DAY]
+            rows.append(f"{name} " + "".join(HEATMAP_SHADES[math.ceil(count * top / peak)] for count in hours))
+        return "\n".join(rows)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "DailyWaitHistogram": self.wait_histogram.tolist(),
+            "DailyWaitTotal": self.daily_wait_total.tolist(),
+            "DailyPoppedPlayers": self.daily_popped_players.tolist(),
+            "DailyJoins": self.daily_joins.tolist(),
+            "DailyTimeouts": self.daily_timeouts.tolist(),
+            "DailyDequeues": self.daily_dequeues.tolist(),
+            "LastDay": self.last_day,
+            "Pops": self.pops,
+            "HourlyPops": self.hourly_pops.tolist(),
+            "LastHour": self.last_hour,
+            "JoinHeatmap": self.join_heatmap.tolist(),
+            "PopHeatmap": self.pop_heatmap.tolist(),
+            "ArrivalRates": self.arrival_rates.tolist(),
+            "JoinHour": self.join_hour,
+            "HourJoins": self.hour_joins,
+        }
+
+    # Internal
+
+    @staticmethod
+    def _bucket(wait: float) -> int:
+        for bucket, bound in enumerate(WAIT_BUCKETS):
+            if wait <= bound:
+                return bucket
+        return len(WAIT_BUCKETS)
+
+    def _advance(self, at: datetime.datetime):
+        """Clear the hourly slots that have rolled over since the last pop."""
+        current = _epoch_hour(at)
+        if current <= self.last_hour:
+            return
+        for hour in range(self.last_hour + 1, min(current, self.last_hour + HOURS_PER_DAY) + 1):
+            self.hourly_pops[hour % HOURS_PER_DAY] = 0
+        self.last_hour = current
+
+    def _advance_days(self, at: datetime.datetime) -> int:
+        """Clear the daily slots that have rolled over since the last event. Returns the slot for `at`."""
+        current = _epoch_day(at)
+        if current > self.last_day:
+            for day in range(self.last_day + 1, min(current, self.last_day + ANALYTICS_WINDOW_DAYS) + 1):
+                slot = day % ANALYTICS_WINDOW_DAYS
+                for ring in (self.daily_wait_total, self.daily_popped_players, self.daily_joins, self.daily_timeouts, self.daily_dequeues):
+                    ring[slot] = 0
+                for bucket in range(slot * WAIT_BUCKET_COUNT, (slot + 1) * WAIT_BUCKET_COUNT):
+                    self.wait_histogram[bucket] = 0
+            self.last_day = current
+        return current % ANALYTICS_WINDOW_DAYS
+
+    def _roll_arrivals(self, at: datetime.datetime):
+        """
+        Fold finished hours into the arrival rates.
+
+        Runs once per new hour, and at most a week of empty hours is folded, so joins stay O(1) amortized.
+        """
+        current = _epoch_hour(at)
+        if current <= self.join_hour:
+            return
+        if self.join_hour:
+            self._fold_hour(self.join_hour, self.hour_joins)
+            for hour in range(self.join_hour + 1, min(current, self.join_hour + HOURS_PER_WEEK + 1)):
+                self._fold_hour(hour, 0)
+        self.join_hour = current
+        self.hour_joins = 0
+
+    def _fold_hour(self, epoch_hour: int, joins: int):
+        slot = _epoch_hour_of_week(epoch_hour)
+        rate = self.arrival_rates[slot]
+        # The first week seeds the rate, later weeks are smoothed into it
+        self.arrival_rates[slot] = rate + ARRIVAL_SMOOTHING * (joins - rate) if rate else joins
+
+
+def format_hour_of_week(hour: int) -> str:
+    return f"{DAY_NAMES[hour // HOURS_PER_DAY]} {hour % HOURS_PER_DAY:02d}:00 UTC"
+
+
+def format_eta(seconds: float | None, now: datetime.datetime | None = None) -> str:
+    """
+    Pop estimate as a Discord relative timestamp.
+
+    The timestamp is absolute, so Discord keeps the countdown current on messages that aren't edited often.
+    """
+    if seconds is None:
+        return "Not enough queue history yet"
+    if seconds >= ETA_MAX_HOURS * 3600:
+        return f"More than {ETA_MAX_HOURS} hours"
+    now = now or datetime.datetime.now(datetime.timezone.utc)
+    return f"<t:{int(now.timestamp() + seconds)}:R>"
@@ -0,0 +1,75 @@
+import datetime
+import heapq
+import logging
+
+from sixMans.types import QueueBan
+
+log = logging.getLogger("red.sixMans.bans")
+
+BAN_SWEEP_INTERVAL = 60  # How often expired queue bans are removed from Config (seconds)
+
+
+def utc_timestamp() -> float:
+    return datetime.datetime.now(datetime.timezone.utc).timestamp()
+
+
+class QueueBanTable:
+    """
+    In-memory queue bans for a single guild.
+
+    Lookups are a dict access. Expiry times are tracked in a min-heap so the sweep
+    only touches bans that have actually expired. Heap entries are not removed when a
+    ban is lifted or replaced; they are discarded lazily when popped.
+    """
+
+    def __init__(self, bans: dict[str, QueueBan] | None = None):
+        self.bans: dict[str, QueueBan] = bans if bans is not None else {}
+        self._expiry: list[tuple[float, str]] = [(ban["expires"], pid) for pid, ban in self.bans.items()]
+        heapq.heapify(self._expiry)
+
+    def __len__(self) -> int:
+        return len(self.bans)
+
+    def __contains__(self, member_id: int | str) -> bool:
+        return str(member_id) in self.bans
+
+    def get(self, member_id: int | str, now: float | None = None) -> QueueBan | None:
+        """Active ban for a member. Expired bans are treated as lifted and left for the sweep."""
+        ban = self.bans.get(str(member_id))
+        if not ban:
+            return None
+        if ban["expires"] <= (now if now is not None else utc_timestamp()):
+            return None
+        return ban
+
+    def add(self, member_id: int | str, ban: QueueBan):
+        pid = str(member_id)
+        self.bans[pid] = ban
+        heapq.heappush(self._expiry, (ban["expires"], pid))
+
+    def remove(self, member_id: int | str) -> QueueBan | None:
+        return self.bans.pop(str(member_id), None)
+
+    def next_expiry(self) -> float | None:
+        """Earliest pending expiry time, skipping stale heap entries."""
+        while self._expiry:
+            expires, pid = self._expiry[0]
+            if self._is_current(expires, pid):
+                return expires
+            heapq.heappop(self._expiry)
+        return None
+
+    def pop_expired(self, now: float | None = None) -> list[str]:
+        """Remove every ban that has expired. Returns the member IDs that were removed."""
+        now = now if now is not None else utc_timestamp()
+        expired: list[str] = []
+        while self._expiry and self._expiry[0][0] <= now:
+            expires, pid = heapq.heappop(self._expiry)
+            if self._is_current(expires, pid):
+                del self.bans[pid]
+                expired.append(pid)
+        return expired
+
+    def _is_current(self, expires: float, pid: str) -> bool:
+        ban = self.bans.get(pid)
+        return ban is not None and ban["expires"] == expires
@@ -0,0 +1,111 @@
+import asyncio
+import contextlib
+import datetime
+import logging
+from collections.abc import Callable, Coroutine
+from typing import TYPE_CHECKING, Any
+
+import discord
+
+from sixMans.analytics import format_eta
+from sixMans.metrics import rest
+
+if TYPE_CHECKING:
+    from sixMans.queue import SixMansQueue
+
+log = logging.getLogger("red.sixMans.board")
+
+BOARD_EDIT_DELAY = 2.0  # Seconds to coalesce queue changes into a single edit per channel
+BOARD_REPOST_INTERVAL = 120.0  # Minimum seconds before a buried board is reposted at the bottom of the channel
+
+
+class QueueBoard:
+    """Live queue status message for each queue channel, edited in place."""
+
+    def __init__(
+        self,
+        queue: "SixMansQueue",
+        message_ids: dict[int, int] | None = None,
+        delay: float = BOARD_EDIT_DELAY,
+        save_callback: Callable[[], Coroutine[Any, Any, None]] | None = None,
+    ):
+        self.queue = queue
+        self.delay = delay
+        self.save_callback = save_callback
+        self.message_ids: dict[int, int] = dict(message_ids or {})
+        self.posted_at: dict[int, datetime.datetime] = {}
+        self.last_event: str | None = None
+        self._task: asyncio.Task | None = None
+
+    def refresh(self, event: str | None = None):
+        """Schedule a board update. Updates requested within `delay` seconds are coalesced into one edit."""
+        if event:
+            self.last_event = event
+        if self._task and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._flush_later())
+
+    def cancel(self):
+        if self._task and not self._task.done():
+            self._task.cancel()
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.delay)
+        await self.flush()
+
+    async def flush(self):
+        """Apply the current queue state to every queue channel board."""
+        embed = self.embed()
+        results = await self.queue.fan_out(lambda channel: self._update_channel(channel, embed))
+        reposted = any(r["Result"] for r in results)
+
+        # Persist new board message IDs so they are reused after a restart
+        if reposted and self.save_callback:
+            await self.save_callback()
+
+    async def _update_channel(self, channel: discord.TextChannel, embed: discord.Embed) -> bool:
+        """Edit the channel board in place. Returns True if a new board message was posted."""
+        message_id = self.message_ids.get(channel.id)
+        if message_id and not self._buried(channel, message_id):
+            try:
+                await rest("edit_message", channel.get_partial_message(message_id).edit(embed=embed))
+                return False
+            except discord.NotFound:
+                log.debug(f"[{self.queue.name}] Queue board message in {channel} was deleted. Reposting.")
+                message_id = None
+
+        msg = await rest("send_message", channel.send(embed=embed))
+        self.message_ids[channel.id] = msg.id
+        self.posted_at[channel.id] = msg.created_at
+
+        # Remove the old board so only one is visible per channel
+        if message_id:
+            with contextlib.suppress(discord.HTTPException):
+                await rest("delete_message", channel.get_partial_message(message_id).delete())
+        return True
+
+    def _buried(self, channel: discord.TextChannel, message_id: int) -> bool:
+        """Board is no longer the latest message and has not been reposted recently."""
+        if channel.last_message_id in (None, message_id):
+            return False
+        posted_at = self.posted_at.get(channel.id) or discord.utils.snowflake_time(message_id)
+        return (discord.utils.utcnow() - posted_at).total_seconds() > BOARD_REPOST_INTERVAL
+
+    def embed(self) -> discord.Embed:
+        players = list(self.queue.queue.queue)
+        player_list = ", ".join(p.mention for p in players) or "No players currently in the queue"
+        embed = discord.Embed(
+            title=f"{self.queue.name} {self.queue.maxSize} Mans Queue",
+            description=self.last_event,
+            color=discord.Colour.blue(),
+            timestamp=discord.utils.utcnow(),
+        )
+        embed.add_field(
+            name=f"Players in Queue ({len(players)}/{self.queue.maxSize})",
+            value=player_list,
+            inline=False,
+        )
+        if not self.queue.ready_to_pop():
+            embed.add_field(name="Estimated Pop", value=format_eta(self.queue.pop_eta()), inline=False)
+        embed.set_footer(text="Last updated")
+        return embed
@@ -0,0 +1,30 @@
+from collections.abc import Iterable, Mapping
+
+import discord
+
+SUGGESTED_PICKS = 3  # Number of ranked suggestions shown to the captain on the clock
+
+
+def rank_picks(pickable: Iterable[discord.Member], scores: Mapping[discord.Member, float]) -> list[discord.Member]:
+    """
+    Order the remaining players from best to worst pick.
+
+    `scores` are the player scores from `Game.get_player_scores`. Players without a score rank as average.
+    Ties are broken by member ID so suggestions and auto picks are deterministic.
+    """
+    pickable = list(pickable)
+    if not pickable:
+        return []
+    average = sum(scores.values()) / len(scores) if scores else 0.0
+    return sorted(pickable, key=lambda p: (-scores.get(p, average), p.id))
+
+
+def auto_pick(pickable: Iterable[discord.Member], scores: Mapping[discord.Member, float]) -> discord.Member | None:
+    """Best remaining player, used when a captain runs out of time."""
+    ranked = rank_picks(pickable, scores)
+    return ranked[0] if ranked else None
+
+
+def draft_time_limit(picks: int, pick_time: int) -> int:
+    """Upper bound in seconds on how long a draft of `picks` picks can take with the pick clock on."""
+    return picks * pick_time
@@ -0,0 +1,84 @@
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import discord
+
+from sixMans.metrics import rest
+
+log = logging.getLogger("red.sixMans.editor")
+
+EDIT_INTERVAL = 1.0  # Minimum time between edits of the same message (seconds)
+
+
+class CoalescingEditor:
+    """
+    Rate limits edits to a message.
+
+    An edit is applied straight away if the last one was at least `interval` seconds ago. Edits made
+    sooner are merged, and only the latest fields are applied once the interval has passed. `flush`
+    applies the final state immediately, along with anything still pending.
+
+    `clock` and `sleep` can be swapped out to drive the editor on a virtual clock.
+    """
+
+    def __init__(
+        self,
+        interval: float = EDIT_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    ):
+        self.interval = interval
+        self.clock = clock
+        self.sleep = sleep
+        self.message: discord.Message | discord.PartialMessage | None = None
+        self._pending: dict[str, Any] | None = None
+        self._last_edit = float("-inf")
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def pending(self) -> bool:
+        return self._pending is not None
+
+    async def edit(self, message: discord.Message | discord.PartialMessage, **fields: Any):
+        """Queue an edit. Fields from edits that haven't been applied yet are overwritten by newer ones."""
+        self.message = message
+        self._pending = {**(self._pending or {}), **fields}
+        if self._task and not self._task.done():
+            return
+
+        if self.clock() - self._last_edit >= self.interval:
+            await self._apply()
+        else:
+            self._task = asyncio.create_task(self._apply_later())
+
+    async def flush(self, message: discord.Message | discord.PartialMessage, **fields: Any):
+        """Apply `fields` and any pending edit now."""
+        self.message = message
+        self._pending = {**(self._pending or {}), **fields}
+        await self._apply()
+        if self._task and not self._task.done():
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+
+    async def _apply_later(self):
+        # Edits queued while a previous one was in flight are picked up by the next pass
+        while self._pending is not None:
+            await self.sleep(max(self._last_edit + self.interval - self.clock(), 0))
+            await self._apply()
+
+    async def _apply(self):
+        async with self._lock:
+            fields, self._pending = self._pending, None
+            if fields is None or not self.message:
+                return
+            self._last_edit = self.clock()
+            try:
+                await rest("edit_message", self.message.edit(**fields))
+            except discord.HTTPException as exc:
+                log.warning(f"Unable to edit message {self.message.id}: {exc}")
@@ -21,6 +21,12 @@ class GameState(StrEnum):
     COMPLETE = "Complete"
 
 
+class StartupState(StrEnum):
+    PENDING = "Pending"
+    LOADING = "Loading"
+    READY = "Ready"
+
+
 class GameMode(StrEnum):
     RANDOM = "Random"
     CAPTAINS = "Captains"
@@ -11,8 +11,11 @@ import discord
 from sixMans import utils
 from sixMans.embeds import GreenEmbed
 from sixMans.enums import GameMode, GameState, Winner
+from sixMans.metrics import rest
 from sixMans.queue import SixMansQueue
 from sixMans.strings import Strings
+from sixMans.tracing import traced
+from sixMans.views import GamePrompt
 from sixMans.views.captains import CaptainsView
 from sixMans.views.selfpick import SelfPickingView
 from sixMans.views.vote import GameModeVote
@@ -35,6 +38,40 @@ SELECTION_MODES = {
 
 
 class Game:
+    __slots__ = (
+        "save_callback",
+        "player_votes",
+        "reaction_lock",
+        "id",
+        "queue",
+        "state",
+        "prefix",
+        "winner",
+        "teamSelection",
+        "roomName",
+        "roomPass",
+        "players",
+        "captains",
+        "blue",
+        "orange",
+        "textChannel",
+        "voiceChannels",
+        "helper_role",
+        "automove",
+        "info_message",
+        "balance_score",
+        "selection_message",
+        "mode_votes",
+        "vote_deadline",
+        "pick_order",
+        "pick_time",
+        "pick_deadline",
+        "score_message",
+        "score_report",
+        "score_deadline",
+        "prompts",
+    )
+
     def __init__(
         self,
         queue: SixMansQueue,
@@ -55,6 +92,15 @@ class Game:
         voice_channels: list[discord.VoiceChannel] | None = None,
         winner: Winner = Winner.PENDING,
         save_callback: Callable[[], Coroutine[Any, Any, None]] | None = None,
+        selection_message: int | None = None,
+        mode_votes: dict[int, GameMode] | None = None,
+        vote_deadline: float | None = None,
+        pick_order: list[int] | None = None,
+        pick_time: int = 0,
+        pick_deadline: float | None = None,
+        score_message: int | None = None,
+        score_report: dict[int, Winner] | None = None,
+        score_deadline: float | None = None,
     ):
         # Setup
         self.save_callback = save_callback
@@ -103,10 +149,24 @@ class Game:
         self.helper_role: discord.Role | None = helper_role
         self.automove = automove
         self.info_message = info_message
+        self.balance_score: float | None = None
+
+        # Interactive view state. Kept here so views can be rebuilt after a restart.
+        self.selection_message: int | None = selection_message
+        self.mode_votes: dict[int, GameMode] = mode_votes or {}
+        self.vote_deadline: float | None = vote_deadline
+        self.pick_order: list[int] = pick_order or []
+        self.pick_time = pick_time  # Seconds each captain has per pick. Disabled if 0
+        self.pick_deadline: float | None = pick_deadline
+        self.score_message: int | None = score_message
+        self.score_report: dict[int, Winner] = score_report or {}
+        self.score_deadline: float | None = score_deadline
+        self.prompts: dict[str, GamePrompt] = {}  # Open button prompts by custom ID kind
 
         log.debug(f"Game created. ID: {self.id} Players: {self.players}")
 
     # Team Management
+    @traced("create_game_channels")
     async def create_game_channels(self, category=None):
         if not category:
             category = self.queue.category
@@ -116,48 +176,48 @@ class Game:
         code = str(self.id)[-3:]
 
         # Create Game Text Channel
-        self.textChannel = await guild.create_text_channel(f"{code} {self.queue.name} {self.queue.maxSize} Mans", category=category)
-        await self.textChannel.set_permissions(guild.default_role, view_channel=False, read_messages=False)
+        self.textChannel = await rest("create_channel", guild.create_text_channel(f"{code} {self.queue.name} {self.queue.maxSize} Mans", category=category))
+        await rest("set_permissions", self.textChannel.set_permissions(guild.default_role, view_channel=False, read_messages=False))
         for player in self.players:
             if isinstance(player, discord.Member):
-                await self.textChannel.set_permissions(player, read_messages=True)
+                await rest("set_permissions", self.textChannel.set_permissions(player, read_messages=True))
 
         # Create a general VC lobby for all players in a session
-        general_vc = await guild.create_voice_channel(
-            f"{code} | {self.queue.name} General VC",
-            category=category,
-        )
-        await general_vc.set_permissions(guild.default_role, connect=False)
+        general_vc = await rest("create_channel", guild.create_voice_channel(f"{code} | {self.queue.name} General VC", category=category))
+        await rest("set_permissions", general_vc.set_permissions(guild.default_role, connect=False))
 
-        blue_vc = await guild.create_voice_channel(
-            f"{code} | {self.queue.name} Blue Team",
-            category=category,
-        )
-        await blue_vc.set_permissions(guild.default_role, connect=False)
-        oran_vc = await guild.create_voice_channel(
-            f"{code} | {self.queue.name} Orange Team",
-            category=category,
-        )
-        await oran_vc.set_permissions(guild.default_role, connect=False)
+        blue_vc = await rest("create_channel", guild.create_voice_channel(f"{code} | {self.queue.name} Blue Team", category=category))
+        await rest("set_permissions", blue_vc.set_permissions(guild.default_role, connect=False))
+        oran_vc = await rest("create_channel", guild.create_voice_channel(f"{code} | {self.queue.name} Orange Team", category=category))
+        await rest("set_permissions", oran_vc.set_permissions(guild.default_role, connect=False))
 
         # manually add helper role perms if one is set
         if self.helper_role:
-            await self.textChannel.set_permissions(self.helper_role, view_channel=True, read_messages=True)
-            await general_vc.set_permissions(self.helper_role, connect=True, move_members=True)
-            await blue_vc.set_permissions(self.helper_role, connect=True, move_members=True)
-            await oran_vc.set_permissions(self.helper_role, connect=True, move_members=True)
+            await rest("set_permissions", self.textChannel.set_permissions(self.helper_role, view_channel=True, read_messages=True))
+            await rest("set_permissions", general_vc.set_permissions(self.helper_role, connect=True, move_members=True))
+            await rest("set_permissions", blue_vc.set_permissions(self.helper_role, connect=True, move_members=True))
+            await rest("set_permissions", oran_vc.set_permissions(self.helper_role, connect=True, move_members=True))
 
         self.voiceChannels = [blue_vc, oran_vc, general_vc]
 
         # Mentions all players
-        await self.textChannel.send(" ".join(player.mention for player in self.players))
+        await rest("send_message", self.textChannel.send(" ".join(player.mention for player in self.players)))
 
     # Team Selection
     async def vote_team_selection(self):
         """Start a vote for game mode."""
         vote_view = GameModeVote(self)
         await vote_view.start()
-        await vote_view.wait()
+        await self._finish_vote(vote_view)
+
+    async def _finish_vote(self, vote_view: GameModeVote):
+        timed_out = await vote_view.wait()
+        if timed_out and not vote_view.result:
+            # Replaced by a newer vote
+            return
+        self.selection_message = None
+        self.vote_deadline = None
+        self.mode_votes = {}
 
         if not self.textChannel:
             return
@@ -198,18 +258,21 @@ class Game:
         log.debug(f"Game Players: {type(self.players)}\n{pformat([f'{p.id}: {p.name}' for p in self.players])}")
         captains_view = CaptainsView(self)
         await captains_view.start()
-        await captains_view.wait()
+        await self._finish_captains(captains_view)
+
+    async def _finish_captains(self, captains_view: CaptainsView):
+        if not captains_view.finished and await captains_view.wait():
+            # Replaced by a newer team selection
+            return
+        self.selection_message = None
 
         if not self.textChannel:
             return
 
-        if not captains_view:
+        if not captains_view.finished:
             await self.textChannel.send("Error: Unable to finish captains team selection. Please reach out for support.")
             return
 
-        self.captains = captains_view.captains
-        self.blue = set(captains_view.blue)
-        self.orange = set(captains_view.orange)
         self.state = GameState.ONGOING
         await self.send_game_info()
 
@@ -233,14 +296,18 @@ class Game:
     async def self_picking_teams(self):
         picking_view = SelfPickingView(game=self, helper=self.helper_role)
         await picking_view.prompt()
-        await picking_view.wait()
+        await self._finish_self_picking(picking_view)
+
+    async def _finish_self_picking(self, picking_view: SelfPickingView):
+        if not picking_view.finished and await picking_view.wait():
+            # Replaced by a newer team selection
+            return
+        self.selection_message = None
 
         if not picking_view.finished:
             await self.textChannel.send(content="Error during team selection. Please reach out for support.")
             return
 
-        self.orange = set(picking_view.orange)
-        self.blue = set(picking_view.blue)
         self.state = GameState.ONGOING
         await self.send_game_info()
 
@@ -272,6 +339,7 @@ class Game:
         await self.info_message.add_reaction(Strings.SHUFFLE_REACT)
 
     # Team Selection helpers
+    @traced("process_team_selection_method")
     async def process_team_selection_method(self, team_selection: GameMode | None = None, force: bool = False):
         log.debug(f"Processing team selection. Current State: {self.state}")
 
@@ -305,6 +373,39 @@ class Game:
                 log.error(f"Error processing team selection mode: {self.teamSelection}")
                 return
 
+        await self.save()
+
+    def selection_view(self) -> GameModeVote | CaptainsView | SelfPickingView | None:
+        """Rebuild the view for a team selection message posted before a restart."""
+        if not self.selection_message or not self.textChannel:
+            return None
+
+        match self.teamSelection:
+            case GameMode.VOTE:
+                return GameModeVote(self)
+            case GameMode.CAPTAINS:
+                return CaptainsView(self)
+            case GameMode.SELF_PICK:
+                return SelfPickingView(game=self, helper=self.helper_role)
+            case _:
+                return None
+
+    async def resume_team_selection(self, view: GameModeVote | CaptainsView | SelfPickingView):
+        """Continue team selection on a message posted before a restart."""
+        log.debug(f"Resuming team selection. Game: {self.id} Mode: {self.teamSelection}")
+        match view:
+            case GameModeVote():
+                if view.vote_finished:
+                    view.stop()
+                await self._finish_vote(view)
+            case CaptainsView():
+                await self._finish_captains(view)
+            case SelfPickingView():
+                await self._finish_self_picking(view)
+
+        await self.save()
+
+    async def save(self):
         if self.save_callback:
             await self.save_callback()
 
@@ -392,6 +493,7 @@ class Game:
         self.state = GameState.COMPLETE
 
     # Embeds & Emojis
+    @traced("send_game_info")
     async def send_game_info(self):
         log.debug(f"Game Mode: {self.teamSelection}")
         ts_emoji = utils.get_emoji(SELECTION_MODES.get(self.teamSelection.value))
@@ -664,6 +766,9 @@ class Game:
             "State": self.state,
             "Prefix": self.prefix,
             "Winner": self.winner,
+            "ModeVotes": {str(k): v for k, v in self.mode_votes.items()},
+            "PickOrder": self.pick_order,
+            "ScoreReport": {str(k): v for k, v in self.score_report.items()},
         }
         if self.info_message:
             game_dict["InfoMessage"] = self.info_message.id
@@ -671,5 +776,15 @@ class Game:
             game_dict["TextChannel"] = self.textChannel.id
         if self.helper_role:
             game_dict["HelperRole"] = self.helper_role.id
+        if self.selection_message:
+            game_dict["SelectionMessage"] = self.selection_message
+        if self.vote_deadline:
+            game_dict["VoteDeadline"] = self.vote_deadline
+        if self.pick_deadline:
+            game_dict["PickDeadline"] = self.pick_deadline
+        if self.score_message:
+            game_dict["ScoreMessage"] = self.score_message
+        if self.score_deadline:
+            game_dict["ScoreDeadline"] = self.score_deadline
 
         return game_dict
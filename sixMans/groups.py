@@ -0,0 +1,57 @@
+import datetime
+from collections.abc import Iterable
+
+import discord
+
+from sixMans.queue import SixMansQueue
+
+
+def queue_group(queues: Iterable[SixMansQueue], six_mans_queue: SixMansQueue) -> list[SixMansQueue]:
+    """Queues that pop together with `six_mans_queue`. A queue without a group is on its own."""
+    if not six_mans_queue.group:
+        return [six_mans_queue]
+    return [q for q in queues if q.group == six_mans_queue.group]
+
+
+def next_pop(queues: Iterable[SixMansQueue], now: datetime.datetime | None = None) -> SixMansQueue | None:
+    """
+    Pick the queue to pop next out of a group.
+
+    Only queues that are ready to pop are considered. The highest `priority` wins, then the queue whose game
+    formed first, i.e. the one whose last needed player joined earliest.
+    """
+    ready = [q for q in queues if q.ready_to_pop(now)]
+    if not ready:
+        return None
+    return min(ready, key=lambda q: (-q.priority, _formed_at(q), q.id))
+
+
+def member_index(queues: Iterable[SixMansQueue]) -> dict[int, list[SixMansQueue]]:
+    """Player ID -> every queue the player is waiting in."""
+    index: dict[int, list[SixMansQueue]] = {}
+    for q in queues:
+        for player_id in q.activeJoinLog:
+            index.setdefault(player_id, []).append(q)
+    return index
+
+
+def take_from_queues(index: dict[int, list[SixMansQueue]], players: Iterable[discord.Member]) -> dict[SixMansQueue, list[discord.Member]]:
+    """
+    Remove popped players from every other queue they are waiting in.
+
+    Returns the players removed from each queue so callers can persist each queue once.
+    """
+    removed: dict[SixMansQueue, list[discord.Member]] = {}
+    for player in players:
+        for q in index.pop(player.id, []):
+            if player in q.queue:
+                q._remove(player)
+                removed.setdefault(q, []).append(player)
+    return removed
+
+
+def _formed_at(six_mans_queue: SixMansQueue) -> datetime.datetime:
+    joined = sorted(six_mans_queue.activeJoinLog.values())
+    if not joined:
+        return datetime.datetime.max.replace(tzinfo=datetime.timezone.utc)
+    return joined[min(six_mans_queue.maxSize, len(joined)) - 1]
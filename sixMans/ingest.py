@@ -0,0 +1,76 @@
+import asyncio
+import contextlib
+import logging
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+from sixMans.types import PendingResult
+
+log = logging.getLogger("red.sixMans.ingest")
+
+RESULT_BATCH_WINDOW = 0.25  # Seconds to wait for more results before persisting a batch
+RESULT_BATCH_SIZE = 25  # Maximum number of results persisted together
+
+
+class ResultIngestor:
+    """
+    Serializes game results for a single guild.
+
+    Results are applied in submission order by one consumer task. Results that arrive
+    within `window` seconds of each other are handed to `apply_batch` together so they
+    can be persisted with one write.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        apply_batch: Callable[[list[PendingResult]], Coroutine[Any, Any, None]],
+        window: float = RESULT_BATCH_WINDOW,
+        batch_size: int = RESULT_BATCH_SIZE,
+    ):
+        self.name = name
+        self.apply_batch = apply_batch
+        self.window = window
+        self.batch_size = batch_size
+        self._queue: asyncio.Queue[tuple[PendingResult, asyncio.Future]] = asyncio.Queue()
+        self._task: asyncio.Task | None = None
+
+    async def submit(self, result: PendingResult):
+        """Queue a result and wait until it has been applied and persisted."""
+        if not self._task or self._task.done():
+            self._task = asyncio.create_task(self._consume())
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((result, future))
+        await future
+
+    async def close(self):
+        """Apply anything still queued, then stop the consumer."""
+        if not self._task:
+            return
+        await self._queue.join()
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+
+    async def _consume(self):
+        while True:
+            batch = [await self._queue.get()]
+            # Give results reported at nearly the same time a chance to join the batch
+            await asyncio.sleep(self.window)
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            try:
+                await self.apply_batch([result for result, _ in batch])
+            except Exception as exc:
+                log.exception(f"[{self.name}] Error applying {len(batch)} game result(s)", exc_info=exc)
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+            else:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_result(None)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
@@ -0,0 +1,148 @@
+import asyncio
+import datetime
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+from sixMans.periods import add_game_to_buckets, period_keys
+from sixMans.types import GameResultEntry, PlayerScore, PlayerStats
+
+log = logging.getLogger("red.sixMans.journal")
+
+JOURNAL_SNAPSHOT_INTERVAL = 60  # How often pending journal entries are folded into Config (seconds)
+JOURNAL_MAX_PENDING = 50  # Snapshot early once this many game results are pending
+
+
+def give_points(players: dict[str, PlayerStats], score: PlayerScore):
+    stats = players.setdefault(str(score["Player"]), PlayerStats(Points=0, GamesPlayed=0, Wins=0))
+    stats["Points"] += score["Points"]
+    stats["GamesPlayed"] += 1
+    stats["Wins"] += score["Win"]
+
+
+def apply_game_result(state: dict[str, Any], entry: GameResultEntry):
+    """
+    Apply a journaled game result to guild data laid out like Config.
+
+    Only the keys present in `state` are updated, so callers can overlay a single
+    value. Queue totals carry the sequence number they include, which makes
+    replaying an entry over already-saved queue data a no-op.
+    """
+    if "Scores" in state:
+        for score in entry["Scores"]:
+            state["Scores"].insert(0, score)
+
+    if "Players" in state:
+        for score in entry["Scores"]:
+            give_points(state["Players"], score)
+
+    if "GamesPlayed" in state:
+        state["GamesPlayed"] += 1
+
+    if "PeriodBuckets" in state:
+        keys = period_keys(datetime.datetime.fromisoformat(entry["FinishedAt"]), entry["Season"])
+        add_game_to_buckets(state["PeriodBuckets"], keys, entry["Queue"], entry["Scores"])
+
+    if "Queues" in state:
+        queue = state["Queues"].get(str(entry["Queue"]))
+        if queue and queue.get("JournalSeq", 0) < entry["Seq"]:
+            for score in entry["Scores"]:
+                give_points(queue["Players"], score)
+            queue["GamesPlayed"] += 1
+            queue["JournalSeq"] = entry["Seq"]
+
+    if "Games" in state:
+        state["Games"].pop(str(entry["Game"]), None)
+
+
+class Journal:
+    """
+    Append-only log of game results for a single guild.
+
+    Each result is one fsync'd JSON line. Entries newer than the last Config snapshot
+    are kept in `pending` until they are folded into Config and the log is truncated.
+    """
+
+    def __init__(self, path: Path, applied_seq: int, entries: list[GameResultEntry]):
+        self.path = path
+        self.applied_seq = applied_seq
+        self.pending = [e for e in entries if e["Seq"] > applied_seq]
+        self.seq = max([applied_seq] + [e["Seq"] for e in entries])
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    async def open(cls, path: Path, applied_seq: int) -> "Journal":
+        entries = await asyncio.to_thread(cls._read, path)
+        return cls(path, applied_seq, entries)
+
+    @staticmethod
+    def _read(path: Path) -> list[GameResultEntry]:
+        if not path.exists():
+            return []
+
+        data = path.read_bytes()
+        entries: list[GameResultEntry] = []
+        valid_bytes = 0
+        for line in data.splitlines(keepends=True):
+            if not line.endswith(b"\n"):
+                break
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                break
+            valid_bytes += len(line)
+
+        if valid_bytes != len(data):
+            # Torn write from a crash. The incomplete tail was never acknowledged, so drop it.
+            log.warning(f"Discarding {len(data) - valid_bytes} bytes of incomplete journal data in {path.name}")
+            with path.open("r+b") as f:
+                f.truncate(valid_bytes)
+                os.fsync(f.fileno())
+        return entries
+
+    async def append(self, entry: dict[str, Any]) -> GameResultEntry:
+        """Durably record a game result. Returns the entry with its sequence number."""
+        return (await self.append_many([entry]))[0]
+
+    async def append_many(self, entries: list[dict[str, Any]]) -> list[GameResultEntry]:
+        """Durably record several game results with a single fsync."""
+        async with self._lock:
+            records = [GameResultEntry(Seq=self.seq + i, **entry) for i, entry in enumerate(entries, start=1)]  # type: ignore[typeddict-item]
+            data = "".join(json.dumps(record, separators=(",", ":")) + "\n" for record in records)
+            await asyncio.to_thread(self._write, data)
+            self.seq += len(records)
+            self.pending.extend(records)
+            return records
+
+    def _write(self, line: str):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def overlay(self, state: dict[str, Any]) -> dict[str, Any]:
+        """Apply pending entries to a copy of Config data."""
+        for entry in self.pending:
+            apply_game_result(state, entry)
+        return state
+
+    async def truncate(self, applied_seq: int):
+        """Drop entries that are now part of the Config snapshot."""
+        async with self._lock:
+            remaining = [e for e in self.pending if e["Seq"] > applied_seq]
+            data = "".join(json.dumps(e, separators=(",", ":")) + "\n" for e in remaining)
+            await asyncio.to_thread(self._replace, data)
+            self.applied_seq = applied_seq
+            self.pending = remaining
+
+    def _replace(self, data: str):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        tmp.replace(self.path)
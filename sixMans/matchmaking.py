@@ -0,0 +1,75 @@
+from collections.abc import Sequence
+from typing import TypeVar
+
+from sixMans.types import PlayerStats
+
+T = TypeVar("T")
+
+MATCH_MARGIN = 2  # Extra players a matchmaking queue waits for before popping
+MATCH_WAIT = 120  # Longest the first player in a matchmaking queue waits before it pops without the margin (seconds)
+RATING_SCALE = 100  # Ratings are compared in hundredths, the precision win percentages are rounded to
+
+
+def player_rating(stats: PlayerStats | None) -> float:
+    """Queue win percentage, the same measure `Game.get_player_scores` balances teams on. New players rate 0.5."""
+    if not stats or not stats["GamesPlayed"]:
+        return 0.5
+    return round(stats["Wins"] / stats["GamesPlayed"], 2)
+
+
+def find_match(players: Sequence[T], ratings: Sequence[float], team_size: int, required: int = 1) -> tuple[list[T], list[T], float] | None:
+    """
+    Pick the two teams of `team_size` from `players` with the smallest rating imbalance.
+
+    `players` are in queue order and the first `required` of them are always picked, which bounds how long
+    anyone waits. Among equally balanced matches, players who joined earlier are preferred.
+
+    Works backwards through the queue keeping, for every count of blue and orange players still to pick,
+    the set of reachable rating differences as a bitmask. That is `len(players) * (team_size + 1) ** 2`
+    integer shifts no matter how the ratings are spread. The teams are then read off front to back.
+
+    Returns `(blue, orange, imbalance)`, or None if there aren't enough players.
+    """
+    n = len(players)
+    if team_size <= 0 or n < team_size * 2:
+        return None
+    required = min(max(required, 1), team_size * 2)
+    values = [max(round(r * RATING_SCALE), 0) for r in ratings]
+    # Bit `offset + diff` is set when a blue minus orange rating difference of `diff` is reachable
+    offset = team_size * max(values)
+
+    # reach[i][b][o]: differences reachable picking b blue and o orange players from position i onwards
+    reach: list[list[list[int]]] = [[]] * n + [[[0] * (team_size + 1) for _ in range(team_size + 1)]]
+    reach[n][0][0] = 1 << offset
+    for i in range(n - 1, -1, -1):
+        after, v = reach[i + 1], values[i]
+        here = [[0 if i < required else after[b][o] for o in range(team_size + 1)] for b in range(team_size + 1)]
+        for b in range(team_size + 1):
+            for o in range(team_size + 1):
+                if b:
+                    here[b][o] |= after[b - 1][o] << v
+                if o:
+                    here[b][o] |= after[b][o - 1] >> v
+        reach[i] = here
+
+    reachable = reach[0][team_size][team_size]
+    if not reachable:
+        return None
+    # Closest reachable difference to zero
+    target = next(bit for delta in range(offset + 1) for bit in (offset + delta, offset - delta) if reachable >> bit & 1)
+
+    blue: list[T] = []
+    orange: list[T] = []
+    need_blue = need_orange = team_size
+    remaining = target
+    for i in range(n):
+        after, v = reach[i + 1], values[i]
+        if need_blue and remaining >= v and after[need_blue - 1][need_orange] >> (remaining - v) & 1:
+            blue.append(players[i])
+            need_blue -= 1
+            remaining -= v
+        elif need_orange and after[need_blue][need_orange - 1] >> (remaining + v) & 1:
+            orange.append(players[i])
+            need_orange -= 1
+            remaining += v
+    return blue, orange, abs(target - offset) / RATING_SCALE
@@ -0,0 +1,310 @@
+import asyncio
+import contextlib
+import json
+import logging
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Awaitable, Callable, Iterable
+from pathlib import Path
+from typing import Any, TypeVar
+
+from aiohttp import web
+
+log = logging.getLogger("red.sixMans.metrics")
+
+METRICS_HOST = "127.0.0.1"  # Metrics are only served locally
+METRICS_WRITE_INTERVAL = 15  # How often metrics are written when exporting to a file (seconds)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)  # Histogram bucket upper bounds (seconds)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+# Config keys that grow with score history. Their size is not measured, since that means serialising them on every access.
+UNSIZED_CONFIG_KEYS = frozenset({"JournalSnapshot", "PeriodBuckets", "Players", "ScoreRollups", "Scores"})
+
+T = TypeVar("T")
+M = TypeVar("M", bound="Metric")
+Labels = tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values, strict=True))
+    return f"{{{pairs}}}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metric(ABC):
+    """A named metric with one series per combination of label values."""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Labels = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+
+    def render(self) -> list[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}", *self._samples()]
+
+    @abstractmethod
+    def clear(self):
+        """Drop every recorded series."""
+
+    @abstractmethod
+    def _samples(self) -> list[str]:
+        """Sample lines for every series, without the HELP and TYPE header."""
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Labels = ()):
+        super().__init__(name, documentation, labelnames)
+        self.values: dict[Labels, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1):
+        self.values[labels] = self.values.get(labels, 0) + amount
+
+    def clear(self):
+        self.values.clear()
+
+    def _samples(self) -> list[str]:
+        return [f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}" for labels, value in self.values.items()]
+
+
+class Gauge(Metric):
+    """
+    A value that can go up and down.
+
+    Gauges that mirror existing state set `collect` instead, a function returning the current values by
+    labels. It is only called when the metrics are rendered, so the tracked state is never touched otherwise.
+    """
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Labels = ()):
+        super().__init__(name, documentation, labelnames)
+        self.values: dict[Labels, float] = {}
+        self.collect: Callable[[], dict[Labels, float]] | None = None
+
+    def set(self, value: float, *labels: str):
+        self.values[labels] = value
+
+    def clear(self):
+        self.values.clear()
+
+    def _samples(self) -> list[str]:
+        values = self.values
+        if self.collect:
+            try:
+                values = self.collect()
+            except Exception as exc:
+                log.warning(f"Unable to collect {self.name}: {exc!r}")
+                values = {}
+        return [f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}" for labels, value in values.items()]
+
+
+class Histogram(Metric):
+    """Observations counted into fixed buckets. Counts are kept per bucket and summed when rendered."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Labels = (), buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = buckets
+        self.counts: dict[Labels, list[int]] = {}  # The last slot is the +Inf bucket
+        self.sums: dict[Labels, float] = {}
+
+    def observe(self, value: float, *labels: str):
+        counts = self.counts.get(labels)
+        if counts is None:
+            counts = self.counts[labels] = [0] * (len(self.buckets) + 1)
+            self.sums[labels] = 0.0
+        counts[bisect_left(self.buckets, value)] += 1
+        self.sums[labels] += value
+
+    def clear(self):
+        self.counts.clear()
+        self.sums.clear()
+
+    def _samples(self) -> list[str]:
+        lines = []
+        names = (*self.labelnames, "le")
+        for labels, counts in self.counts.items():
+            total = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts, strict=True):
+                total += count
+                lines.append(f"{self.name}_bucket{_format_labels(names, (*labels, _format_value(bound)))} {total}")
+            suffix = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{suffix} {_format_value(self.sums[labels])}")
+            lines.append(f"{self.name}_count{suffix} {total}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Metrics exported by the cog.
+
+    Recording is a dict update, so metrics are always collected. Anything that costs more than that, like
+    measuring the size of Config values, is skipped unless `enabled` is set by a running exporter.
+    """
+
+    def __init__(self):
+        self.metrics: dict[str, Metric] = {}
+        self.enabled = False
+
+    def counter(self, name: str, documentation: str, labelnames: Labels = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Labels = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Labels = (), buckets: tuple[float, ...] = LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        return "\n".join(line for metric in self.metrics.values() for line in metric.render()) + "\n"
+
+    def clear(self):
+        for metric in self.metrics.values():
+            metric.clear()
+
+    def _register(self, metric: M) -> M:
+        if metric.name in self.metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self.metrics[metric.name] = metric
+        return metric
+
+
+REGISTRY = MetricsRegistry()
+
+COMMAND_LATENCY = REGISTRY.histogram("sixmans_command_duration_seconds", "Time taken to run a command.", ("command",))
+REST_CALLS = REGISTRY.counter("sixmans_rest_calls_total", "Discord REST calls made.", ("operation",))
+REST_FAILURES = REGISTRY.counter("sixmans_rest_failures_total", "Discord REST calls that raised an error.", ("operation",))
+QUEUE_PLAYERS = REGISTRY.gauge("sixmans_queue_players", "Players waiting in a queue.", ("guild", "queue"))
+ACTIVE_GAMES = REGISTRY.gauge("sixmans_active_games", "Games in progress.", ("guild",))
+OPEN_VIEWS = REGISTRY.gauge("sixmans_open_views", "Open button prompts by kind.", ("kind",))
+POP_LATENCY = REGISTRY.histogram("sixmans_pop_to_channels_seconds", "Time from a queue pop, after any ready check, until the game channels are ready.")
+CONFIG_OPERATIONS = REGISTRY.counter("sixmans_config_operations_total", "Config reads and writes.", ("key", "operation"))
+CONFIG_BYTES = REGISTRY.counter("sixmans_config_bytes_total", "JSON size of the values read from and written to Config, for keys that don't grow with score history.", ("key", "operation"))
+
+
+async def rest(operation: str, call: Awaitable[T]) -> T:
+    """Await a Discord REST call, counting it and any failure under `operation`."""
+    REST_CALLS.inc(operation)
+    try:
+        return await call
+    except Exception:
+        REST_FAILURES.inc(operation)
+        raise
+
+
+def _json_size(value: Any) -> int:
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return 0
+
+
+def config_read(key: str, value: T) -> T:
+    """Count a Config read of `key`. Returns `value` so reads can be wrapped in place."""
+    CONFIG_OPERATIONS.inc(key, "read")
+    if REGISTRY.enabled and key not in UNSIZED_CONFIG_KEYS:
+        CONFIG_BYTES.inc(key, "read", amount=_json_size(value))
+    return value
+
+
+def config_write(key: str, value: T) -> T:
+    """Count a Config write of `key`. Returns `value` so writes can be wrapped in place."""
+    CONFIG_OPERATIONS.inc(key, "write")
+    if REGISTRY.enabled and key not in UNSIZED_CONFIG_KEYS:
+        CONFIG_BYTES.inc(key, "write", amount=_json_size(value))
+    return value
+
+
+def config_clear(key: str, *path: str) -> tuple[str, ...]:
+    """Count a Config clear of `key`. Returns the raw `path` so clears can be wrapped in place."""
+    CONFIG_OPERATIONS.inc(key, "write")
+    return path
+
+
+class MetricsExporter:
+    """Serves the registry over HTTP on a local port, writes it to a file periodically, or both."""
+
+    def __init__(self, registry: MetricsRegistry = REGISTRY):
+        self.registry = registry
+        self.port = 0
+        self.path: Path | None = None
+        self._runner: web.AppRunner | None = None
+        self._writer_task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._runner is not None or self._writer_task is not None
+
+    async def start(self, port: int = 0, path: str | None = None):
+        """Start exporting. A port of 0 and no path leaves the exporter stopped."""
+        await self.stop()
+        self.port = port
+        self.path = Path(path) if path else None
+
+        if port:
+            app = web.Application()
+            app.router.add_get("/metrics", self._handle)
+            self._runner = web.AppRunner(app, access_log=None)
+            await self._runner.setup()
+            try:
+                await web.TCPSite(self._runner, METRICS_HOST, port).start()
+            except OSError as exc:
+                log.error(f"Unable to serve metrics on port {port}: {exc}")
+                await self._runner.cleanup()
+                self._runner = None
+            else:
+                log.info(f"Serving metrics on http://{METRICS_HOST}:{port}/metrics")
+        if self.path:
+            self._writer_task = asyncio.create_task(self._write_periodically())
+        self.registry.enabled = self.running
+
+    async def stop(self):
+        if self._writer_task:
+            self._writer_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._writer_task
+            self._writer_task = None
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+        self.registry.enabled = False
+
+    async def write(self):
+        """Write the metrics to the export path, replacing the file in one step so scrapers never see a partial file."""
+        if not self.path:
+            return
+        text = self.registry.render()
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+
+        def replace():
+            tmp.write_text(text, encoding="utf-8")
+            tmp.replace(self.path)  # type: ignore[arg-type]
+
+        await asyncio.to_thread(replace)
+
+    async def _write_periodically(self):
+        while True:
+            try:
+                await self.write()
+            except OSError as exc:
+                log.warning(f"Unable to write metrics to {self.path}: {exc}")
+            await asyncio.sleep(METRICS_WRITE_INTERVAL)
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        return web.Response(body=self.registry.render().encode(), headers={"Content-Type": CONTENT_TYPE})
@@ -1,7 +1,8 @@
 import logging
+from typing import Any
 
 import discord
-from pydantic import BaseModel
+from pydantic import BaseModel, RootModel
 
 from sixMans.enums import GameMode, GameState, Winner
 
@@ -11,18 +12,37 @@ log = logging.getLogger("red.sixMans.models.game")
 class GameData(BaseModel):
     Blue: list[int]
     Captains: list[int]
+    ModeVotes: dict[int, GameMode] = {}
     Orange: list[int]
+    PickDeadline: float | None = None
+    PickOrder: list[int] = []
     Players: list[int]
     Prefix: str
     QueueId: int
     RoomName: str
     RoomPass: str
+    ScoreDeadline: float | None = None
+    ScoreMessage: int | None = None
+    ScoreReport: dict[int, Winner] = {}
+    SelectionMessage: int | None = None
     State: GameState
     TeamSelection: GameMode
     TextChannel: int
     VoiceChannels: list[int]
+    VoteDeadline: float | None = None
     Winner: Winner
 
+    @classmethod
+    def trusted(cls, value: dict[str, Any]) -> "GameData":
+        """Build from data previously written by the cog without validating it."""
+        data = dict(value)
+        data["State"] = GameState(value["State"])
+        data["TeamSelection"] = GameMode(value["TeamSelection"])
+        data["Winner"] = Winner(value["Winner"])
+        data["ModeVotes"] = {int(k): GameMode(v) for k, v in value.get("ModeVotes", {}).items()}
+        data["ScoreReport"] = {int(k): Winner(v) for k, v in value.get("ScoreReport", {}).items()}
+        return cls.model_construct(**data)
+
     def get_player_members(self, guild: discord.Guild) -> list[discord.Member]:
         members: list[discord.Member] = []
         for p in self.Players:
@@ -84,3 +104,6 @@ class GameData(BaseModel):
                 continue
             channels.append(vc)
         return channels
+
+
+GuildGameData = RootModel[dict[str, GameData]]
@@ -1,8 +1,12 @@
 import logging
+from typing import Any
 
 import discord
 from pydantic import BaseModel, RootModel
 
+from sixMans.matchmaking import MATCH_MARGIN, MATCH_WAIT
+from sixMans.types import PlayerStats
+
 log = logging.getLogger("red.sixMans.models.queue")
 
 
@@ -21,16 +25,46 @@ QueuePlayers = RootModel[dict[str, PlayerData]]
 
 
 class QueueData(BaseModel):
+    Analytics: dict[str, Any] = {}
+    BoardMessages: dict[int, int] = {}
     Category: int | None = None
     Channels: list[int]
     GamesPlayed: int
+    Group: str | None = None
+    JournalSeq: int = 0
     LobbyVC: int | None = None
+    MatchMargin: int = MATCH_MARGIN
+    Matchmaking: bool = False
+    MatchWait: int = MATCH_WAIT
     MaxSize: int | None = None
+    Members: dict[str, float] = {}  # Player ID -> join timestamp
     Name: str
     Players: QueuePlayers
     Points: Points
+    Priority: int = 0
     TeamSelection: str | None = None
 
+    @classmethod
+    def trusted(cls, value: dict[str, Any]) -> "QueueData":
+        """
+        Build from data previously written by the cog without validating it.
+
+        Player rows are kept as the plain dicts read from Config. Use the normal
+        constructor (or `verifySixMansData`) when the data may be malformed.
+        """
+        data = dict(value)
+        data["BoardMessages"] = {int(k): int(v) for k, v in value.get("BoardMessages", {}).items()}
+        data["Players"] = QueuePlayers.model_construct(root=value["Players"])
+        data["Points"] = Points.model_construct(**value["Points"])
+        return cls.model_construct(**data)
+
+    def player_dict(self) -> dict[str, PlayerStats]:
+        """Players as plain dicts. Trusted loads already hold plain dicts and are returned without copying."""
+        players = self.Players.root
+        if players and isinstance(next(iter(players.values())), PlayerData):
+            return self.Players.model_dump()
+        return players  # type: ignore[return-value]
+
     def guild_channels(self, guild: discord.Guild) -> list[discord.TextChannel]:
         channels: list[discord.TextChannel] = []
         for c in self.Channels:
@@ -0,0 +1,56 @@
+import logging
+
+import discord
+from pydantic import BaseModel
+
+from sixMans.enums import GameMode
+from sixMans.retention import DEFAULT_RETENTION_DAYS
+from sixMans.types import Season
+
+log = logging.getLogger("red.sixMans.models.settings")
+
+
+class GuildSettings(BaseModel):
+    """In-memory snapshot of guild level settings. Kept in sync by the cog setters."""
+
+    AutoMove: bool = False
+    CategoryChannel: int | None = None
+    CurrentSeason: Season | None = None
+    DefaultQueueMaxSize: int = 6
+    DefaultTeamSelection: str | None = GameMode.VOTE
+    HelperRole: int | None = None
+    PickTime: int = 0
+    PlayerTimeout: int
+    QLobby: int | None = None
+    QueuesEnabled: bool = True
+    ReactToVote: bool = True
+    ReadyCheck: bool = False
+    ScoreRetentionDays: int = DEFAULT_RETENTION_DAYS
+
+    def helper_role(self, guild: discord.Guild) -> discord.Role | None:
+        if not self.HelperRole:
+            return None
+        return guild.get_role(self.HelperRole)
+
+    def category(self, guild: discord.Guild) -> discord.CategoryChannel | None:
+        if not self.CategoryChannel:
+            return None
+        c = guild.get_channel(self.CategoryChannel)
+        if not isinstance(c, discord.CategoryChannel):
+            log.error(f"[{guild.name}] 6 mans category is not actually a category.")
+            return None
+        return c
+
+    def lobby_vc(self, guild: discord.Guild) -> discord.VoiceChannel | None:
+        if not self.QLobby:
+            return None
+        c = guild.get_channel(self.QLobby)
+        if not isinstance(c, discord.VoiceChannel):
+            return None
+        return c
+
+    def team_selection(self) -> GameMode:
+        # Backwards compatibility
+        if self.DefaultTeamSelection:
+            return GameMode(self.DefaultTeamSelection.lower().capitalize())
+        return GameMode.VOTE
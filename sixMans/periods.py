@@ -0,0 +1,129 @@
+import datetime
+import logging
+
+from sixMans.retention import score_datetime
+from sixMans.types import PeriodBucket, PeriodBucketMap, PlayerScore, PlayerStats, Season
+
+log = logging.getLogger("red.sixMans.periods")
+
+WEEK_PREFIX = "W"
+MONTH_PREFIX = "M"
+YEAR_PREFIX = "Y"
+SEASON_PREFIX = "S:"
+
+
+def week_key(dt: datetime.datetime) -> str:
+    """ISO week bucket key (Monday - Sunday)"""
+    year, week, _ = dt.isocalendar()
+    return f"{WEEK_PREFIX}{year}-{week:02d}"
+
+
+def month_key(dt: datetime.datetime) -> str:
+    return f"{MONTH_PREFIX}{dt.year}-{dt.month:02d}"
+
+
+def year_key(dt: datetime.datetime) -> str:
+    return f"{YEAR_PREFIX}{dt.year}"
+
+
+def season_key(name: str) -> str:
+    return f"{SEASON_PREFIX}{name}"
+
+
+def period_keys(dt: datetime.datetime, season: str | None = None) -> list[str]:
+    """All bucket keys a game finished at `dt` counts towards."""
+    keys = [week_key(dt), month_key(dt), year_key(dt)]
+    if season:
+        keys.append(season_key(season))
+    return keys
+
+
+def week_start(dt: datetime.datetime) -> datetime.datetime:
+    monday = dt - datetime.timedelta(days=dt.weekday())
+    return monday.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def period_start(key: str) -> datetime.datetime | None:
+    """Start of a calendar bucket. None for season buckets."""
+    if key.startswith(WEEK_PREFIX):
+        year, week = key[len(WEEK_PREFIX) :].split("-")
+        return datetime.datetime.fromisocalendar(int(year), int(week), 1)
+    if key.startswith(MONTH_PREFIX):
+        year, month = key[len(MONTH_PREFIX) :].split("-")
+        return datetime.datetime(int(year), int(month), 1)
+    if key.startswith(YEAR_PREFIX):
+        return datetime.datetime(int(key[len(YEAR_PREFIX) :]), 1, 1)
+    return None
+
+
+def season_names(buckets: PeriodBucketMap) -> list[str]:
+    return [k[len(SEASON_PREFIX) :] for k in buckets if k.startswith(SEASON_PREFIX)]
+
+
+def add_game_to_buckets(buckets: PeriodBucketMap, keys: list[str], queue_id: int, scores: list[PlayerScore]):
+    """Add the scores of a single finished game to every period bucket in `keys`."""
+    for key in keys:
+        bucket = buckets.setdefault(key, {}).setdefault(str(queue_id), PeriodBucket(GamesPlayed=0, Players={}))
+        bucket["GamesPlayed"] += 1
+        for score in scores:
+            stats = bucket["Players"].setdefault(str(score["Player"]), PlayerStats(Points=0, GamesPlayed=0, Wins=0))
+            stats["Points"] += score["Points"]
+            stats["GamesPlayed"] += 1
+            stats["Wins"] += score["Win"]
+
+
+def period_standings(buckets: PeriodBucketMap, key: str, queue_id: int | None = None) -> tuple[dict[str, PlayerStats], int]:
+    """
+    Standings for a single period.
+
+    Guild wide standings are the sum of that period's per-queue buckets.
+    """
+    players: dict[str, PlayerStats] = {}
+    games_played = 0
+    for qid, bucket in buckets.get(key, {}).items():
+        if queue_id is not None and qid != str(queue_id):
+            continue
+        games_played += bucket["GamesPlayed"]
+        for pid, stats in bucket["Players"].items():
+            total = players.setdefault(pid, PlayerStats(Points=0, GamesPlayed=0, Wins=0))
+            total["Points"] += stats["Points"]
+            total["GamesPlayed"] += stats["GamesPlayed"]
+            total["Wins"] += stats["Wins"]
+    return players, games_played
+
+
+def rebuild_buckets(scores: list[PlayerScore], season: Season | None = None) -> PeriodBucketMap:
+    """Rebuild period buckets from raw score history."""
+    season_start = datetime.datetime.fromisoformat(season["Start"]) if season else None
+    games: dict[tuple[int, int], list[PlayerScore]] = {}
+    for score in scores:
+        games.setdefault((score["Game"], score["Queue"]), []).append(score)
+
+    buckets: PeriodBucketMap = {}
+    for (_, queue_id), game_scores in games.items():
+        finished = score_datetime(game_scores[0])
+        season_name = season["Name"] if season and season_start and finished >= season_start else None
+        keys = period_keys(finished, season_name)
+        add_game_to_buckets(buckets, keys, queue_id, game_scores)
+    return buckets
+
+
+def merge_rebuilt_buckets(existing: PeriodBucketMap, rebuilt: PeriodBucketMap, cutoff: datetime.datetime, season: Season | None = None) -> PeriodBucketMap:
+    """
+    Replace the buckets that `rebuilt` fully covers and keep the rest of `existing`.
+
+    Scores older than `cutoff` have been compacted into rollups, so periods starting before it can't be rebuilt
+    from raw scores and are kept as they are. So are the buckets of seasons that have ended.
+    """
+    current = season_key(season["Name"]) if season else None
+    season_start = datetime.datetime.fromisoformat(season["Start"]) if season else None
+
+    def rebuildable(key: str) -> bool:
+        if key.startswith(SEASON_PREFIX):
+            return key == current and season_start is not None and season_start >= cutoff
+        start = period_start(key)
+        return start is not None and start >= cutoff
+
+    merged = {key: bucket for key, bucket in existing.items() if not rebuildable(key)}
+    merged.update({key: bucket for key, bucket in rebuilt.items() if rebuildable(key)})
+    return merged
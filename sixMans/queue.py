@@ -2,15 +2,21 @@ import contextlib
 import datetime
 import logging
 import uuid
+from collections.abc import Awaitable, Callable, Coroutine, Mapping
 from queue import Queue
-from typing import List
+from typing import Any, List
 
 import discord
 
-from sixMans.embeds import SuccessEmbed
+from sixMans.analytics import QueueAnalytics
+from sixMans.board import QueueBoard
 from sixMans.enums import GameMode
+from sixMans.matchmaking import MATCH_MARGIN, MATCH_WAIT, find_match, player_rating
+from sixMans.metrics import rest
+from sixMans.stats import PlayerStatsTable
 from sixMans.strings import Strings
-from sixMans.types import OrderedSet
+from sixMans.types import ChannelResult, OrderedSet, PlayerStats
+from sixMans.utils import fan_out
 
 log = logging.getLogger("red.sixMans.queue")
 
@@ -25,19 +31,53 @@ SELECTION_MODES = {
 
 
 class SixMansQueue:
+    __slots__ = (
+        "id",
+        "name",
+        "queue",
+        "guild",
+        "channels",
+        "points",
+        "players",
+        "gamesPlayed",
+        "maxSize",
+        "teamSelection",
+        "category",
+        "lobby_vc",
+        "activeJoinLog",
+        "heldJoinLog",
+        "journal_seq",
+        "board",
+        "matchmaking",
+        "match_margin",
+        "match_wait",
+        "group",
+        "priority",
+        "analytics",
+    )
+
     def __init__(
         self,
         name: str,
         guild: discord.Guild,
         channels: List[discord.TextChannel],
         points: dict[str, int],
-        players: dict[str, dict],
+        players: Mapping[str, PlayerStats],
         gamesPlayed: int,
         maxSize: int,
         id: int | None = None,
         category: discord.CategoryChannel | None = None,
         lobby_vc: discord.VoiceChannel | None = None,
         teamSelection=GameMode.VOTE,
+        board_messages: dict[int, int] | None = None,
+        journal_seq: int = 0,
+        matchmaking: bool = False,
+        match_margin: int = MATCH_MARGIN,
+        match_wait: int = MATCH_WAIT,
+        group: str | None = None,
+        priority: int = 0,
+        analytics: dict[str, Any] | None = None,
+        save_callback: Callable[[], Coroutine[Any, Any, None]] | None = None,
     ):
         self.id = id or uuid.uuid4().int
         self.name = name
@@ -45,26 +85,33 @@ class SixMansQueue:
         self.guild = guild
         self.channels = channels
         self.points = points
-        self.players = players
+        self.players = PlayerStatsTable(players)
         self.gamesPlayed = gamesPlayed
         self.maxSize = maxSize
         self.teamSelection: GameMode = teamSelection
         self.category = category
         self.lobby_vc = lobby_vc
         self.activeJoinLog: dict[int, datetime.datetime] = {}
-        # TODO: active join log could maintain queue during downtime
+        self.heldJoinLog: dict[int, datetime.datetime] = {}  # Join times of popped players whose game hasn't been created yet
+        self.journal_seq = journal_seq  # Last journaled game result included in the totals
+        self.board = QueueBoard(self, board_messages, save_callback=save_callback)
+        self.matchmaking = matchmaking  # Pop the most balanced match from a larger pool instead of the first `maxSize` players
+        self.match_margin = match_margin
+        self.match_wait = match_wait
+        self.group = group  # Queues in the same group are popped together (see `groups.next_pop`)
+        self.priority = priority  # Higher priority queues in a group pop first
+        self.analytics = QueueAnalytics(analytics)
 
-    def get_player_summary(self, player: discord.Member):
-        try:
-            return self.players[str(player.id)]
-        except KeyError:
-            return None
+    def get_player_summary(self, player: discord.Member) -> PlayerStats | None:
+        return self.players.get(player.id)
 
     async def send_message(self, message="", embed=None):
-        messages = []
-        for channel in self.channels:
-            messages.append(await channel.send(message, embed=embed))
-        return messages
+        results = await self.fan_out(lambda channel: rest("send_message", channel.send(message, embed=embed)))
+        return [r["Result"] for r in results if r["Error"] is None]
+
+    async def fan_out(self, func: Callable[[discord.TextChannel], Awaitable[Any]]) -> list[ChannelResult]:
+        """Run `func` against every queue channel concurrently. See `utils.fan_out`."""
+        return await fan_out(list(self.channels), func)
 
     async def set_team_selection(self, team_selection):
         self.teamSelection = GameMode(team_selection)
@@ -72,16 +119,53 @@ class SixMansQueue:
     def queue_full(self):
         return self.queue.qsize() >= self.maxSize
 
+    def ready_to_pop(self, now: datetime.datetime | None = None) -> bool:
+        """
+        Whether a game can be created from the queue.
+
+        Matchmaking queues wait for `match_margin` players more than `maxSize` so there is a choice of match,
+        unless the first player in the queue has already waited `match_wait` seconds.
+        """
+        if not self.queue_full():
+            return False
+        if not self.matchmaking or self.queue.qsize() >= self.maxSize + self.match_margin:
+            return True
+        return self.longest_wait(now) >= self.match_wait
+
+    def pop_eta(self, now: datetime.datetime | None = None) -> float | None:
+        """Estimated seconds until the queue pops, from its recent join rate. See `QueueAnalytics.pop_eta`."""
+        now = now or datetime.datetime.now(datetime.timezone.utc)
+        size = self.maxSize + self.match_margin if self.matchmaking else self.maxSize
+        eta = self.analytics.pop_eta(size - self.queue.qsize(), now)
+        if self.matchmaking and self.queue_full():
+            # Matchmaking queues stop waiting for the margin once the first player has waited long enough
+            deadline = max(self.match_wait - self.longest_wait(now), 0)
+            eta = deadline if eta is None else min(eta, deadline)
+        return eta
+
+    def longest_wait(self, now: datetime.datetime | None = None) -> float:
+        """Seconds the first player in the queue has been waiting."""
+        if not self.activeJoinLog:
+            return 0.0
+        now = now or datetime.datetime.now(datetime.timezone.utc)
+        return (now - min(self.activeJoinLog.values())).total_seconds()
+
     def clear(self):
         while not self.queue.empty():
             log.debug("Queue not empty.")
             self.queue._get()
+        self.activeJoinLog.clear()
         log.debug("Done clearing queue.")
 
+    def membership(self) -> dict[str, float]:
+        """Queued player IDs and their join timestamps, in queue order."""
+        return {str(p.id): self.activeJoinLog[p.id].timestamp() for p in self.queue.queue if p.id in self.activeJoinLog}
+
     # Internal
 
-    def _put(self, player):
+    def _put(self, player, joined: datetime.datetime | None = None):
         self.queue.put(player)
+        self.activeJoinLog[player.id] = joined or datetime.datetime.now(datetime.timezone.utc)
 
     def _get(self):
         player = self.queue.get()
@@ -89,6 +173,66 @@ class SixMansQueue:
             del self.activeJoinLog[player.id]
         return player
 
+    def _pop_players(self, now: datetime.datetime | None = None) -> list[discord.Member]:
+        """
+        Take the players for a new game out of the queue.
+
+        Regular queues take the first `maxSize` players. Matchmaking queues take the most balanced match
+        (see `matchmaking.find_match`). The first player and anyone who has waited `match_wait` seconds are
+        always included, oldest first, so nobody is passed over indefinitely.
+        """
+        now = now or datetime.datetime.now(datetime.timezone.utc)
+        return self._hold(self._take_match(now))
+
+    def _take_next(self, count: int) -> list[discord.Member]:
+        """Take the next `count` players out of the queue, e.g. to replace players who failed a ready check."""
+        return self._hold(list(self.queue.queue)[:count])
+
+    def record_game(self, players: list[discord.Member], now: datetime.datetime | None = None):
+        """A game was created with `players`. Records how long they waited since they joined the queue."""
+        now = now or datetime.datetime.now(datetime.timezone.utc)
+        waits = [(now - self.heldJoinLog[p.id]).total_seconds() for p in players if p.id in self.heldJoinLog]
+        self._release(players)
+        self.analytics.record_pop(waits, now)
+
+    def _take_match(self, now: datetime.datetime) -> list[discord.Member]:
+        pool = list(self.queue.queue)
+        if not self.matchmaking:
+            return pool[: self.maxSize]
+
+        overdue = sum(1 for p in pool if p.id in self.activeJoinLog and (now - self.activeJoinLog[p.id]).total_seconds() >= self.match_wait)
+        ratings = [player_rating(self.get_player_summary(p)) for p in pool]
+        match = find_match(pool, ratings, self.maxSize // 2, required=overdue)
+        if match is None:
+            return pool[: self.maxSize]
+
+        blue, orange, imbalance = match
+        log.debug(f"Matchmaking picked {self.maxSize} of {len(pool)} players. Imbalance: {imbalance}")
+        return blue + orange
+
+    def _requeue(self, players: list[discord.Member]):
+        """Put players back at the front of the queue, e.g. when a ready check could not fill the game."""
+        self._release(players)
+        waiting = [(p, self.activeJoinLog.get(p.id)) for p in self.queue.queue]
+        front = min([datetime.datetime.now(datetime.timezone.utc), *(joined for _, joined in waiting if joined)])
+        self.clear()
+        for player in players:
+            self._put(player, joined=front)
+        for player, joined in waiting:
+            self._put(player, joined=joined)
+
+    def _hold(self, players: list[discord.Member]) -> list[discord.Member]:
+        """Remove popped players from the queue, keeping their join times until their game is created."""
+        for player in players:
+            if player.id in self.activeJoinLog:
+                self.heldJoinLog[player.id] = self.activeJoinLog[player.id]
+            self._remove(player)
+        return players
+
+    def _release(self, players: list[discord.Member]):
+        for player in players:
+            self.heldJoinLog.pop(player.id, None)
+
     def _remove(self, player):
         self.queue._remove(player)
         with contextlib.suppress(KeyError):
@@ -99,15 +243,25 @@ class SixMansQueue:
             "Name": self.name,
             "Channels": [x.id for x in self.channels],
             "Points": self.points,
-            "Players": self.players,
+            "Players": self.players.to_dict(),
             "GamesPlayed": self.gamesPlayed,
             "TeamSelection": self.teamSelection,
             "MaxSize": self.maxSize,
+            "BoardMessages": self.board.message_ids,
+            "Members": self.membership(),
+            "JournalSeq": self.journal_seq,
+            "Matchmaking": self.matchmaking,
+            "MatchMargin": self.match_margin,
+            "MatchWait": self.match_wait,
+            "Priority": self.priority,
+            "Analytics": self.analytics.to_dict(),
         }
         if self.category:
             q_data["Category"] = self.category.id
         if self.lobby_vc:
             q_data["LobbyVC"] = self.lobby_vc.id
+        if self.group:
+            q_data["Group"] = self.group
 
         return q_data
 
@@ -0,0 +1,102 @@
+import datetime
+import logging
+from collections.abc import Iterator
+
+from sixMans.types import DailyRollups, PlayerScore, PlayerStats
+
+log = logging.getLogger("red.sixMans.retention")
+
+SCORE_DATETIME_FORMAT = "%d-%b-%Y (%H:%M:%S.%f)"
+ROLLUP_DATE_FORMAT = "%Y-%m-%d"
+DEFAULT_RETENTION_DAYS = 400  # Covers the yearly leaderboard with some headroom
+COMPACTION_BATCH_SIZE = 500  # Score rows processed before yielding to the event loop
+
+
+def score_datetime(score: PlayerScore) -> datetime.datetime:
+    return datetime.datetime.strptime(score["DateTime"], SCORE_DATETIME_FORMAT)
+
+
+def retention_cutoff(retention_days: int, now: datetime.datetime | None = None) -> datetime.datetime:
+    """Start of the oldest day that is still kept as raw score rows."""
+    now = now or datetime.datetime.now()
+    cutoff = now - datetime.timedelta(days=retention_days)
+    return cutoff.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def expired_score_count(scores: list[PlayerScore], cutoff: datetime.datetime) -> int:
+    """
+    Number of rows at the tail of `scores` that are older than `cutoff`.
+
+    Scores are stored newest first, so expired rows are always a suffix of the list.
+    """
+    count = 0
+    for score in reversed(scores):
+        if score_datetime(score) >= cutoff:
+            break
+        count += 1
+    return count
+
+
+def add_score_to_rollups(rollups: DailyRollups, score: PlayerScore):
+    day = score_datetime(score).strftime(ROLLUP_DATE_FORMAT)
+    queue_rollup = rollups.setdefault(day, {}).setdefault(str(score["Queue"]), {})
+    stats = queue_rollup.setdefault(str(score["Player"]), PlayerStats(Points=0, GamesPlayed=0, Wins=0))
+    stats["Points"] += score["Points"]
+    stats["GamesPlayed"] += 1
+    stats["Wins"] += score["Win"]
+
+
+def compact_scores(
+    scores: list[PlayerScore],
+    rollups: DailyRollups,
+    cutoff: datetime.datetime,
+    batch_size: int = COMPACTION_BATCH_SIZE,
+) -> Iterator[int]:
+    """
+    Fold expired score rows into per-player per-day rollups.
+
+    This is a generator so callers can yield to the event loop between batches.
+    Each step yields the number of rows folded so far. `scores` itself is not modified,
+    callers drop the returned number of tail rows once the rollups have been saved.
+    """
+    expired = expired_score_count(scores, cutoff)
+    if not expired:
+        return
+
+    folded = 0
+    # Walk oldest first so the tail of the list is consumed in order
+    for score in reversed(scores[-expired:]):
+        add_score_to_rollups(rollups, score)
+        folded += 1
+        if folded % batch_size == 0:
+            yield folded
+    yield folded
+
+
+def rollup_stats_since(
+    rollups: DailyRollups,
+    start_date: datetime.datetime,
+    queue_id: int | None = None,
+    players: dict[str, PlayerStats] | None = None,
+) -> tuple[dict[str, PlayerStats], int]:
+    """
+    Sum rollup days on or after `start_date` into `players`.
+
+    Returns the players dict and the number of player score rows that were summed.
+    """
+    players = players if players is not None else {}
+    start_day = start_date.strftime(ROLLUP_DATE_FORMAT)
+    rows = 0
+    for day, queues in rollups.items():
+        if day < start_day:
+            continue
+        for qid, day_players in queues.items():
+            if queue_id is not None and qid != str(queue_id):
+                continue
+            for pid, stats in day_players.items():
+                total = players.setdefault(pid, PlayerStats(Points=0, GamesPlayed=0, Wins=0))
+                total["Points"] += stats["Points"]
+                total["GamesPlayed"] += stats["GamesPlayed"]
+                total["Wins"] += stats["Wins"]
+                rows += stats["GamesPlayed"]
+    return players, rows
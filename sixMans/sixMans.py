@@ -1,15 +1,25 @@
 import asyncio
 import contextlib
 import datetime
+import functools
 import logging
 import random
+import time
+from collections.abc import Callable, Coroutine
+from pathlib import Path
+from typing import Any
 
 import discord
 from discord.ext.commands import Context
+from pydantic import ValidationError
 from redbot.core import Config, checks, commands
+from redbot.core.data_manager import cog_data_path
 from redbot.core.utils.menus import start_adding_reactions
 from redbot.core.utils.predicates import ReactionPredicate
 
+from sixMans.analytics import ANALYTICS_WINDOW_DAYS, WAIT_BUCKETS, format_eta, format_hour_of_week
+from sixMans.bans import BAN_SWEEP_INTERVAL, QueueBanTable, utc_timestamp
+from sixMans.draft import draft_time_limit
 from sixMans.embeds import (
     BlueEmbed,
     ErrorEmbed,
@@ -17,14 +27,52 @@ from sixMans.embeds import (
     QueueNotFoundEmbed,
     SuccessEmbed,
 )
-from sixMans.enums import GameMode, GameState, Winner
+from sixMans.enums import GameMode, GameState, StartupState, Winner
 from sixMans.game import Game
-from sixMans.models.game import GameData
-from sixMans.models.queue import QueueData
+from sixMans.groups import member_index, next_pop, queue_group, take_from_queues
+from sixMans.ingest import ResultIngestor
+from sixMans.journal import JOURNAL_MAX_PENDING, JOURNAL_SNAPSHOT_INTERVAL, Journal, give_points
+from sixMans.metrics import (
+    ACTIVE_GAMES,
+    COMMAND_LATENCY,
+    METRICS_HOST,
+    METRICS_WRITE_INTERVAL,
+    OPEN_VIEWS,
+    POP_LATENCY,
+    QUEUE_PLAYERS,
+    MetricsExporter,
+    config_clear,
+    config_read,
+    config_write,
+)
+from sixMans.models.game import GameData, GuildGameData
+from sixMans.models.queue import GuildQueueData, QueueData
+from sixMans.models.settings import GuildSettings
+from sixMans.periods import (
+    merge_rebuilt_buckets,
+    month_key,
+    period_standings,
+    rebuild_buckets,
+    season_key,
+    season_names,
+    week_key,
+    week_start,
+    year_key,
+)
 from sixMans.queue import SixMansQueue
+from sixMans.retention import (
+    DEFAULT_RETENTION_DAYS,
+    SCORE_DATETIME_FORMAT,
+    compact_scores,
+    retention_cutoff,
+    rollup_stats_since,
+)
 from sixMans.strings import Strings
-from sixMans.types import PlayerScore, PlayerStats, SixMansConfig, QueueBan
+from sixMans.tracing import TRACER, tag, traced
+from sixMans.types import DailyRollups, JournalSnapshot, PendingResult, PeriodBucketMap, PlayerScore, PlayerStats, QueueBan, Season, SixMansConfig, SixMansGlobalConfig
+from sixMans.views import parse_game_custom_id
 from sixMans.views.cancel import CancelView, ForceCancelView
+from sixMans.views.ready import READY_CHECK_TIMEOUT, ReadyCheckView
 from sixMans.views.score import ForceResultView, ScoreReportView
 
 log = logging.getLogger("red.sixMans")
@@ -35,66 +83,178 @@ PLAYER_TIMEOUT_TIME = 10 if DEBUG else 1800  # How long players can be in a queu
 LOOP_TIME = 5  # How often to check the queues in seconds
 VERIFY_TIMEOUT = 30  # How long someone has to react to a prompt (seconds)
 CHANNEL_SLEEP_TIME = 5 if DEBUG else 30  # How long channels will persist after a game's score has been reported (seconds)
+SCORE_COMPACTION_INTERVAL = 3600  # How often expired score history is compacted (seconds)
+GUILD_LOAD_CONCURRENCY = 10  # Maximum number of guilds loaded at the same time on startup
+QUEUE_RESTORE_GRACE_TIME = 60  # Minimum seconds left in the queue for players restored after a restart
+GUILD_EVICT_INTERVAL = 60  # How often idle guilds are checked for eviction in lazy loading mode (seconds)
+PROMPT_TICK_INTERVAL = 5  # How often open game prompts are checked for expired deadlines (seconds)
+MATCHMAKING_TICK_INTERVAL = 5  # How often matchmaking queues are checked for players past their wait time (seconds)
+ANALYTICS_SAVE_INTERVAL = 60  # How often changed queue analytics are saved (seconds)
 
 
 defaults = SixMansConfig(
     CategoryChannel=None,
+    CurrentSeason=None,
     HelperRole=None,
     AutoMove=False,
     ReactToVote=True,
+    ReadyCheck=False,
     QLobby=None,
     DefaultTeamSelection=GameMode.VOTE,
     DefaultQueueMaxSize=6,
+    PickTime=0,
     PlayerTimeout=PLAYER_TIMEOUT_TIME,
     Games={},
+    JournalSeq=0,
+    JournalSnapshot=None,
     Queues={},
     GamesPlayed=0,
     Players={},
     Scores=[],
+    ScoreRetentionDays=DEFAULT_RETENTION_DAYS,
+    ScoreRollups={},
+    PeriodBuckets={},
     QueuesEnabled=True,
     QueueBans={},
 )
 
+global_defaults = SixMansGlobalConfig(
+    IdleEvictMinutes=60,
+    LazyLoading=False,
+    MetricsPath=None,
+    MetricsPort=0,
+    TrustedLoad=True,
+)
+
 
 class SixMans(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.config = Config.get_conf(self, identifier=1234567896, force_registration=True)
         self.config.register_guild(**defaults)
+        self.config.register_global(**global_defaults)
         self.queues: dict[discord.Guild, list[SixMansQueue]] = {}
         self.games: dict[discord.Guild, list[Game]] = {}
         self.queueMaxSize: dict[discord.Guild, int] = {}
         self.player_timeout_time: dict[discord.Guild, int] = {}
+        self.settings: dict[discord.Guild, GuildSettings] = {}
+        self.queue_bans: dict[discord.Guild, QueueBanTable] = {}
         self.queues_enabled: dict[discord.Guild, bool] = {}
+        self.starting_players: dict[discord.Guild, set[int]] = {}  # Popped players whose game is not created yet
 
         self.timeout_tasks = {}
+        self.game_tasks: dict[int, asyncio.Task] = {}
+        self.startup_state = StartupState.PENDING
+        self._startup_lock = asyncio.Lock()
+        self.lazy_loading = global_defaults["LazyLoading"]
+        self.idle_evict_minutes = global_defaults["IdleEvictMinutes"]
+        self.trusted_load = global_defaults["TrustedLoad"]
+        self.last_used: dict[discord.Guild, float] = {}
+        self._guild_locks: dict[discord.Guild, asyncio.Lock] = {}
+        self._evictor_task: asyncio.Task | None = None
+        self.journals: dict[discord.Guild, Journal] = {}
+        self.ingestors: dict[discord.Guild, ResultIngestor] = {}
+        self.journal_dir: Path | None = None
+        self._snapshot_task: asyncio.Task | None = None
+        self._snapshot_wanted = asyncio.Event()
+        self._compactor_task: asyncio.Task | None = None
+        self._ban_sweeper_task: asyncio.Task | None = None
+        self._prompt_ticker_task: asyncio.Task | None = None
+        self._matchmaking_task: asyncio.Task | None = None
+        self._analytics_task: asyncio.Task | None = None
+        self._score_locks: dict[discord.Guild, asyncio.Lock] = {}
+        self.metrics = MetricsExporter()
+        self._command_started: dict[int, float] = {}
+        QUEUE_PLAYERS.collect = self._queue_player_counts
+        ACTIVE_GAMES.collect = self._active_game_counts
+        OPEN_VIEWS.collect = self._open_view_counts
 
     @commands.Cog.listener()
     async def on_ready(self):
-        """Load saved game data on startup"""
-        log.debug("In on_ready()")
-        await self._load_guild_data()
-        await self._load_queues()
-        await self._load_games()
+        """Load saved game data on startup. Fires again on every reconnect."""
+        log.debug(f"In on_ready(). Startup state: {self.startup_state}")
+        if self.startup_state == StartupState.READY:
+            await self._reconcile_guilds()
+        else:
+            await self._startup()
 
     async def cog_load(self):
         """Load saved game data on startup"""
         log.debug("In cog_load()")
-        await self._load_guild_data()
-        await self._load_queues()
-        await self._load_games()
+        self.lazy_loading = await self.config.LazyLoading()
+        self.idle_evict_minutes = await self.config.IdleEvictMinutes()
+        self.trusted_load = await self.config.TrustedLoad()
+        await self.metrics.start(await self.config.MetricsPort(), await self.config.MetricsPath())
+        # Guilds are not available until the bot is connected. Otherwise on_ready will load them.
+        if self.bot.is_ready():
+            await self._startup()
+        self._compactor_task = asyncio.create_task(self._score_compactor())
+        self._ban_sweeper_task = asyncio.create_task(self._ban_sweeper())
+        self._evictor_task = asyncio.create_task(self._guild_evictor())
+        self._snapshot_task = asyncio.create_task(self._journal_snapshotter())
+        self._prompt_ticker_task = asyncio.create_task(self._prompt_ticker())
+        self._matchmaking_task = asyncio.create_task(self._matchmaking_ticker())
+        self._analytics_task = asyncio.create_task(self._analytics_saver())
 
     async def cog_unload(self):
         """Clean up when cog shuts down."""
         log.debug("In cog_unload()")
+        if self._compactor_task:
+            self._compactor_task.cancel()
+        if self._ban_sweeper_task:
+            self._ban_sweeper_task.cancel()
+        if self._evictor_task:
+            self._evictor_task.cancel()
+        if self._snapshot_task:
+            self._snapshot_task.cancel()
+        if self._prompt_ticker_task:
+            self._prompt_ticker_task.cancel()
+        if self._matchmaking_task:
+            self._matchmaking_task.cancel()
+        if self._analytics_task:
+            self._analytics_task.cancel()
+        await self.metrics.stop()
+        for ingestor in self.ingestors.values():
+            await ingestor.close()
+        for guild in list(self.journals):
+            await self._snapshot(guild)
+        for guild in list(self.queues):
+            await self._save_analytics(guild)
+        self._cancel_game_tasks()
+        for queues in self.queues.values():
+            for six_mans_queue in queues:
+                six_mans_queue.board.cancel()
         for tasks in self.timeout_tasks.values():
             for timeout_task in tasks.values():
                 timeout_task.cancel()
-        for guild in self.bot.guilds:
+        for guild, games in self.games.items():
             log.info(f"[{guild.name}] Saving games")
-            await self._save_games(guild, self.games[guild])
+            await self._save_games(guild, games)
 
     # region listeners
+    @commands.Cog.listener()
+    async def on_interaction(self, interaction: discord.Interaction):
+        """Route button presses on game prompts to the game that owns them."""
+        if interaction.type != discord.InteractionType.component or not interaction.guild or not interaction.data:
+            return
+
+        parsed = parse_game_custom_id(interaction.data.get("custom_id", ""))
+        if not parsed:
+            return
+        kind, game_id, arg = parsed
+
+        await self.ensure_guild(interaction.guild)
+        game = self.get_game_by_id(interaction.guild, int(game_id)) if game_id.isdigit() else None
+        prompt = game.prompts.get(kind) if game else None
+        if not prompt:
+            await interaction.response.send_message("This prompt is no longer active.", ephemeral=True)
+            return
+
+        try:
+            await prompt.dispatch(interaction, arg)
+        except Exception as exc:
+            log.exception(f"[{interaction.guild.name}] Error handling {kind} prompt for game {game_id}", exc_info=exc)
+
     @commands.Cog.listener("on_guild_channel_delete")
     async def on_guild_channel_delete(self, channel):
         """
@@ -105,6 +265,7 @@ class SixMans(commands.Cog):
         # TODO: Error catch if Q Lobby VC is deleted
         if not isinstance(channel, discord.TextChannel):
             return
+        await self.ensure_guild(channel.guild)
         queue = None
 
         for q in self.queues[channel.guild]:
@@ -156,11 +317,99 @@ class SixMans(commands.Cog):
     @checks.admin_or_permissions(manage_guild=True)
     async def preLoadData(self, ctx: Context):
         """Reloads all data for the 6mans cog"""
-        await self._load_guild_data()
-        await self._load_queues()
-        await self._load_games()
+        async with self._startup_lock:
+            # Games are rebuilt, so stop anything still driving the old game objects
+            self._cancel_game_tasks()
+            await self._load_all_guilds()
+            self.startup_state = StartupState.READY
         await ctx.send("Done")
 
+    @commands.command()
+    @checks.is_owner()
+    async def toggleLazyLoading(self, ctx: Context):
+        """Toggle whether guild data is loaded on first use instead of at startup"""
+        self.lazy_loading = not self.lazy_loading
+        await self.config.LazyLoading.set(self.lazy_loading)
+
+        if self.lazy_loading:
+            message = f"Guild data will be loaded on first use and unloaded after **{self.idle_evict_minutes} minutes** of inactivity."
+        else:
+            await self._reconcile_guilds()
+            message = "Guild data will be loaded at startup and kept in memory."
+        await ctx.send(message)
+
+    @commands.command()
+    @checks.is_owner()
+    async def setIdleEvictMinutes(self, ctx: Context, minutes: int):
+        """Set how long a guild must be inactive before its data is unloaded (lazy loading only)"""
+        if minutes <= 0:
+            return await ctx.send(":x: Idle time must be greater than 0 minutes.")
+        self.idle_evict_minutes = minutes
+        await self.config.IdleEvictMinutes.set(minutes)
+        await ctx.send(f"Done. Idle guilds will be unloaded after **{minutes} minutes**.")
+
+    @commands.command()
+    @checks.is_owner()
+    async def toggleTrustedLoad(self, ctx: Context):
+        """Toggle skipping full validation of saved queues and games when loading"""
+        self.trusted_load = not self.trusted_load
+        await self.config.TrustedLoad.set(self.trusted_load)
+
+        action = "**without**" if self.trusted_load else "**with**"
+        await ctx.send(f"Saved queues and games will be loaded {action} full validation. Use `verifySixMansData` to validate on demand.")
+
+    @commands.command()
+    @checks.is_owner()
+    async def setMetricsPort(self, ctx: Context, port: int):
+        """Serve Prometheus metrics on a local port at /metrics. Use 0 to stop serving them"""
+        if not 0 <= port <= 65535:
+            return await ctx.send(":x: Port must be between 0 and 65535.")
+        await self.config.MetricsPort.set(port)
+        await self.metrics.start(port, await self.config.MetricsPath())
+        if not port:
+            return await ctx.send("Done. Metrics are no longer served over HTTP.")
+        if not self.metrics.running:
+            return await ctx.send(f":x: Unable to serve metrics on port **{port}**. Check the logs for details.")
+        await ctx.send(f"Done. Metrics are served on `http://{METRICS_HOST}:{port}/metrics`.")
+
+    @commands.command()
+    @checks.is_owner()
+    async def setMetricsPath(self, ctx: Context, path: str | None = None):
+        """Write Prometheus metrics to a file periodically. Leave the path out to stop writing them"""
+        await self.config.MetricsPath.set(path)
+        await self.metrics.start(await self.config.MetricsPort(), path)
+        if not path:
+            return await ctx.send("Done. Metrics are no longer written to a file.")
+        await ctx.send(f"Done. Metrics are written to `{path}` every {METRICS_WRITE_INTERVAL} seconds.")
+
+    @commands.guild_only()
+    @commands.command()
+    @checks.admin_or_permissions(manage_guild=True)
+    async def verifySixMansData(self, ctx: Context):
+        """Fully validate the saved queue and game data for this guild"""
+        if not ctx.guild:
+            return
+
+        queues = await self._queues(ctx.guild)
+        games = await self._games(ctx.guild)
+        errors: list[str] = []
+        for name, model, data in (("Queues", GuildQueueData, queues), ("Games", GuildGameData, games)):
+            try:
+                model.model_validate(data)
+            except ValidationError as exc:
+                for err in exc.errors():
+                    loc = ".".join(str(part) for part in err["loc"])
+                    errors.append(f"`{name}.{loc}`: {err['msg']}")
+
+        summary = f"Checked {len(queues)} queue(s) and {len(games)} game(s)."
+        if not errors:
+            return await ctx.send(embed=SuccessEmbed(description=f"{summary} No problems found."))
+
+        shown = "\n".join(errors[:10])
+        if len(errors) > 10:
+            shown += f"\n...and {len(errors) - 10} more"
+        await ctx.send(embed=ErrorEmbed(title="Invalid 6 Mans Data", description=f"{summary}\n\n{shown}"))
+
     @commands.guild_only()
     @commands.command()
     @checks.admin_or_permissions(manage_guild=True)
@@ -204,6 +453,7 @@ class SixMans(commands.Cog):
             queue_max_size,
             teamSelection=team_selection,
             category=await self._category(ctx.guild),
+            save_callback=lambda g=ctx.guild: self._save_queues(g, self.queues[g]),  # type: ignore[misc]
         )
         self.queues[ctx.guild].append(six_mans_queue)
         await self._save_queues(ctx.guild, self.queues[ctx.guild])
@@ -438,6 +688,86 @@ class SixMans(commands.Cog):
             )
         )
 
+    @commands.guild_only()
+    @commands.command(aliases=["setQMM", "sqmm"])
+    @checks.admin_or_permissions(manage_guild=True)
+    async def setQueueMatchmaking(self, ctx: Context, queue_name: str, margin: int, wait_seconds: int):
+        """Pop the most balanced match once `margin` extra players have queued or the first player has waited `wait_seconds`"""
+        if not ctx.guild:
+            return
+
+        queue = self.get_queue_by_name(ctx.guild, queue_name)
+        if not queue:
+            return await ctx.send(embed=QueueNotFoundEmbed(queue_name))
+
+        if margin < 0 or wait_seconds <= 0:
+            return await ctx.send(embed=ErrorEmbed(description="Margin must be 0 or more and wait time must be greater than 0 seconds."))
+
+        queue.matchmaking = True
+        queue.match_margin = margin
+        queue.match_wait = wait_seconds
+        await self._save_queues(ctx.guild, self.queues[ctx.guild])
+        await ctx.send(
+            embed=SuccessEmbed(
+                description=(
+                    f"**{queue.name}** will pop the most balanced {queue.maxSize} players once **{queue.maxSize + margin}** are queued, "
+                    f"or after the first player has waited **{wait_seconds} seconds**."
+                )
+            )
+        )
+
+    @commands.guild_only()
+    @commands.command(aliases=["disableQMM", "dqmm"])
+    @checks.admin_or_permissions(manage_guild=True)
+    async def disableQueueMatchmaking(self, ctx: Context, *, queue_name: str):
+        """Pop a queue in join order as soon as it is full"""
+        if not ctx.guild:
+            return
+
+        queue = self.get_queue_by_name(ctx.guild, queue_name)
+        if not queue:
+            return await ctx.send(embed=QueueNotFoundEmbed(queue_name))
+
+        queue.matchmaking = False
+        await self._save_queues(ctx.guild, self.queues[ctx.guild])
+        await ctx.send(embed=SuccessEmbed(description=f"**{queue.name}** will pop in join order as soon as it is full."))
+
+    @commands.guild_only()
+    @commands.command(aliases=["setQGroup", "sqg"])
+    @checks.admin_or_permissions(manage_guild=True)
+    async def setQueueGroup(self, ctx: Context, queue_name: str, group: str, priority: int = 0):
+        """Link a queue to other queues in `group`. When several can pop, the highest priority pops first"""
+        if not ctx.guild:
+            return
+
+        queue = self.get_queue_by_name(ctx.guild, queue_name)
+        if not queue:
+            return await ctx.send(embed=QueueNotFoundEmbed(queue_name))
+
+        queue.group = group
+        queue.priority = priority
+        await self._save_queues(ctx.guild, self.queues[ctx.guild])
+        linked = [q.name for q in queue_group(self.queues[ctx.guild], queue) if q is not queue]
+        linked_fmt = ", ".join(f"**{name}**" for name in linked) if linked else "no other queues yet"
+        await ctx.send(embed=SuccessEmbed(description=f"**{queue.name}** is now in queue group **{group}** with priority **{priority}**, linked to {linked_fmt}."))
+
+    @commands.guild_only()
+    @commands.command(aliases=["clearQGroup", "cqg"])
+    @checks.admin_or_permissions(manage_guild=True)
+    async def clearQueueGroup(self, ctx: Context, *, queue_name: str):
+        """Remove a queue from its queue group"""
+        if not ctx.guild:
+            return
+
+        queue = self.get_queue_by_name(ctx.guild, queue_name)
+        if not queue:
+            return await ctx.send(embed=QueueNotFoundEmbed(queue_name))
+
+        queue.group = None
+        queue.priority = 0
+        await self._save_queues(ctx.guild, self.queues[ctx.guild])
+        await ctx.send(embed=SuccessEmbed(description=f"**{queue.name}** is no longer in a queue group."))
+
     @commands.guild_only()
     @commands.command()
     @checks.admin_or_permissions(manage_guild=True)
@@ -453,6 +783,94 @@ class SixMans(commands.Cog):
         await self._save_queues(ctx.guild, self.queues[ctx.guild])
         await ctx.send("Done")
 
+    @commands.guild_only()
+    @commands.command(aliases=["setScoreRetention"])
+    @checks.admin_or_permissions(manage_guild=True)
+    async def setScoreRetentionDays(self, ctx: Context, days: int):
+        """
+        Sets how many days of raw score history are kept (Default: 400)
+
+        Older scores are compacted into daily totals. Leaderboards for longer timeframes remain available at day granularity.
+        """  # noqa: E501
+        if not ctx.guild:
+            return
+
+        if days < 1:
+            return await ctx.send(embed=ErrorEmbed(description="Score retention must be at least 1 day."))
+
+        await self._save_score_retention_days(ctx.guild, days)
+        compacted = await self._compact_scores(ctx.guild)
+        await ctx.send(
+            embed=SuccessEmbed(
+                description=f"Raw score history will be kept for **{days}** days. Compacted **{compacted}** expired score rows.",
+            )
+        )
+
+    @commands.guild_only()
+    @commands.command(aliases=["getScoreRetention"])
+    @checks.admin_or_permissions(manage_guild=True)
+    async def getScoreRetentionDays(self, ctx: Context):
+        """Gets how many days of raw score history are kept (Default: 400)"""
+        if not ctx.guild:
+            return
+
+        days = await self._score_retention_days(ctx.guild)
+        await ctx.send(
+            embed=BlueEmbed(
+                title="Score Retention",
+                description=f"Raw score history is kept for **{days}** days.",
+            )
+        )
+
+    @commands.guild_only()
+    @commands.command()
+    @checks.admin_or_permissions(manage_guild=True)
+    async def startSeason(self, ctx: Context, *, season_name: str):
+        """Starts a new season. Games reported from now on count towards the season leader board."""
+        if not ctx.guild:
+            return
+
+        if season_name in season_names(await self._period_buckets(ctx.guild)):
+            return await ctx.send(embed=ErrorEmbed(description=f"A season named **{season_name}** already exists."))
+
+        season = Season(Name=season_name, Start=datetime.datetime.now().isoformat())
+        await self._save_current_season(ctx.guild, season)
+        await ctx.send(embed=SuccessEmbed(description=f"Season **{season_name}** has started."))
+
+    @commands.guild_only()
+    @commands.command()
+    @checks.admin_or_permissions(manage_guild=True)
+    async def endSeason(self, ctx: Context):
+        """Ends the current season. Season standings remain available."""
+        if not ctx.guild:
+            return
+
+        current = await self._current_season(ctx.guild)
+        if not current:
+            return await ctx.send(embed=ErrorEmbed(description="There is no active season."))
+
+        await self._save_current_season(ctx.guild, None)
+        await ctx.send(embed=SuccessEmbed(description=f"Season **{current['Name']}** has ended."))
+
+    @commands.guild_only()
+    @commands.command()
+    @checks.admin_or_permissions(manage_guild=True)
+    async def rebuildLeaderboards(self, ctx: Context):
+        """Rebuilds calendar and current season leader boards from raw score history.
+
+        Periods that started before the score retention window, and seasons that have ended, are kept as they are."""
+        if not ctx.guild:
+            return
+
+        async with self._score_lock(ctx.guild):
+            await self._flush_journal(ctx.guild)
+            season = await self._current_season(ctx.guild)
+            cutoff = retention_cutoff(await self._score_retention_days(ctx.guild))
+            rebuilt = rebuild_buckets(await self._scores(ctx.guild), season)
+            buckets = merge_rebuilt_buckets(await self._period_buckets(ctx.guild), rebuilt, cutoff, season)
+            await self._save_period_buckets(ctx.guild, buckets)
+        await ctx.send("Done")
+
     @commands.guild_only()
     @commands.command(aliases=["qban"])
     @checks.admin_or_permissions(kick_members=True)
@@ -522,7 +940,7 @@ class SixMans(commands.Cog):
         if not await self.has_perms(ctx.author):
             return
 
-        banned = self.check_banned(ctx.guild, player)
+        banned = await self.check_banned(ctx.guild, player)
         if banned:
             await self._remove_queue_ban(ctx.guild, player.id)
             await ctx.send(f":white_check_mark: {player.mention} has been unbanned from queueing.")
@@ -569,6 +987,9 @@ class SixMans(commands.Cog):
     @checks.admin_or_permissions(manage_guild=True)
     async def queueMultiple(self, ctx: Context, *members: discord.Member):
         """Mass queueing for testing purposes"""
+        if not ctx.guild:
+            return
+
         if not isinstance(ctx.channel, discord.TextChannel):
             return
 
@@ -580,9 +1001,12 @@ class SixMans(commands.Cog):
             if member in q.queue.queue:
                 await ctx.send(embed=ErrorEmbed(description=f"{member.display_name} is already in queue. Skipping..."))
                 continue
+            if self._is_starting(ctx.guild, member):
+                await ctx.send(embed=ErrorEmbed(description=f"{member.display_name}'s game is still being created. Skipping..."))
+                continue
             await self._add_to_queue(member, q)
-            if q.queue_full():
-                await self._pop_queue(ctx, q)
+            if q.ready_to_pop():
+                await self._pop_queue(ctx.guild, q, prefix=ctx.prefix)
 
     @commands.guild_only()
     @commands.command(aliases=["kq", "fdq"])
@@ -628,6 +1052,8 @@ class SixMans(commands.Cog):
         try:
             log.debug(f"Clearing queue: {queue.name}")
             queue.clear()
+            await self._save_queue_members(queue)
+            queue.board.refresh("Queue cleared.")
             await ctx.send("Queue cleared.")
         except Exception as exc:
             log.debug(f"Error clearing queue: {exc}")
@@ -872,9 +1298,12 @@ class SixMans(commands.Cog):
             if player in game:
                 return await ctx.send(":x: You are already in a game")
 
+        if self._is_starting(ctx.guild, player):
+            return await ctx.send(":x: Your game is still being created")
+
         await self._add_to_queue(player, q)
-        if q.queue_full():
-            await self._pop_queue(ctx, q)
+        if q.ready_to_pop():
+            await self._pop_queue(ctx.guild, q, prefix=ctx.prefix)
 
     @commands.guild_only()
     @commands.command(aliases=["dq", "lq", "leaveq", "leaveQ", "unqueue", "unq", "uq"])
@@ -967,10 +1396,22 @@ class SixMans(commands.Cog):
         # Prompt for winner
         report_view = ScoreReportView(game=game)
         await report_view.prompt()
-        if await report_view.wait():
-            return
+        await self._await_score_report(ctx.guild, game, six_mans_queue, report_view, ctx)
 
-        if report_view.cancelled:
+    async def _await_score_report(
+        self,
+        guild: discord.Guild,
+        game: Game,
+        six_mans_queue: SixMansQueue,
+        report_view: ScoreReportView,
+        destination: discord.abc.Messageable,
+    ):
+        timed_out = await report_view.wait()
+        game.score_message = None
+        game.score_deadline = None
+        game.score_report = {}
+        if timed_out or report_view.cancelled:
+            await game.save()
             return
 
         winner = report_view.result
@@ -978,16 +1419,17 @@ class SixMans(commands.Cog):
 
         # Something went wrong during reporting.
         if winner == Winner.PENDING:
+            await game.save()
             log.error(f"[{game.id}] Game winner was confirmed as PENDING.")
-            helper_role = await self._helper_role(ctx.guild)
+            helper_role = await self._helper_role(guild)
             if helper_role:
                 desc = f"Score report vote did not succeed. If you believe this is an error, please ping {helper_role.mention}"
             else:
                 desc = "Score report vote did not succeed. If you believe this is an error, please reach out for support."
-            return await ctx.reply(embed=ErrorEmbed(description=desc))
+            return await destination.send(embed=ErrorEmbed(description=desc))
 
         await game.report_winner(winner)
-        await self._finish_game(ctx.guild, game, six_mans_queue, winner)
+        await self._finish_game(guild, game, six_mans_queue, winner)
 
     @commands.guild_only()
     @commands.command(aliases=["moreinfo", "mi"])
@@ -1052,8 +1494,6 @@ class SixMans(commands.Cog):
         if not ctx.guild:
             return
 
-        scores = await self._scores(ctx.guild)
-
         queue = None
         if queue_name:
             queue = self.get_queue_by_name(ctx.guild, queue_name)
@@ -1061,7 +1501,7 @@ class SixMans(commands.Cog):
         queue_id = queue.id if queue else None
         queue_name = queue.name if queue else ctx.guild.name
         day_ago = datetime.datetime.now() - datetime.timedelta(days=1)
-        players, games_played = self._filter_scores(ctx.guild, scores, day_ago, queue_id)
+        players, games_played = await self._scores_since(ctx.guild, day_ago, queue_id)
 
         if games_played == 0:
             await ctx.send(f":x: No games have been played in {queue_name}")
@@ -1081,12 +1521,10 @@ class SixMans(commands.Cog):
         if not ctx.guild:
             return
 
-        scores = await self._scores(ctx.guild)
-
         queue = self.get_queue_by_name(ctx.guild, queue_name) if queue_name else None
         queue_id = queue.id if queue else None
         week_ago = datetime.datetime.now() - datetime.timedelta(weeks=1)
-        players, games_played = self._filter_scores(ctx.guild, scores, week_ago, queue_id)
+        players, games_played = await self._scores_since(ctx.guild, week_ago, queue_id)
 
         if games_played == 0:
             await ctx.send(f":x: No games have been played in {queue_name}")
@@ -1107,12 +1545,10 @@ class SixMans(commands.Cog):
         if not ctx.guild:
             return
 
-        scores = await self._scores(ctx.guild)
-
         queue = self.get_queue_by_name(ctx.guild, queue_name) if queue_name else None
         queue_id = queue.id if queue else None
         month_ago = datetime.datetime.now() - datetime.timedelta(days=30)
-        players, games_played = self._filter_scores(ctx.guild, scores, month_ago, queue_id)
+        players, games_played = await self._scores_since(ctx.guild, month_ago, queue_id)
 
         if games_played == 0:
             await ctx.send(f":x: No games have been played in {queue_name}")
@@ -1133,12 +1569,10 @@ class SixMans(commands.Cog):
         if not ctx.guild:
             return
 
-        scores = await self._scores(ctx.guild)
-
         queue = self.get_queue_by_name(ctx.guild, queue_name) if queue_name else None
         queue_id = queue.id if queue else None
         year_ago = datetime.datetime.now() - datetime.timedelta(days=365)
-        players, games_played = self._filter_scores(ctx.guild, scores, year_ago, queue_id)
+        players, games_played = await self._scores_since(ctx.guild, year_ago, queue_id)
 
         if games_played == 0:
             await ctx.send(f":x: No games have been played in {queue_name}")
@@ -1152,6 +1586,61 @@ class SixMans(commands.Cog):
         sorted_players = self._sort_player_dict(players)
         await ctx.send(embed=await self.embed_leaderboard(ctx, sorted_players, queue_name, games_played, "Yearly"))
 
+    @commands.guild_only()
+    @queueLeaderBoard.command(aliases=["calendarWeek", "cwk"])
+    async def thisweek(self, ctx: Context, *, queue_name: str | None = None):
+        """Calendar week leader board. All games since Monday will count"""
+        if not ctx.guild:
+            return
+
+        now = datetime.datetime.now()
+        lb_format = f"Week of {week_start(now):%b %d}"
+        await self._send_period_leaderboard(ctx, week_key(now), lb_format, queue_name)
+
+    @commands.guild_only()
+    @queueLeaderBoard.command(aliases=["calendarMonth", "cmnth"])
+    async def thismonth(self, ctx: Context, *, queue_name: str | None = None):
+        """Calendar month leader board. All games since the first of the month will count"""
+        if not ctx.guild:
+            return
+
+        now = datetime.datetime.now()
+        await self._send_period_leaderboard(ctx, month_key(now), f"{now:%B %Y}", queue_name)
+
+    @commands.guild_only()
+    @queueLeaderBoard.command(aliases=["calendarYear", "cyr"])
+    async def thisyear(self, ctx: Context, *, queue_name: str | None = None):
+        """Calendar year leader board. All games since January 1st will count"""
+        if not ctx.guild:
+            return
+
+        now = datetime.datetime.now()
+        await self._send_period_leaderboard(ctx, year_key(now), f"{now:%Y}", queue_name)
+
+    @commands.guild_only()
+    @queueLeaderBoard.command()
+    async def season(self, ctx: Context, season_name: str | None = None, *, queue_name: str | None = None):
+        """
+        Season leader board. Defaults to the current season.
+
+        Season names containing spaces must be quoted.
+        """  # noqa: E501
+        if not ctx.guild:
+            return
+
+        # Allow `[p]qlb season <queue_name>` for the current season
+        buckets = await self._period_buckets(ctx.guild)
+        if season_name and not queue_name and self.get_queue_by_name(ctx.guild, season_name) and season_name not in season_names(buckets):
+            queue_name, season_name = season_name, None
+
+        if not season_name:
+            current = await self._current_season(ctx.guild)
+            if not current:
+                return await ctx.send(":x: There is no active season.")
+            season_name = current["Name"]
+
+        await self._send_period_leaderboard(ctx, season_key(season_name), season_name, queue_name)
+
     # endregion
 
     # region rank commands
@@ -1214,12 +1703,10 @@ class SixMans(commands.Cog):
         if not isinstance(ctx.author, discord.Member):
             return
 
-        scores = await self._scores(ctx.guild)
-
         queue = self.get_queue_by_name(ctx.guild, queue_name) if queue_name else None
         queue_id = queue.id if queue else None
         day_ago = datetime.datetime.now() - datetime.timedelta(days=1)
-        players = self._filter_scores(ctx.guild, scores, day_ago, queue_id)[0]
+        players = (await self._scores_since(ctx.guild, day_ago, queue_id))[0]
         queue_name = queue.name if queue else ctx.guild.name
 
         if not players:
@@ -1247,12 +1734,10 @@ class SixMans(commands.Cog):
         if not isinstance(ctx.author, discord.Member):
             return
 
-        scores = await self._scores(ctx.guild)
-
         queue = self.get_queue_by_name(ctx.guild, queue_name) if queue_name else None
         queue_id = queue.id if queue else None
         week_ago = datetime.datetime.now() - datetime.timedelta(weeks=1)
-        players = self._filter_scores(ctx.guild, scores, week_ago, queue_id)[0]
+        players = (await self._scores_since(ctx.guild, week_ago, queue_id))[0]
         queue_name = queue.name if queue else ctx.guild.name
 
         if not players:
@@ -1280,12 +1765,10 @@ class SixMans(commands.Cog):
         if not isinstance(ctx.author, discord.Member):
             return
 
-        scores = await self._scores(ctx.guild)
-
         queue = self.get_queue_by_name(ctx.guild, queue_name) if queue_name else None
         queue_id = queue.id if queue else None
         month_ago = datetime.datetime.now() - datetime.timedelta(days=30)
-        players = self._filter_scores(ctx.guild, scores, month_ago, queue_id)[0]
+        players = (await self._scores_since(ctx.guild, month_ago, queue_id))[0]
         queue_name = queue.name if queue else ctx.guild.name
 
         if not players:
@@ -1313,12 +1796,10 @@ class SixMans(commands.Cog):
         if not isinstance(ctx.author, discord.Member):
             return
 
-        scores = await self._scores(ctx.guild)
-
         queue = self.get_queue_by_name(ctx.guild, queue_name) if queue_name else None
         queue_id = queue.id if queue else None
         year_ago = datetime.datetime.now() - datetime.timedelta(days=365)
-        players = self._filter_scores(ctx.guild, scores, year_ago, queue_id)[0]
+        players = (await self._scores_since(ctx.guild, year_ago, queue_id))[0]
         queue_name = queue.name if queue else ctx.guild.name
 
         if not players:
@@ -1346,6 +1827,40 @@ class SixMans(commands.Cog):
             return
         await ctx.send(embed=self.embed_queue_players(six_mans_queue))
 
+    @commands.guild_only()
+    @commands.command(aliases=["qstats"])
+    @checks.admin_or_permissions(manage_guild=True)
+    async def queueStats(self, ctx: Context, *, queue_name: str | None = None):
+        """Wait time and throughput stats for a queue (defaults to the queue in this channel)"""
+        if not ctx.guild:
+            return
+
+        if queue_name:
+            six_mans_queue = self.get_queue_by_name(ctx.guild, queue_name)
+        elif isinstance(ctx.channel, discord.TextChannel):
+            six_mans_queue = self.get_queue_by_text_channel(ctx.channel)
+        else:
+            six_mans_queue = None
+        if not six_mans_queue:
+            return await ctx.send(embed=QueueNotFoundEmbed(queue_name or ctx.channel.name))  # type: ignore[union-attr]
+
+        await ctx.send(embed=self.embed_queue_stats(six_mans_queue))
+
+    @commands.guild_only()
+    @commands.command(aliases=["gtrace"])
+    @checks.admin_or_permissions(manage_guild=True)
+    async def gameTrace(self, ctx: Context, game_id: int):
+        """Show how long each step took between a queue popping and a game being set up"""
+        if not ctx.guild:
+            return
+
+        trace = TRACER.find(game_id)
+        if not trace or trace.root.tags.get("guild") != ctx.guild.id:
+            return await ctx.send(embed=ErrorEmbed(description=f"No recent trace found for game **{game_id}**."))
+
+        status = "" if trace.finished else " Some steps are still running."
+        await ctx.send(f"Trace for game **{game_id}**, popped <t:{int(trace.created_at)}:R>.{status}\n```\n{trace.render()[:1800]}\n```")
+
     @commands.guild_only()
     @commands.command(aliases=["setQLobby", "setQVC"])
     @checks.admin_or_permissions(manage_guild=True)
@@ -1406,6 +1921,20 @@ class SixMans(commands.Cog):
 
         await ctx.send(embed=self.embed_queue_info(six_mans_queue, await self._get_q_lobby_vc(ctx.guild)))
 
+    @commands.guild_only()
+    @commands.command(aliases=["trc"])
+    @checks.admin_or_permissions(manage_guild=True)
+    async def toggleReadyCheck(self, ctx: Context):
+        """Toggle whether popped players must accept a ready check before game channels are created"""
+        if not ctx.guild:
+            return
+
+        ready_check = not await self._is_ready_check(ctx.guild)
+        await self._save_ready_check(ctx.guild, ready_check)
+
+        action = "must accept" if ready_check else "will not have to accept"
+        await ctx.send(f"Players in popped {self.queueMaxSize[ctx.guild]} Mans queues **{action}** a {READY_CHECK_TIMEOUT} second ready check before the game is created.")
+
     @commands.guild_only()
     @commands.command()
     @checks.admin_or_permissions(manage_guild=True)
@@ -1463,6 +1992,44 @@ class SixMans(commands.Cog):
         except ValueError:
             return await ctx.send(f"**{team_selection_method}** is not a valid method of team selection.")
 
+    @commands.guild_only()
+    @commands.command(aliases=["setPickClock"])
+    @checks.admin_or_permissions(manage_guild=True)
+    async def setPickTime(self, ctx: Context, seconds: int):
+        """
+        Sets how many seconds captains have for each pick (Default: 0)
+
+        When a captain runs out of time the best available player is picked for them. Set to 0 to disable the pick clock.
+        """  # noqa: E501
+        if not ctx.guild:
+            return
+
+        if seconds < 0:
+            return await ctx.send(embed=ErrorEmbed(description="Pick time can not be negative."))
+
+        await self._save_pick_time(ctx.guild, seconds)
+        if not seconds:
+            return await ctx.send(embed=SuccessEmbed(description="Captains pick clock has been **disabled**."))
+
+        picks = await self._get_queue_max_size(ctx.guild) - 2
+        await ctx.send(
+            embed=SuccessEmbed(
+                description=(f"Captains now have **{seconds}** seconds for each pick. A {picks + 2} player draft takes at most **{draft_time_limit(picks, seconds)}** seconds."),
+            )
+        )
+
+    @commands.guild_only()
+    @commands.command(aliases=["getPickClock"])
+    @checks.admin_or_permissions(manage_guild=True)
+    async def getPickTime(self, ctx: Context):
+        """Gets how many seconds captains have for each pick (Default: 0)"""
+        if not ctx.guild:
+            return
+
+        seconds = await self._pick_time(ctx.guild)
+        desc = f"Captains have **{seconds}** seconds for each pick." if seconds else "Captains pick clock is disabled."
+        await ctx.send(embed=BlueEmbed(title="Pick Time", description=desc))
+
     @commands.guild_only()
     @commands.command(aliases=["getTeamSelection"])
     @checks.admin_or_permissions(manage_guild=True)
@@ -1588,27 +2155,76 @@ class SixMans(commands.Cog):
     # region helper methods
 
     async def check_banned(self, guild: discord.Guild, player: discord.Member) -> QueueBan | None:
-        bans = await self._get_queue_bans(guild)
-        ban = bans.get(str(player.id))
-        if not ban:
-            return None
-
-        now = datetime.datetime.now(datetime.timezone.utc).timestamp()
-        if ban["expires"] <= now:
-            await self._remove_queue_ban(guild, player.id)
-            return None
-
-        return ban
-
-    async def expire_bans(self, guild: discord.Guild):
-        log.debug("Expiring all bans for guild: %d", guild.id)
-        bans = await self._get_queue_bans(guild)
-
-        # Clean expired bans
-        now = datetime.datetime.now(datetime.timezone.utc).timestamp()
-        expired = [pid for pid, ban in bans.items() if ban["expires"] <= now]
-        for pid in expired:
-            await self._remove_queue_ban(guild, pid)
+        # Expired bans are ignored here and removed from Config by the ban sweep
+        return (await self._queue_ban_table(guild)).get(player.id)
+
+    async def expire_bans(self, guild: discord.Guild) -> list[str]:
+        """Remove all expired bans in a single Config write. Returns the member IDs that were unbanned."""
+        table = await self._queue_ban_table(guild)
+        expired = table.pop_expired()
+        if expired:
+            log.debug(f"[{guild.name}] Expired {len(expired)} queue ban(s)")
+            await self._save_queue_bans(guild, table.bans)
+        return expired
+
+    async def _ban_sweeper(self):
+        """Background task removing expired queue bans."""
+        await self.bot.wait_until_red_ready()
+        while True:
+            now = utc_timestamp()
+            for guild, table in list(self.queue_bans.items()):
+                next_expiry = table.next_expiry()
+                if next_expiry is None or next_expiry > now:
+                    continue
+                try:
+                    await self.expire_bans(guild)
+                except Exception as exc:
+                    log.exception(f"[{guild.name}] Error expiring queue bans", exc_info=exc)
+            await asyncio.sleep(BAN_SWEEP_INTERVAL)
+
+    async def _analytics_saver(self):
+        """Background task saving queue analytics that changed since they were last saved."""
+        await self.bot.wait_until_red_ready()
+        while True:
+            await asyncio.sleep(ANALYTICS_SAVE_INTERVAL)
+            for guild in list(self.queues):
+                try:
+                    await self._save_analytics(guild)
+                except Exception as exc:
+                    log.exception(f"[{guild.name}] Error saving queue analytics", exc_info=exc)
+
+    async def _prompt_ticker(self):
+        """Background task timing out game prompts whose deadline has passed."""
+        await self.bot.wait_until_red_ready()
+        while True:
+            now = time.time()
+            for guild, games in list(self.games.items()):
+                for game in games:
+                    for prompt in list(game.prompts.values()):
+                        if prompt.deadline is None or prompt.deadline > now:
+                            continue
+                        try:
+                            await prompt.expire()
+                        except Exception as exc:
+                            log.exception(f"[{guild.name}] Error expiring {prompt.kind} prompt for game {game.id}", exc_info=exc)
+            await asyncio.sleep(PROMPT_TICK_INTERVAL)
+
+    async def _matchmaking_ticker(self):
+        """Background task popping matchmaking queues whose first player has waited long enough."""
+        await self.bot.wait_until_red_ready()
+        while True:
+            for guild, queues in list(self.queues.items()):
+                if not self.queues_enabled.get(guild, True):
+                    continue
+                for six_mans_queue in queues:
+                    if not six_mans_queue.matchmaking or not six_mans_queue.ready_to_pop():
+                        continue
+                    try:
+                        prefixes = await self.bot.get_valid_prefixes(guild)
+                        await self._pop_queue(guild, six_mans_queue, prefix=prefixes[0])
+                    except Exception as exc:
+                        log.exception(f"[{guild.name}] Error popping matchmaking queue {six_mans_queue.name}", exc_info=exc)
+            await asyncio.sleep(MATCHMAKING_TICK_INTERVAL)
 
     async def has_perms(self, member: discord.Member):
         # Admins
@@ -1625,22 +2241,25 @@ class SixMans(commands.Cog):
 
     async def _add_to_queue(self, player: discord.Member, six_mans_queue: SixMansQueue):
         six_mans_queue._put(player)
-        embed = self.embed_player_added(player, six_mans_queue)
-        try:
-            await six_mans_queue.send_message(embed=embed)
-        except Exception as exc:
-            log.debug(f"Exception adding {player.name} to queue: {exc}")
-            raise exc
+        six_mans_queue.analytics.record_join(six_mans_queue.activeJoinLog[player.id])
+        await self._save_queue_member(six_mans_queue, player)
+        six_mans_queue.board.refresh(f"{player.mention} joined the queue.")
 
         timeout = self.player_timeout_time.get(six_mans_queue.guild, PLAYER_TIMEOUT_TIME)
 
         await self.create_timeout_task(player, six_mans_queue, timeout)
 
-    async def _remove_from_queue(self, player: discord.Member, six_mans_queue: SixMansQueue):
+    async def _remove_from_queue(self, player: discord.Member, six_mans_queue: SixMansQueue, timed_out: bool = False):
+        if player in six_mans_queue.queue:
+            now = datetime.datetime.now(datetime.timezone.utc)
+            if timed_out:
+                six_mans_queue.analytics.record_timeout(now)
+            else:
+                six_mans_queue.analytics.record_dequeue(now)
         with contextlib.suppress(ValueError):
             six_mans_queue._remove(player)
-        embed = self.embed_player_removed(player, six_mans_queue)
-        await six_mans_queue.send_message(embed=embed)
+        await self._remove_queue_member(six_mans_queue, player)
+        six_mans_queue.board.refresh(f"{player.mention} left the queue.")
         await self.remove_timeout_task(player, six_mans_queue)
 
     async def get_visble_queue_channel(self, six_mans_queue: SixMansQueue, player: discord.Member):
@@ -1654,7 +2273,7 @@ class SixMans(commands.Cog):
             return
 
         # Remove player from queue
-        await self._remove_from_queue(player, six_mans_queue)
+        await self._remove_from_queue(player, six_mans_queue, timed_out=True)
 
         # Send Player Message
         auto_remove_msg = f"You have been timed out from the **{six_mans_queue.name} {six_mans_queue.maxSize} Mans queue**. You'll need to use the queue command again if you wish to play some more."
@@ -1721,28 +2340,8 @@ class SixMans(commands.Cog):
             case Winner.PENDING:
                 raise RuntimeError("Invalid result for game winner.")
 
-        _scores = await self._scores(guild)
-        _players = await self._players(guild)
-        _games_played = await self._games_played(guild)
-        date_time = datetime.datetime.now().strftime("%d-%b-%Y (%H:%M:%S.%f)")
-        for player in winning_players:
-            score = self._create_player_score(six_mans_queue, game, player, 1, date_time)
-            self._give_points(six_mans_queue.players, score)
-            self._give_points(_players, score)
-            _scores.insert(0, score)
-        for player in losing_players:
-            score = self._create_player_score(six_mans_queue, game, player, 0, date_time)
-            self._give_points(six_mans_queue.players, score)
-            self._give_points(_players, score)
-            _scores.insert(0, score)
-
-        _games_played += 1
-        six_mans_queue.gamesPlayed += 1
-
-        await self._save_scores(guild, _scores)
-        await self._save_queues(guild, self.queues[guild])
-        await self._save_players(guild, _players)
-        await self._save_games_played(guild, _games_played)
+        # Results are applied one at a time per guild so concurrent reports never overwrite each other
+        await self._ingestor(guild).submit(PendingResult(Game=game, Queue=six_mans_queue, Winners=winning_players, Losers=losing_players))
 
         if await self._get_automove(guild):  # game.automove not working?
             qlobby_vc = await self._get_q_lobby_vc(guild)
@@ -1798,6 +2397,54 @@ class SixMans(commands.Cog):
                 log.exception(f"Error deleting game voice channel {vc.name}", exc_info=exc)
                 raise
 
+    def _ingestor(self, guild: discord.Guild) -> ResultIngestor:
+        ingestor = self.ingestors.get(guild)
+        if ingestor is None:
+            ingestor = ResultIngestor(guild.name, lambda results: self._apply_results(guild, results))
+            self.ingestors[guild] = ingestor
+        return ingestor
+
+    async def _apply_results(self, guild: discord.Guild, results: list[PendingResult]):
+        """Record a batch of game results with a single journal append."""
+        async with self._score_lock(guild):
+            season = await self._current_season(guild)
+            finished_at = datetime.datetime.now()
+            date_time = finished_at.strftime(SCORE_DATETIME_FORMAT)
+            entries = []
+            for result in results:
+                game_scores: list[PlayerScore] = []
+                for player in result["Winners"]:
+                    game_scores.append(self._create_player_score(result["Queue"], result["Game"], player, 1, date_time))
+                for player in result["Losers"]:
+                    game_scores.append(self._create_player_score(result["Queue"], result["Game"], player, 0, date_time))
+                entries.append(
+                    {
+                        "Game": result["Game"].id,
+                        "Queue": result["Queue"].id,
+                        "FinishedAt": finished_at.isoformat(),
+                        "Season": season["Name"] if season else None,
+                        "Scores": game_scores,
+                    }
+                )
+
+            # Guild totals and history are folded into Config by the next snapshot
+            journal = await self._journal(guild)
+            recorded = await journal.append_many(entries)
+            for result, entry in zip(results, recorded, strict=True):
+                six_mans_queue = result["Queue"]
+                for score in entry["Scores"]:
+                    six_mans_queue.players.record(score["Player"], score["Points"], score["Win"])
+                six_mans_queue.gamesPlayed += 1
+                six_mans_queue.journal_seq = entry["Seq"]
+
+        if len(results) > 1:
+            log.debug(f"[{guild.name}] Recorded {len(results)} game results in one batch")
+        if len(journal.pending) >= JOURNAL_MAX_PENDING:
+            self._snapshot_wanted.set()
+
+    def _score_lock(self, guild: discord.Guild) -> asyncio.Lock:
+        return self._score_locks.setdefault(guild, asyncio.Lock())
+
     def _get_opposing_captain(self, player: discord.Member, game: Game):
         opposing_captain = None
         if game.state == GameState.NEW:
@@ -1821,18 +2468,6 @@ class SixMans(commands.Cog):
         elif opposing_captain in game.orange:
             game.captains[1] = random.sample(list(game.orange), 1)[0]  # Swap Orange team captain
 
-    def _give_points(self, players_dict: dict[str, PlayerStats], score: PlayerScore):
-        player_id = score["Player"]
-        points_earned = score["Points"]
-        win = score["Win"]
-
-        new_player = PlayerStats(Points=0, Wins=0, GamesPlayed=0)
-
-        player_score = players_dict.get(str(player_id), new_player)
-        player_score["Points"] = player_score["Points"] + points_earned
-        player_score["GamesPlayed"] = player_score["GamesPlayed"] + 1
-        player_score["Wins"] = player_score["Wins"] + win
-
     def _create_player_score(
         self,
         six_mans_queue: SixMansQueue,
@@ -1855,19 +2490,90 @@ class SixMans(commands.Cog):
             DateTime=date_time,
         )
 
-    def _filter_scores(self, guild, scores, start_date, queue_id):
+    async def _scores_since(self, guild: discord.Guild, start_date: datetime.datetime, queue_id: int | None):
+        """Player stats for all games after `start_date`, including compacted score history if needed."""
+        scores = await self._scores(guild)
+        rollups = None
+        if start_date < retention_cutoff(await self._score_retention_days(guild)):
+            rollups = await self._score_rollups(guild)
+        return self._filter_scores(guild, scores, start_date, queue_id, rollups)
+
+    async def _send_period_leaderboard(self, ctx: Context, period_key: str, lb_format: str, queue_name: str | None = None):
+        if not ctx.guild:
+            return
+
+        queue = self.get_queue_by_name(ctx.guild, queue_name) if queue_name else None
+        queue_id = queue.id if queue else None
+        queue_name = queue.name if queue else ctx.guild.name
+        players, games_played = period_standings(await self._period_buckets(ctx.guild), period_key, queue_id)
+
+        if games_played == 0:
+            await ctx.send(f":x: No games have been played in {queue_name}")
+            return
+
+        if not players:
+            await ctx.send(f":x: Queue leaderboard not available for {queue_name}")
+            return
+
+        sorted_players = self._sort_player_dict(players)
+        await ctx.send(embed=await self.embed_leaderboard(ctx, sorted_players, queue_name, games_played, lb_format))
+
+    def _filter_scores(self, guild, scores, start_date, queue_id, rollups: DailyRollups | None = None):
         players: dict[str, PlayerStats] = {}
         valid_scores = 0
         for score in scores:
-            date_time = datetime.datetime.strptime(score["DateTime"], "%d-%b-%Y (%H:%M:%S.%f)")
+            date_time = datetime.datetime.strptime(score["DateTime"], SCORE_DATETIME_FORMAT)
             if date_time > start_date and (queue_id is None or score["Queue"] == queue_id):
-                self._give_points(players, score)
+                give_points(players, score)
                 valid_scores += 1
             else:
                 break
+        if rollups:
+            valid_scores += rollup_stats_since(rollups, start_date, queue_id, players)[1]
         games_played = valid_scores // self.queueMaxSize[guild]
         return players, games_played
 
+    async def _score_compactor(self):
+        """Background task folding expired score rows into daily rollups."""
+        await self.bot.wait_until_red_ready()
+        while True:
+            for guild in list(self.bot.guilds):
+                try:
+                    await self._compact_scores(guild)
+                except Exception as exc:
+                    log.exception(f"[{guild.name}] Error compacting score history", exc_info=exc)
+            await asyncio.sleep(SCORE_COMPACTION_INTERVAL)
+
+    async def _compact_scores(self, guild: discord.Guild) -> int:
+        """Compact score rows older than the guild retention window. Returns the number of rows compacted."""
+        scores = await self._scores(guild)
+        cutoff = retention_cutoff(await self._score_retention_days(guild))
+        rollups = await self._score_rollups(guild)
+
+        folded = 0
+        for progress in compact_scores(scores, rollups, cutoff):
+            folded = progress
+            # Yield to the event loop between batches
+            await asyncio.sleep(0)
+
+        if not folded:
+            return 0
+
+        async with self._score_lock(guild):
+            # Fold pending results into Config first so they are not written twice
+            await self._flush_journal(guild)
+            # New scores may have been prepended while compacting. Only drop the tail we folded.
+            compacted = scores[-folded:]
+            current = await self._scores(guild)
+            if current[-folded:] != compacted:
+                log.warning(f"[{guild.name}] Score history changed during compaction. Skipping.")
+                return 0
+
+            await self._save_score_rollups(guild, rollups)
+            await self._save_scores(guild, current[:-folded])
+        log.info(f"[{guild.name}] Compacted {folded} score rows older than {cutoff:%Y-%m-%d}")
+        return folded
+
     def _sort_player_dict(self, player_dict):
         sorted_players = sorted(
             player_dict.items(),
@@ -1876,29 +2582,109 @@ class SixMans(commands.Cog):
         )
         return sorted(sorted_players, key=lambda x: x[1][Strings.PLAYER_POINTS_KEY], reverse=True)
 
-    async def _pop_queue(self, ctx: Context, six_mans_queue: SixMansQueue) -> bool:
-        """Pop Queue"""
-        if not ctx.guild:
-            return False
+    @traced("pop_queue", root=True)
+    async def _pop_queue(self, guild: discord.Guild, six_mans_queue: SixMansQueue, prefix="?") -> bool:
+        """
+        Pop `six_mans_queue`, or whichever queue in its group should pop first (see `groups.next_pop`).
 
-        log.debug(f"Creating game. Guild: {ctx.guild.id} Queue: {six_mans_queue.name}")
-        game = await self.create_game(ctx.guild, six_mans_queue, prefix=ctx.prefix)
-        if game is None:
+        Players for every game the group can form are taken before anything is awaited, so sibling queues
+        never pop with players who were already taken. Each run is traced, see `gameTrace`.
+        """
+        tag(guild=guild.id, queue=six_mans_queue.name)
+        queues = self.queues[guild]
+        group = queue_group(queues, six_mans_queue)
+        index = member_index(queues)
+        popped: list[tuple[SixMansQueue, list[discord.Member]]] = []
+        removed: dict[SixMansQueue, list[discord.Member]] = {}
+        while (ready := next_pop(group)) is not None:
+            players = ready._pop_players()
+            log.debug(f"Creating game. Guild: {guild.id} Queue: {ready.name}")
+            popped.append((ready, players))
+            # Remove players from any other queue they were in
+            for queue, taken in take_from_queues(index, players).items():
+                removed.setdefault(queue, []).extend(taken)
+
+        if not popped:
             return False
 
-        # Remove players from any other queue they were in
-        for player in game.players:
-            for queue in self.queues[ctx.guild]:
-                if player in queue.queue:
-                    await self._remove_from_queue(player, queue)
-
+        await self._save_taken(removed)
+        await asyncio.gather(*(self.create_game(guild, queue, prefix=prefix, players=players) for queue, players in popped))
         return True
 
-    async def create_game(self, guild: discord.Guild, six_mans_queue: SixMansQueue, prefix="?"):
-        if not six_mans_queue.queue_full():
-            return None
-        players = [six_mans_queue._get() for _ in range(six_mans_queue.maxSize)]
+    async def _save_taken(self, removed: dict[SixMansQueue, list[discord.Member]]):
+        """Persist queues that players were taken out of by `groups.take_from_queues`."""
+        for queue, taken in removed.items():
+            await self._save_queue_members(queue)
+            for player in taken:
+                await self.remove_timeout_task(player, queue)
+            queue.board.refresh(f"{', '.join(p.mention for p in taken)} left the queue.")
+
+    @traced("ready_check")
+    async def _ready_check(self, guild: discord.Guild, six_mans_queue: SixMansQueue, players: list[discord.Member]) -> list[discord.Member] | None:
+        """
+        Have popped players confirm they are ready before any game channels are created.
 
+        Players who decline or don't answer are dropped, and the next players in the queue get their own
+        ready check. Returns None if the queue runs out of players. Players who accepted then go back to
+        the front of the queue.
+
+        Everyone asked is kept in `starting_players` while the check runs. Players who make it into the game
+        stay there until `create_game` has added it.
+        """
+        starting = self.starting_players.setdefault(guild, set())
+        asked: list[discord.Member] = []
+        confirmed: list[discord.Member] = []
+        ready: list[discord.Member] | None = None
+        pending = players
+        try:
+            while pending:
+                asked.extend(pending)
+                starting.update(p.id for p in pending)
+                check = ReadyCheckView(six_mans_queue, pending)
+                await check.run()
+                confirmed.extend(p for p in pending if p in check.ready)
+                six_mans_queue._release(check.missing)
+                missing = len(check.missing)
+                if not missing:
+                    break
+
+                if six_mans_queue.queue.qsize() < missing:
+                    six_mans_queue._requeue(confirmed)
+                    await self._save_queue_members(six_mans_queue)
+                    six_mans_queue.board.refresh("Not everyone was ready. Waiting for more players.")
+                    await six_mans_queue.send_message(message="**Not everyone was ready.** Players who accepted are back at the front of the queue.")
+                    return None
+
+                pending = six_mans_queue._take_next(missing)
+                await self._save_taken(take_from_queues(member_index(self.queues[guild]), pending))
+                await self._save_queue_members(six_mans_queue)
+            ready = confirmed
+            return ready
+        finally:
+            starting.difference_update(p.id for p in asked if ready is None or p not in ready)
+
+    @traced("create_game")
+    async def create_game(self, guild: discord.Guild, six_mans_queue: SixMansQueue, prefix="?", players: list[discord.Member] | None = None):
+        if players is None:
+            if not six_mans_queue.ready_to_pop():
+                return None
+            players = six_mans_queue._pop_players()
+        await self._save_queue_members(six_mans_queue)
+        six_mans_queue.board.refresh("Queue popped! A new game is being created.")
+
+        if await self._is_ready_check(guild):
+            players = await self._ready_check(guild, six_mans_queue, players)
+            if players is None:
+                return None
+
+        try:
+            return await self._start_game(guild, six_mans_queue, players, prefix)
+        finally:
+            self.starting_players.get(guild, set()).difference_update(p.id for p in players)
+
+    async def _start_game(self, guild: discord.Guild, six_mans_queue: SixMansQueue, players: list[discord.Member], prefix: str) -> Game:
+        # Time spent waiting on the ready check is not part of the pop latency
+        popped_at = time.perf_counter()
         await six_mans_queue.send_message(message="**Queue is full! Game is being created.**")
 
         game = Game(
@@ -1906,20 +2692,28 @@ class SixMans(commands.Cog):
             players=players,
             helper_role=await self._helper_role(guild),
             automove=await self._get_automove(guild),
+            pick_time=await self._pick_time(guild),
             prefix=prefix,
             save_callback=lambda: self._save_games(guild, self.games[guild]),
         )
+        tag(game=game.id)
         await game.create_game_channels(await self._category(guild))
+        POP_LATENCY.observe(time.perf_counter() - popped_at)
 
         log.debug(f"Saving game: {game.id} Players: {game.players}")
         self.games[guild].append(game)
         await self._save_games(guild, self.games[guild])
+        six_mans_queue.record_game(players)
 
         await game.process_team_selection_method()
         # Save again once teams are selected
         await self._save_games(guild, self.games[guild])
         return game
 
+    def _is_starting(self, guild: discord.Guild, player: discord.Member) -> bool:
+        """Whether the player is in a ready check or waiting on their game to be created."""
+        return player.id in self.starting_players.get(guild, ())
+
     async def get_info(self, ctx: Context) -> tuple[Game | None, SixMansQueue | None]:
         if not ctx.guild:
             return None, None
@@ -1955,7 +2749,7 @@ class SixMans(commands.Cog):
 
     def get_game_by_id(self, guild: discord.Guild, game_id: int) -> Game | None:
         log.debug(f"Fetching Game ID: {game_id}")
-        for active_game in self.games[guild]:
+        for active_game in self.games.get(guild, []):
             if active_game.id == game_id:
                 return active_game
         return None
@@ -1984,27 +2778,6 @@ class SixMans(commands.Cog):
 
     # region embed and string format methods
 
-    def embed_player_added(self, player: discord.Member, six_mans_queue: SixMansQueue):
-        player_list = self.format_player_list(six_mans_queue)
-        embed = discord.Embed(color=discord.Colour.green())
-        player_icon = player.display_avatar.url
-        embed.set_author(
-            name=f"{player.display_name} added to the {six_mans_queue.name} queue. ({six_mans_queue.queue.qsize()}/{six_mans_queue.maxSize})",
-            icon_url=player_icon,
-        )
-        embed.add_field(name="Players in Queue", value=player_list, inline=False)
-        return embed
-
-    def embed_player_removed(self, player: discord.Member, six_mans_queue: SixMansQueue):
-        player_list = self.format_player_list(six_mans_queue)
-        embed = discord.Embed(color=discord.Colour.red())
-        embed.set_author(
-            name=f"{player.display_name} removed from the {six_mans_queue.name} queue. ({six_mans_queue.queue.qsize()}/{six_mans_queue.maxSize})",
-            icon_url=player.display_avatar.url,
-        )
-        embed.add_field(name="Players in Queue", value=player_list, inline=False)
-        return embed
-
     def embed_queue_info(self, queue: SixMansQueue, default_lobby_vc=None):
         log.debug("")
         embed = discord.Embed(
@@ -2022,6 +2795,14 @@ class SixMans(commands.Cog):
             value=queue.maxSize,
             inline=False,
         )
+        if queue.group:
+            embed.add_field(name="Queue Group", value=f"{queue.group} (Priority: {queue.priority})", inline=False)
+        if queue.matchmaking:
+            embed.add_field(
+                name="Matchmaking",
+                value=f"Pops at {queue.maxSize + queue.match_margin} players or after {queue.match_wait} seconds",
+                inline=False,
+            )
 
         if queue.lobby_vc:
             embed.add_field(name="Lobby VC", value=queue.lobby_vc, inline=False)
@@ -2041,6 +2822,44 @@ class SixMans(commands.Cog):
         )
         return embed
 
+    def embed_queue_stats(self, queue: SixMansQueue) -> discord.Embed:
+        stats = queue.analytics
+        now = datetime.datetime.now(datetime.timezone.utc)
+        embed = BlueEmbed(
+            title=f"{queue.name} {queue.maxSize} Mans Queue Stats",
+            description=f"Wait times and joins are from the last {ANALYTICS_WINDOW_DAYS} days.",
+        )
+
+        def fmt_wait(seconds: float | None) -> str:
+            return "N/A" if seconds is None else f"{round(seconds / 60, 1)} min"
+
+        def fmt_percentile(percentile: float) -> str:
+            if not stats.popped_players(now):
+                return "N/A"
+            bound = stats.wait_percentile(percentile, now)
+            return f"under {fmt_wait(bound)}" if bound else f"over {fmt_wait(WAIT_BUCKETS[-1])}"
+
+        embed.add_field(
+            name="Wait Time",
+            value=(f"**Average:** {fmt_wait(stats.average_wait(now))}\n**Median:** {fmt_percentile(50)}\n**90th Percentile:** {fmt_percentile(90)}"),
+            inline=True,
+        )
+        embed.add_field(
+            name="Throughput",
+            value=(f"**Pops (last hour):** {stats.pops_since(1, now)}\n**Pops (last 24 hours):** {stats.pops_since(24, now)}\n**Pops (all time):** {stats.pops}"),
+            inline=True,
+        )
+        embed.add_field(
+            name="Joins",
+            value=(f"**Total:** {stats.joins(now)}\n**Timeout Rate:** {stats.timeout_rate(now):.1%}\n**Dequeue Rate:** {stats.dequeue_rate(now):.1%}"),
+            inline=True,
+        )
+        busiest = ", ".join(format_hour_of_week(h) for h in stats.busiest_hours()) or "N/A"
+        embed.add_field(name="Busiest Hours", value=busiest, inline=False)
+        embed.add_field(name="Joins by Hour (UTC)", value=f"```\n{stats.render_heatmap(stats.join_heatmap)}\n```", inline=False)
+        embed.add_field(name="Pops by Hour (UTC)", value=f"```\n{stats.render_heatmap(stats.pop_heatmap)}\n```", inline=False)
+        return embed
+
     def embed_queue_players(self, queue: SixMansQueue):
         player_list = self.format_player_list(queue)
         embed = discord.Embed(
@@ -2052,6 +2871,8 @@ class SixMans(commands.Cog):
             value=player_list,
             inline=False,
         )
+        if not queue.ready_to_pop():
+            embed.add_field(name="Estimated Pop", value=format_eta(queue.pop_eta()), inline=False)
         return embed
 
     def embed_active_games(self, guild, queueGames: dict[int, list[Game]]):
@@ -2198,187 +3019,421 @@ class SixMans(commands.Cog):
 
     # region load/save methods
 
-    async def _load_guild_data(self):
-        log.info("Loading guild settings...")
-        for guild in self.bot.guilds:
-            log.debug(f"Preloading data for guild: {guild}")
-            self.queues[guild] = []
-            self.games[guild] = []
-
-            # Defaults
-            self.queueMaxSize[guild] = await self._get_queue_max_size(guild)
-            self.player_timeout_time[guild] = await self._player_timeout(guild)
-            saved_queues_enabled = await self._get_queues_enabled(guild)
-            if saved_queues_enabled is not None:
-                self.queues_enabled[guild] = saved_queues_enabled
+    async def _startup(self):
+        """Load all guild data exactly once."""
+        async with self._startup_lock:
+            if self.startup_state == StartupState.READY:
+                return
+            self.startup_state = StartupState.LOADING
+            try:
+                await self._load_all_guilds()
+            except Exception:
+                self.startup_state = StartupState.PENDING
+                raise
+            self.startup_state = StartupState.READY
+
+    async def _reconcile_guilds(self):
+        """Cheap pass after a reconnect. Only loads guilds that have not been loaded yet."""
+        if self.lazy_loading:
+            # Guilds are loaded on first use
+            return
+        async with self._startup_lock:
+            missing = [guild for guild in self.bot.guilds if guild not in self.queues]
+            if not missing:
+                log.debug("Reconnected. All guilds already loaded.")
+                return
+            log.info(f"Reconnected. Loading {len(missing)} new guild(s)...")
+            await self._load_guilds(missing)
+
+    async def _load_all_guilds(self):
+        """Load settings, queues and games for every guild from scratch."""
+        log.info(f"Loading data for {len(self.bot.guilds)} guild(s)...")
+        self.queues = {}
+        self.games = {}
+        guilds = list(self.bot.guilds)
+        if self.lazy_loading:
+            # Games in progress and queued players' timeouts still need to be resumed. Everything else waits for first use.
+            guilds = [guild for guild in guilds if await self._games(guild) or await self._has_queued_players(guild)]
+            log.info(f"Lazy loading enabled. Loading {len(guilds)} guild(s) with games in progress or players in a queue.")
+        await self._load_guilds(guilds)
+
+    async def _has_queued_players(self, guild: discord.Guild) -> bool:
+        return any(queue.get("Members") for queue in (await self._queues(guild)).values())
+
+    def _decode_queue(self, value: dict) -> QueueData:
+        if self.trusted_load:
+            try:
+                return QueueData.trusted(value)
+            except (KeyError, TypeError, ValueError) as exc:
+                log.warning(f"Unable to load queue without validation. Validating instead: {exc!r}")
+        return QueueData(**value)
+
+    def _decode_game(self, value: dict) -> GameData:
+        if self.trusted_load:
+            try:
+                return GameData.trusted(value)
+            except (KeyError, TypeError, ValueError) as exc:
+                log.warning(f"Unable to load game without validation. Validating instead: {exc!r}")
+        return GameData(**value)
+
+    async def cog_before_invoke(self, ctx: Context):
+        self._command_started[id(ctx)] = time.perf_counter()
+        if ctx.guild:
+            await self.ensure_guild(ctx.guild)
+
+    async def cog_after_invoke(self, ctx: Context):
+        start = self._command_started.pop(id(ctx), None)
+        if start is not None and ctx.command:
+            COMMAND_LATENCY.observe(time.perf_counter() - start, ctx.command.qualified_name)
+
+    async def ensure_guild(self, guild: discord.Guild):
+        """Make sure guild data is in memory before it is used. Only loads anything in lazy loading mode."""
+        self.last_used[guild] = time.monotonic()
+        if guild in self.queues:
+            return
+
+        async with self._guild_locks.setdefault(guild, asyncio.Lock()):
+            if guild in self.queues:
+                return
+            start = time.perf_counter()
+            await self._load_guild(guild)
+            log.info(f"[{guild.name}] Loaded on first use in {(time.perf_counter() - start) * 1000:.1f}ms")
+
+    async def _guild_evictor(self):
+        """Background task unloading idle guilds in lazy loading mode."""
+        await self.bot.wait_until_red_ready()
+        while True:
+            await asyncio.sleep(GUILD_EVICT_INTERVAL)
+            if not self.lazy_loading:
+                continue
+            idle_after = self.idle_evict_minutes * 60
+            now = time.monotonic()
+            for guild in list(self.queues):
+                if now - self.last_used.get(guild, 0) >= idle_after and self._is_idle(guild):
+                    await self._evict_guild(guild)
+
+    def _is_idle(self, guild: discord.Guild) -> bool:
+        """Guild has no games and nobody waiting in a queue."""
+        if self.games.get(guild):
+            return False
+        return not any(q.queue.queue for q in self.queues.get(guild, []))
+
+    async def _evict_guild(self, guild: discord.Guild):
+        log.info(f"[{guild.name}] Unloading idle guild data")
+        # Results still being applied go into the journal, which is then snapshotted before it is dropped
+        ingestor = self.ingestors.pop(guild, None)
+        if ingestor:
+            await ingestor.close()
+        await self._snapshot(guild)
+        await self._save_analytics(guild)
+        for six_mans_queue in self.queues.pop(guild, []):
+            six_mans_queue.board.cancel()
+        self.games.pop(guild, None)
+        self.settings.pop(guild, None)
+        self.queue_bans.pop(guild, None)
+        self.queueMaxSize.pop(guild, None)
+        self.player_timeout_time.pop(guild, None)
+        self.queues_enabled.pop(guild, None)
+        self.starting_players.pop(guild, None)
+        self.last_used.pop(guild, None)
+        self.journals.pop(guild, None)
+        self._guild_locks.pop(guild, None)
+
+    async def _load_guilds(self, guilds: list[discord.Guild]):
+        """Load guilds several at a time."""
+        semaphore = asyncio.Semaphore(GUILD_LOAD_CONCURRENCY)
+
+        async def load(guild: discord.Guild):
+            async with semaphore:
+                start = time.perf_counter()
+                await self._load_guild(guild)
+                elapsed = (time.perf_counter() - start) * 1000
+                log.info(f"[{guild.name}] Loaded {len(self.queues[guild])} queue(s) and {len(self.games[guild])} game(s) in {elapsed:.1f}ms")
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(load(guild) for guild in guilds), return_exceptions=True)
+        for guild, result in zip(guilds, results, strict=True):
+            if isinstance(result, BaseException):
+                log.error(f"[{guild.name}] Failed to load 6 mans data", exc_info=result)
+        log.info(f"Loaded {len(guilds)} guild(s) in {(time.perf_counter() - start) * 1000:.1f}ms")
+
+    async def _load_guild(self, guild: discord.Guild):
+        await self._recover_journal(guild)
+        await self._load_guild_data(guild)
+        await self._load_queues(guild)
+        await self._load_games(guild)
+
+    async def _load_guild_data(self, guild: discord.Guild):
+        log.debug(f"Preloading data for guild: {guild}")
+        self.queues[guild] = []
+        self.games[guild] = []
+
+        # Defaults
+        settings = await self._load_settings(guild)
+        self.queue_bans[guild] = QueueBanTable(await self.config.guild(guild).QueueBans())
+        self.queueMaxSize[guild] = settings.DefaultQueueMaxSize
+        self.player_timeout_time[guild] = settings.PlayerTimeout
+        saved_queues_enabled = settings.QueuesEnabled
+        if saved_queues_enabled is not None:
+            self.queues_enabled[guild] = saved_queues_enabled
+        else:
+            self.queues_enabled[guild] = True
+
+        log.debug(f"Guild Queues Enabled: {saved_queues_enabled}")
+        log.debug(f"Guild Queue Max Size: {self.queueMaxSize[guild]}")
+        log.debug(f"Guild Player Timeout: {self.player_timeout_time[guild]}")
+
+    async def _load_queues(self, guild: discord.Guild):
+        log.debug(f"Getting queues for guild: {guild}")
+        self.queues[guild] = []
+        self.games[guild] = []
+
+        # Queue settings
+        default_team_selection = await self._team_selection(guild)
+        default_queue_size = self.queueMaxSize[guild]
+        default_category = await self._category(guild)
+        default_lobby_vc = await self._get_q_lobby_vc(guild)
+        log.debug(f"Default Team Selection: {default_team_selection}")
+        log.debug(f"Default Queue Size: {default_queue_size}")
+        log.debug(f"Default Category: {default_category}")
+        log.debug(f"Default Lobby VC: {default_lobby_vc}")
+
+        # Pre-load Queues
+        queues = await self._queues(guild)
+
+        for key, value in queues.items():
+            q = self._decode_queue(value)
+            queue_channels = q.guild_channels(guild)
+            queue_size = q.MaxSize or default_queue_size
+            category = q.guild_category(guild) or default_category
+            lobby_vc = q.lobby_vc(guild) or default_lobby_vc
+            player_dict = q.player_dict()
+
+            # Default Game Mode
+            if q.TeamSelection:
+                # Backwards compatitiblity for game mode
+                mode = q.TeamSelection.lower().capitalize()
+                team_selection = GameMode(mode)
             else:
-                self.queues_enabled[guild] = True
+                team_selection = default_team_selection
+
+            log.debug(f"Preloading Queue: {q.Name}")
+            log.debug(f"\tCategory: {category}")
+            log.debug(f"\tQueue Channels: {queue_channels}")
+            log.debug(f"\tQueue Size: {queue_size}")
+            log.debug(f"\tTeam Selection: {team_selection}")
+            log.debug(f"\tLobby VC: {lobby_vc}")
+            log.debug(f"Player Total: {len(player_dict.keys())}")
+            log.debug(f"Games Played: {q.GamesPlayed}")
+
+            log.debug(f"Players: {q.Players}")
+            log.debug(f"Player_Dict: {player_dict}")
+            log.debug(f"Points: {dict(q.Points)}")
+
+            six_mans_queue = SixMansQueue(
+                id=int(key),
+                name=q.Name,
+                guild=guild,
+                channels=queue_channels,
+                points=dict(q.Points),
+                gamesPlayed=q.GamesPlayed,
+                players=player_dict,
+                maxSize=queue_size,
+                teamSelection=team_selection,
+                category=category,
+                lobby_vc=lobby_vc,
+                board_messages=q.BoardMessages,
+                journal_seq=q.JournalSeq,
+                matchmaking=q.Matchmaking,
+                match_margin=q.MatchMargin,
+                match_wait=q.MatchWait,
+                group=q.Group,
+                priority=q.Priority,
+                analytics=q.Analytics,
+                save_callback=lambda g=guild: self._save_queues(g, self.queues[g]),  # type: ignore[misc]
+            )
 
-            log.debug(f"Guild Queues Enabled: {saved_queues_enabled}")
-            log.debug(f"Guild Queue Max Size: {self.queueMaxSize[guild]}")
-            log.debug(f"Guild Player Timeout: {self.player_timeout_time[guild]}")
+            six_mans_queue.id = int(key)
 
-    async def _load_queues(self):
-        log.info("Preloading existing queues...")
-        # await self.bot.wait_until_ready()
-        self.queues = {}
-        self.games = {}
+            exists = False
+            for idx, gq in enumerate(self.queues[guild]):
+                if gq.id == int(key):
+                    self.queues[guild][idx] = six_mans_queue
+                    exists = True
 
-        for guild in self.bot.guilds:
-            log.debug(f"Getting queues for guild: {guild}")
-            self.queues[guild] = []
-            self.games[guild] = []
-
-            # Queue settings
-            default_team_selection = await self._team_selection(guild)
-            default_queue_size = self.queueMaxSize[guild]
-            default_category = await self._category(guild)
-            default_lobby_vc = await self._get_q_lobby_vc(guild)
-            log.debug(f"Default Team Selection: {default_team_selection}")
-            log.debug(f"Default Queue Size: {default_queue_size}")
-            log.debug(f"Default Category: {default_category}")
-            log.debug(f"Default Lobby VC: {default_lobby_vc}")
-
-            # Pre-load Queues
-            queues = await self._queues(guild)
-
-            for key, value in queues.items():
-                q = QueueData(**value)
-                queue_channels = q.guild_channels(guild)
-                queue_size = q.MaxSize or default_queue_size
-                category = q.guild_category(guild) or default_category
-                lobby_vc = q.lobby_vc(guild) or default_lobby_vc
-                player_dict = q.Players.model_dump()
-
-                # Default Game Mode
-                if q.TeamSelection:
-                    # Backwards compatitiblity for game mode
-                    mode = q.TeamSelection.lower().capitalize()
-                    team_selection = GameMode(mode)
+            if not exists:
+                self.queues[guild].append(six_mans_queue)
+
+            await self._restore_queue_members(six_mans_queue, q.Members)
+
+    async def _restore_queue_members(self, six_mans_queue: SixMansQueue, members: dict[str, float]):
+        """Put players saved in the queue back in join order and resume their remaining timeout."""
+        if not members:
+            return
+
+        guild = six_mans_queue.guild
+        timeout = self.player_timeout_time.get(guild, PLAYER_TIMEOUT_TIME)
+        now = datetime.datetime.now(datetime.timezone.utc)
+        restored = 0
+        for player_id, joined_ts in sorted(members.items(), key=lambda m: m[1]):
+            player = guild.get_member(int(player_id))
+            if not player:
+                log.debug(f"[{guild.name}] Queued player {player_id} is no longer in the guild")
+                continue
+
+            joined = datetime.datetime.fromtimestamp(joined_ts, tz=datetime.timezone.utc)
+            six_mans_queue._put(player, joined=joined)
+            remaining = max(timeout - (now - joined).total_seconds(), QUEUE_RESTORE_GRACE_TIME)
+            await self.create_timeout_task(player, six_mans_queue, remaining)
+            restored += 1
+
+        log.info(f"[{guild.name}] Restored {restored} player(s) to the {six_mans_queue.name} queue")
+        if restored != len(members):
+            await self._save_queue_members(six_mans_queue)
+        six_mans_queue.board.refresh()
+
+    async def _load_games(self, guild: discord.Guild):
+        log.debug(f"Getting games for guild: {guild}")
+        self.games[guild] = []
+
+        # Pre-load Games
+        games = await self._games(guild)
+        from pprint import pformat
+
+        log.debug(f"Games: {pformat(games)}")
+        game_list = []
+        log.debug(f"Preloaded Games Length: {len(games)}")
+        for key, value in games.items():
+            g = self._decode_game(value)
+
+            # Player Data
+            players = g.get_player_members(guild)
+            captains = g.get_captain_members(guild)
+            blue = g.get_blue_members(guild)
+            orange = g.get_orange_members(guild)
+
+            # Queue Data
+            text_channel = g.guild_text_channel(guild)
+            voice_channels = g.guild_voice_channels(guild)
+            queueId = g.QueueId
+
+            # Find guild queue object
+            queue = None
+            for q in self.queues[guild]:
+                if q.id == queueId:
+                    queue = q
+
+            if not queue:
+                log.error(f"Unable to find queue associated with ID: {queueId}")
+                continue
+
+            log.debug(f"Loading Game: {key}")
+            log.debug(f"State: {g.State}")
+            log.debug(f"Players: {players}")
+            log.debug(f"Game Info: {g.RoomName}//{g.RoomPass}")
+            log.debug(f"Players: {players}")
+            log.debug(f"Orange: {orange}")
+            log.debug(f"Blue: {blue}")
+            log.debug(f"Prefix: {players}")
+
+            game = Game(
+                players=players,
+                queue=queue,
+                id=int(key),
+                blue=blue,
+                orange=orange,
+                captains=captains,
+                roomName=g.RoomName,
+                roomPass=g.RoomPass,
+                state=g.State,
+                text_channel=text_channel,
+                voice_channels=voice_channels,
+                prefix=g.Prefix,
+                teamSelection=g.TeamSelection,
+                winner=g.Winner,
+                save_callback=lambda g=guild: self._save_games(g, self.games[g]),  # type: ignore[misc]
+                selection_message=g.SelectionMessage,
+                mode_votes=g.ModeVotes,
+                vote_deadline=g.VoteDeadline,
+                pick_order=g.PickOrder,
+                pick_time=await self._pick_time(guild),
+                pick_deadline=g.PickDeadline,
+                score_message=g.ScoreMessage,
+                score_report=g.ScoreReport,
+                score_deadline=g.ScoreDeadline,
+            )
+
+            log.debug(f"Guild: {guild.name} ID: {game.id} game.textChannel: {game.textChannel} State: {game.state} Mode: {game.teamSelection}")
+            game_list.append(game)
+        log.debug(f"Preloaded Games: {[g.id for g in game_list]}")
+        self.games[guild] = game_list
+        # Only write back if games were dropped while loading
+        if len(game_list) != len(games):
+            await self._save_games(guild, self.games[guild])
+
+        # Start games again if needed. Selection and score report messages that were already
+        # posted are picked up again instead of being reposted.
+        for eg in self.games[guild]:
+            if eg.state == GameState.NEW or eg.state == GameState.SELECTION:
+                selection_view = eg.selection_view()
+                if selection_view:
+                    self._start_game_task(eg, functools.partial(eg.resume_team_selection, selection_view))
                 else:
-                    team_selection = default_team_selection
-
-                log.debug(f"Preloading Queue: {q.Name}")
-                log.debug(f"\tCategory: {category}")
-                log.debug(f"\tQueue Channels: {queue_channels}")
-                log.debug(f"\tQueue Size: {queue_size}")
-                log.debug(f"\tTeam Selection: {team_selection}")
-                log.debug(f"\tLobby VC: {lobby_vc}")
-                log.debug(f"Player Total: {len(player_dict.keys())}")
-                log.debug(f"Games Played: {q.GamesPlayed}")
-
-                log.debug(f"Players: {q.Players}")
-                log.debug(f"Player_Dict: {player_dict}")
-                log.debug(f"Points: {dict(q.Points)}")
-
-                six_mans_queue = SixMansQueue(
-                    id=int(key),
-                    name=q.Name,
-                    guild=guild,
-                    channels=queue_channels,
-                    points=dict(q.Points),
-                    gamesPlayed=q.GamesPlayed,
-                    players=player_dict,
-                    maxSize=queue_size,
-                    teamSelection=team_selection,
-                    category=category,
-                    lobby_vc=lobby_vc,
-                )
+                    self._start_game_task(eg, eg.process_team_selection_method)
+            elif eg.state == GameState.ONGOING:
+                if eg.score_message and eg.textChannel:
+                    report_view = ScoreReportView(game=eg)
+                    self._start_game_task(eg, functools.partial(self._resume_score_report, guild, eg, report_view))
+                else:
+                    self._start_game_task(eg, eg.send_game_info)
 
-                six_mans_queue.id = int(key)
+    async def _resume_score_report(self, guild: discord.Guild, game: Game, report_view: ScoreReportView):
+        await game.send_game_info()
+        await self._await_score_report(guild, game, game.queue, report_view, game.textChannel)
 
-                exists = False
-                for idx, gq in enumerate(self.queues[guild]):
-                    if gq.id == int(key):
-                        self.queues[guild][idx] = six_mans_queue
-                        exists = True
+    def _start_game_task(self, game: Game, func: Callable[[], Coroutine[Any, Any, Any]]) -> asyncio.Task:
+        """Run a game task unless one is already in flight for the same game ID."""
+        task = self.game_tasks.get(game.id)
+        if task and not task.done():
+            log.debug(f"Game {game.id} already has a running task. Not starting another.")
+            return task
 
-                if not exists:
-                    self.queues[guild].append(six_mans_queue)
+        task = asyncio.create_task(func())
+        self.game_tasks[game.id] = task
+        task.add_done_callback(lambda t, game_id=game.id: self.game_tasks.pop(game_id, None) if self.game_tasks.get(game_id) is t else None)
+        return task
 
-    async def _load_games(self):
-        log.info("Preloading existing games...")
-        self.games = {}
+    def _cancel_game_tasks(self):
+        for task in self.game_tasks.values():
+            task.cancel()
+        self.game_tasks.clear()
 
-        for guild in self.bot.guilds:
-            log.debug(f"Getting games for guild: {guild}")
-            self.games[guild] = []
-
-            # Pre-load Games
-            games = await self._games(guild)
-            from pprint import pformat
-
-            log.debug(f"Games: {pformat(games)}")
-            game_list = []
-            log.debug(f"Preloaded Games Length: {len(games)}")
-            for key, value in games.items():
-                g = GameData(**value)
-
-                # Player Data
-                players = g.get_player_members(guild)
-                captains = g.get_captain_members(guild)
-                blue = g.get_blue_members(guild)
-                orange = g.get_orange_members(guild)
-
-                # Queue Data
-                text_channel = g.guild_text_channel(guild)
-                voice_channels = g.guild_voice_channels(guild)
-                queueId = g.QueueId
-
-                # Find guild queue object
-                queue = None
-                for q in self.queues[guild]:
-                    if q.id == queueId:
-                        queue = q
-
-                if not queue:
-                    log.error(f"Unable to find queue associated with ID: {queueId}")
-                    continue
+    # Metrics collected when they are rendered
 
-                log.debug(f"Loading Game: {key}")
-                log.debug(f"State: {g.State}")
-                log.debug(f"Players: {players}")
-                log.debug(f"Game Info: {g.RoomName}//{g.RoomPass}")
-                log.debug(f"Players: {players}")
-                log.debug(f"Orange: {orange}")
-                log.debug(f"Blue: {blue}")
-                log.debug(f"Prefix: {players}")
-
-                game = Game(
-                    players=players,
-                    queue=queue,
-                    id=int(key),
-                    blue=blue,
-                    orange=orange,
-                    captains=captains,
-                    roomName=g.RoomName,
-                    roomPass=g.RoomPass,
-                    state=g.State,
-                    text_channel=text_channel,
-                    voice_channels=voice_channels,
-                    prefix=g.Prefix,
-                    teamSelection=g.TeamSelection,
-                    winner=g.Winner,
-                    save_callback=lambda g=guild: self._save_games(g, self.games[g]),  # type: ignore[misc]
-                )
+    def _queue_player_counts(self) -> dict[tuple[str, ...], float]:
+        return {(str(guild.id), q.name): q.queue.qsize() for guild, queues in self.queues.items() for q in queues}
 
-                log.debug(f"Guild: {guild.name} ID: {game.id} game.textChannel: {game.textChannel} State: {game.state} Mode: {game.teamSelection}")
-                game_list.append(game)
-            log.debug(f"Preloaded Games: {[g.id for g in game_list]}")
-            self.games[guild] = game_list
-            await self._save_games(guild, self.games[guild])
+    def _active_game_counts(self) -> dict[tuple[str, ...], float]:
+        return {(str(guild.id),): len(games) for guild, games in self.games.items()}
 
-            # Start games again if needed.
-            for eg in self.games[guild]:
-                if eg.state == GameState.NEW or eg.state == GameState.SELECTION:
-                    asyncio.create_task(eg.process_team_selection_method())
-                elif eg.state == GameState.ONGOING:
-                    asyncio.create_task(eg.send_game_info())
+    def _open_view_counts(self) -> dict[tuple[str, ...], float]:
+        counts: dict[tuple[str, ...], float] = {}
+        for games in self.games.values():
+            for game in games:
+                for kind in game.prompts:
+                    counts[(kind,)] = counts.get((kind,), 0) + 1
+        return counts
 
     async def _clear_all_data(self, guild: discord.Guild):
+        journal = await self._journal(guild)
+        await self.config.guild(guild).JournalSeq.set(journal.seq)
+        await journal.truncate(journal.seq)
         await self._save_games(guild, [])
         await self._save_queues(guild, [])
         await self._save_scores(guild, [])
+        await self._save_score_rollups(guild, {})
+        await self._save_period_buckets(guild, {})
+        await self._save_current_season(guild, None)
         await self._save_games_played(guild, 0)
         await self._save_players(guild, {})
         await self._save_category(guild, None)
@@ -2391,133 +3446,309 @@ class SixMans(commands.Cog):
         await self._save_automove(guild, False)
 
     async def _games(self, guild: discord.Guild):
-        return await self.config.guild(guild).Games()
+        return config_read("Games", await self.config.guild(guild).Games())
 
     async def _save_games(self, guild: discord.Guild, games: list[Game]):
         log.debug(f"Saving games. Guild: {guild.id} Game: {[g.id for g in games]}")
         game_dict = {}
         for game in games:
             game_dict[game.id] = game._to_dict()
-        await self.config.guild(guild).Games.set(game_dict)
+        await self.config.guild(guild).Games.set(config_write("Games", game_dict))
 
     async def _queues(self, guild: discord.Guild):
-        return await self.config.guild(guild).Queues()
+        return config_read("Queues", await self.config.guild(guild).Queues())
+
+    async def _save_queue_member(self, six_mans_queue: SixMansQueue, player: discord.Member):
+        joined = six_mans_queue.activeJoinLog[player.id].timestamp()
+        await self.config.guild(six_mans_queue.guild).Queues.set_raw(str(six_mans_queue.id), "Members", str(player.id), value=config_write("Queues", joined))
+
+    async def _remove_queue_member(self, six_mans_queue: SixMansQueue, player: discord.Member):
+        await self.config.guild(six_mans_queue.guild).Queues.clear_raw(*config_clear("Queues", str(six_mans_queue.id), "Members", str(player.id)))
+
+    async def _save_queue_members(self, six_mans_queue: SixMansQueue):
+        await self.config.guild(six_mans_queue.guild).Queues.set_raw(str(six_mans_queue.id), "Members", value=config_write("Queues", six_mans_queue.membership()))
+
+    async def _save_analytics(self, guild: discord.Guild):
+        for six_mans_queue in self.queues.get(guild, []):
+            if not six_mans_queue.analytics.dirty:
+                continue
+            six_mans_queue.analytics.dirty = False
+            analytics = config_write("Queues", six_mans_queue.analytics.to_dict())
+            await self.config.guild(guild).Queues.set_raw(str(six_mans_queue.id), "Analytics", value=analytics)
 
     async def _save_queues(self, guild: discord.Guild, queues: list[SixMansQueue]):
         queue_dict = {}
         for queue in queues:
             if queue.guild == guild:
                 queue_dict[queue.id] = queue._to_dict()
-        await self.config.guild(guild).Queues.set(queue_dict)
+        await self.config.guild(guild).Queues.set(config_write("Queues", queue_dict))
 
     async def _scores(self, guild: discord.Guild) -> list[PlayerScore]:
-        return await self.config.guild(guild).Scores()
+        return self._with_pending(guild, "Scores", config_read("Scores", await self.config.guild(guild).Scores()))
 
     async def _save_scores(self, guild: discord.Guild, scores: list[PlayerScore]):
-        await self.config.guild(guild).Scores.set(scores)
+        await self.config.guild(guild).Scores.set(config_write("Scores", scores))
+
+    async def _score_rollups(self, guild: discord.Guild) -> DailyRollups:
+        return config_read("ScoreRollups", await self.config.guild(guild).ScoreRollups())
+
+    async def _save_score_rollups(self, guild: discord.Guild, rollups: DailyRollups):
+        await self.config.guild(guild).ScoreRollups.set(config_write("ScoreRollups", rollups))
+
+    async def _score_retention_days(self, guild: discord.Guild) -> int:
+        return (await self._guild_settings(guild)).ScoreRetentionDays
+
+    async def _save_score_retention_days(self, guild: discord.Guild, days: int):
+        await self.config.guild(guild).ScoreRetentionDays.set(days)
+        (await self._guild_settings(guild)).ScoreRetentionDays = days
+
+    async def _period_buckets(self, guild: discord.Guild) -> PeriodBucketMap:
+        return self._with_pending(guild, "PeriodBuckets", config_read("PeriodBuckets", await self.config.guild(guild).PeriodBuckets()))
+
+    async def _save_period_buckets(self, guild: discord.Guild, buckets: PeriodBucketMap):
+        await self.config.guild(guild).PeriodBuckets.set(config_write("PeriodBuckets", buckets))
+
+    async def _current_season(self, guild: discord.Guild) -> Season | None:
+        return (await self._guild_settings(guild)).CurrentSeason
+
+    async def _save_current_season(self, guild: discord.Guild, season: Season | None):
+        await self.config.guild(guild).CurrentSeason.set(season)
+        (await self._guild_settings(guild)).CurrentSeason = season
 
     async def _games_played(self, guild: discord.Guild):
-        return await self.config.guild(guild).GamesPlayed()
+        return self._with_pending(guild, "GamesPlayed", config_read("GamesPlayed", await self.config.guild(guild).GamesPlayed()))
 
     async def _save_games_played(self, guild: discord.Guild, games_played: int):
-        await self.config.guild(guild).GamesPlayed.set(games_played)
+        await self.config.guild(guild).GamesPlayed.set(config_write("GamesPlayed", games_played))
 
     async def _player_timeout(self, guild: discord.Guild):
-        return await self.config.guild(guild).PlayerTimeout()
+        return (await self._guild_settings(guild)).PlayerTimeout
 
     async def _save_player_timeout(self, guild: discord.Guild, time_seconds: int):
         await self.config.guild(guild).PlayerTimeout.set(time_seconds)
+        (await self._guild_settings(guild)).PlayerTimeout = time_seconds
 
     async def _players(self, guild: discord.Guild) -> dict[str, PlayerStats]:
-        return await self.config.guild(guild).Players()
+        return self._with_pending(guild, "Players", config_read("Players", await self.config.guild(guild).Players()))
+
+    def _with_pending(self, guild: discord.Guild, key: str, value):
+        """Config value with game results that are journaled but not yet snapshotted."""
+        journal = self.journals.get(guild)
+        if not journal or not journal.pending:
+            return value
+        return journal.overlay({key: value})[key]
+
+    async def _journal(self, guild: discord.Guild) -> Journal:
+        journal = self.journals.get(guild)
+        if journal is None:
+            if self.journal_dir is None:
+                self.journal_dir = cog_data_path(self) / "journal"
+            applied_seq = await self.config.guild(guild).JournalSeq()
+            journal = await Journal.open(self.journal_dir / f"{guild.id}.jsonl", applied_seq)
+            self.journals[guild] = journal
+        return journal
+
+    async def _recover_journal(self, guild: discord.Guild):
+        """Finish a snapshot that was interrupted, then replay results that were journaled but never made it into one."""
+        snapshot = await self.config.guild(guild).JournalSnapshot()
+        if snapshot:
+            log.info(f"[{guild.name}] Finishing interrupted snapshot at journal sequence {snapshot['Seq']}")
+            async with self._score_lock(guild):
+                await self._write_snapshot(guild, snapshot)
+        journal = await self._journal(guild)
+        if journal.pending:
+            log.info(f"[{guild.name}] Replaying {len(journal.pending)} journaled game result(s)")
+            async with self._score_lock(guild):
+                await self._flush_journal(guild)
+
+    async def _snapshot(self, guild: discord.Guild):
+        async with self._score_lock(guild):
+            await self._flush_journal(guild)
+
+    async def _flush_journal(self, guild: discord.Guild):
+        """
+        Fold pending journal entries into Config.
+
+        Only the values game results change are written. Queues and games are written elsewhere without the
+        score lock, so they are updated by key instead of being replaced. The caller must hold the guild score lock.
+
+        Every Config write persists on its own, so the new values are first saved together as one `JournalSnapshot`
+        record. If the bot stops partway through writing them out, `_recover_journal` finishes the job from the record
+        instead of replaying the journal over values that already include some of it.
+        """
+        journal = self.journals.get(guild)
+        if not journal or not journal.pending:
+            return
+
+        conf = self.config.guild(guild)
+        queue_ids = {str(entry["Queue"]) for entry in journal.pending}
+        state = {
+            "Scores": config_read("Scores", await conf.Scores()),
+            "Players": config_read("Players", await conf.Players()),
+            "GamesPlayed": config_read("GamesPlayed", await conf.GamesPlayed()),
+            "PeriodBuckets": config_read("PeriodBuckets", await conf.PeriodBuckets()),
+            "Queues": {queue_id: config_read("Queues", await conf.Queues.get_raw(queue_id, default=None)) for queue_id in queue_ids},
+        }
+        journal.overlay(state)
+        snapshot = JournalSnapshot(
+            Seq=journal.pending[-1]["Seq"],
+            Scores=state["Scores"],
+            Players=state["Players"],
+            GamesPlayed=state["GamesPlayed"],
+            PeriodBuckets=state["PeriodBuckets"],
+            Queues={queue_id: {key: queue[key] for key in ("Players", "GamesPlayed", "JournalSeq")} for queue_id, queue in state["Queues"].items() if queue},
+            Games=sorted({str(entry["Game"]) for entry in journal.pending}),
+        )
+        await conf.JournalSnapshot.set(config_write("JournalSnapshot", snapshot))
+        await self._write_snapshot(guild, snapshot)
+        await journal.truncate(snapshot["Seq"])
+
+    async def _write_snapshot(self, guild: discord.Guild, snapshot: JournalSnapshot):
+        """Write out a saved snapshot record. Every write sets a final value, so it is safe to repeat."""
+        conf = self.config.guild(guild)
+        await conf.Scores.set(config_write("Scores", snapshot["Scores"]))
+        await conf.Players.set(config_write("Players", snapshot["Players"]))
+        await conf.GamesPlayed.set(config_write("GamesPlayed", snapshot["GamesPlayed"]))
+        await conf.PeriodBuckets.set(config_write("PeriodBuckets", snapshot["PeriodBuckets"]))
+        for queue_id, queue in snapshot["Queues"].items():
+            for key, value in queue.items():
+                await conf.Queues.set_raw(queue_id, key, value=config_write("Queues", value))
+        for game_id in snapshot["Games"]:
+            await conf.Games.clear_raw(*config_clear("Games", game_id))
+        await conf.JournalSeq.set(snapshot["Seq"])
+        await conf.JournalSnapshot.clear()
+        log.debug(f"[{guild.name}] Snapshot written at journal sequence {snapshot['Seq']}")
+
+    async def _journal_snapshotter(self):
+        """Background task folding journaled game results into Config."""
+        await self.bot.wait_until_red_ready()
+        while True:
+            # Woken early once a guild has too many pending results
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._snapshot_wanted.wait(), timeout=JOURNAL_SNAPSHOT_INTERVAL)
+            self._snapshot_wanted.clear()
+            for guild, journal in list(self.journals.items()):
+                if not journal.pending:
+                    continue
+                try:
+                    await self._snapshot(guild)
+                except Exception as exc:
+                    log.exception(f"[{guild.name}] Error writing journal snapshot", exc_info=exc)
 
     async def _save_players(self, guild: discord.Guild, players: dict[str, PlayerStats]):
-        await self.config.guild(guild).Players.set(players)
+        await self.config.guild(guild).Players.set(config_write("Players", players))
+
+    async def _pick_time(self, guild: discord.Guild) -> int:
+        return (await self._guild_settings(guild)).PickTime
+
+    async def _save_pick_time(self, guild: discord.Guild, seconds: int):
+        await self.config.guild(guild).PickTime.set(seconds)
+        (await self._guild_settings(guild)).PickTime = seconds
 
     async def _get_automove(self, guild: discord.Guild):
-        return await self.config.guild(guild).AutoMove()
+        return (await self._guild_settings(guild)).AutoMove
 
     async def _save_automove(self, guild: discord.Guild, automove: bool):
         await self.config.guild(guild).AutoMove.set(automove)
+        (await self._guild_settings(guild)).AutoMove = automove
+
+    async def _is_ready_check(self, guild: discord.Guild) -> bool:
+        return (await self._guild_settings(guild)).ReadyCheck
+
+    async def _save_ready_check(self, guild: discord.Guild, ready_check: bool):
+        await self.config.guild(guild).ReadyCheck.set(ready_check)
+        (await self._guild_settings(guild)).ReadyCheck = ready_check
 
     async def _is_react_to_vote(self, guild: discord.Guild):
-        return await self.config.guild(guild).ReactToVote()
+        return (await self._guild_settings(guild)).ReactToVote
 
     async def _save_react_to_vote(self, guild: discord.Guild, automove: bool):
         await self.config.guild(guild).ReactToVote.set(automove)
+        (await self._guild_settings(guild)).ReactToVote = automove
 
     async def _category(self, guild: discord.Guild) -> discord.CategoryChannel | None:
-        category_id = await self.config.guild(guild).CategoryChannel()
-        if not category_id:
-            return None
-        category = guild.get_channel(category_id)
-        if not isinstance(category, discord.CategoryChannel):
-            log.error(f"[{guild.name}] 6 mans category is not actually a category.")
-            return None
-        return category
+        return (await self._guild_settings(guild)).category(guild)
 
     async def _save_category(self, guild: discord.Guild, category: int | None):
         await self.config.guild(guild).CategoryChannel.set(category)
+        (await self._guild_settings(guild)).CategoryChannel = category
 
     async def _save_q_lobby_vc(self, guild: discord.Guild, vc: int | None):
         await self.config.guild(guild).QLobby.set(vc)
+        (await self._guild_settings(guild)).QLobby = vc
 
     async def _get_q_lobby_vc(self, guild: discord.Guild):
-        log.debug(f"Guild: {guild}")
-        lobby_voice = await self.config.guild(guild).QLobby()
-        log.debug(f"lobby_voice: {lobby_voice}")
-        for vc in guild.voice_channels:
-            if vc.id == lobby_voice:
-                return vc
-        return None
+        return (await self._guild_settings(guild)).lobby_vc(guild)
 
     async def _get_queue_max_size(self, guild: discord.Guild):
-        return await self.config.guild(guild).DefaultQueueMaxSize()
+        return (await self._guild_settings(guild)).DefaultQueueMaxSize
 
     async def _save_queue_max_size(self, guild: discord.Guild, max_size: int):
         await self.config.guild(guild).DefaultQueueMaxSize.set(max_size)
+        (await self._guild_settings(guild)).DefaultQueueMaxSize = max_size
         self.queueMaxSize[guild] = max_size
 
     async def _helper_role(self, guild: discord.Guild):
-        return guild.get_role(await self.config.guild(guild).HelperRole())
+        return (await self._guild_settings(guild)).helper_role(guild)
 
     async def _save_helper_role(self, guild: discord.Guild, helper_role):
         await self.config.guild(guild).HelperRole.set(helper_role)
+        (await self._guild_settings(guild)).HelperRole = helper_role
 
     async def _save_team_selection(self, guild: discord.Guild, team_selection: GameMode):
         await self.config.guild(guild).DefaultTeamSelection.set(team_selection.value)
+        (await self._guild_settings(guild)).DefaultTeamSelection = team_selection.value
 
     async def _team_selection(self, guild: discord.Guild) -> GameMode:
-        mode = await self.config.guild(guild).DefaultTeamSelection()
-        # Backwards compatibilitgy
-        if mode:
-            mode = mode.lower().capitalize()
-            return GameMode(mode)
-        else:
-            return GameMode.VOTE
+        return (await self._guild_settings(guild)).team_selection()
 
     async def _save_queues_enabled(self, guild: discord.Guild, enabled: bool):
-        return await self.config.guild(guild).QueuesEnabled.set(enabled)
+        await self.config.guild(guild).QueuesEnabled.set(enabled)
+        (await self._guild_settings(guild)).QueuesEnabled = enabled
 
     async def _get_queues_enabled(self, guild: discord.Guild):
-        return await self.config.guild(guild).QueuesEnabled()
+        return (await self._guild_settings(guild)).QueuesEnabled
+
+    async def _guild_settings(self, guild: discord.Guild) -> GuildSettings:
+        """Cached guild settings. Only reads from Config if the guild has not been loaded yet."""
+        settings = self.settings.get(guild)
+        if settings is None:
+            settings = await self._load_settings(guild)
+        return settings
+
+    async def _load_settings(self, guild: discord.Guild) -> GuildSettings:
+        # Only the settings are read, the rest of the guild data grows with score history
+        conf = self.config.guild(guild)
+        fields = list(GuildSettings.model_fields)
+        values = await asyncio.gather(*(conf.get_raw(field) for field in fields))
+        settings = GuildSettings(**dict(zip(fields, values, strict=True)))
+        self.settings[guild] = settings
+        return settings
 
     async def _get_queue_bans(self, guild: discord.Guild) -> dict[str, QueueBan]:
-        return await self.config.guild(guild).QueueBans()
+        return (await self._queue_ban_table(guild)).bans
+
+    async def _save_queue_bans(self, guild: discord.Guild, queue_bans: dict[str, QueueBan]):
+        await self.config.guild(guild).QueueBans.set(queue_bans)
+
+    async def _queue_ban_table(self, guild: discord.Guild) -> QueueBanTable:
+        """Cached queue bans. Only reads from Config if the guild has not been loaded yet."""
+        table = self.queue_bans.get(guild)
+        if table is None:
+            table = QueueBanTable(await self.config.guild(guild).QueueBans())
+            self.queue_bans[guild] = table
+        return table
 
     async def _add_queue_ban(self, guild: discord.Guild, member: int, queue_ban: QueueBan):
         log.debug(f"Adding queue ban. Guild: {guild.id} Member: {member} Ban: {queue_ban}")
-        queue_bans = await self._get_queue_bans(guild)
-        member_fmt = str(member)
-        queue_bans[member_fmt] = queue_ban
-        await self.config.guild(guild).QueueBans.set(queue_bans)
+        table = await self._queue_ban_table(guild)
+        table.add(member, queue_ban)
+        await self._save_queue_bans(guild, table.bans)
 
     async def _remove_queue_ban(self, guild: discord.Guild, member: int):
-        queue_bans = await self._get_queue_bans(guild)
-        member_fmt = str(member)
-        if member_fmt in queue_bans:
-            del queue_bans[member_fmt]
-            await self.config.guild(guild).QueueBans.set(queue_bans)
+        table = await self._queue_ban_table(guild)
+        if table.remove(member):
+            await self._save_queue_bans(guild, table.bans)
 
 
 # endregion
@@ -0,0 +1,68 @@
+from array import array
+from collections.abc import Iterator, Mapping
+
+from sixMans.types import PlayerStats
+
+
+class PlayerStatsTable(Mapping[str, PlayerStats]):
+    """
+    Per-player queue stats stored as parallel integer arrays.
+
+    Behaves like the saved `{player_id: {"Points", "GamesPlayed", "Wins"}}` mapping.
+    Lookups accept int or str player IDs. Values are built on access, so changes must
+    go through `record`. Use `to_dict` to get the JSON shape for persistence.
+    """
+
+    __slots__ = ("_index", "_ids", "_points", "_games", "_wins")
+
+    def __init__(self, players: Mapping[str, PlayerStats] | None = None):
+        self._index: dict[int, int] = {}
+        self._ids = array("q")
+        self._points = array("q")
+        self._games = array("q")
+        self._wins = array("q")
+        for player_id, stats in (players or {}).items():
+            row = self._row(int(player_id))
+            self._points[row] = stats["Points"]
+            self._games[row] = stats["GamesPlayed"]
+            self._wins[row] = stats["Wins"]
+
+    def _row(self, player_id: int) -> int:
+        row = self._index.get(player_id)
+        if row is None:
+            row = len(self._ids)
+            self._index[player_id] = row
+            self._ids.append(player_id)
+            self._points.append(0)
+            self._games.append(0)
+            self._wins.append(0)
+        return row
+
+    def record(self, player_id: int, points: int, win: int):
+        """Add the result of one game for a player."""
+        row = self._row(int(player_id))
+        self._points[row] += points
+        self._games[row] += 1
+        self._wins[row] += win
+
+    def __getitem__(self, player_id: int | str) -> PlayerStats:
+        try:
+            row = self._index[int(player_id)]
+        except ValueError:
+            raise KeyError(player_id) from None
+        return PlayerStats(Points=self._points[row], GamesPlayed=self._games[row], Wins=self._wins[row])
+
+    def __contains__(self, player_id: object) -> bool:
+        try:
+            return int(player_id) in self._index  # type: ignore[call-overload]
+        except (TypeError, ValueError):
+            return False
+
+    def __iter__(self) -> Iterator[str]:
+        return (str(player_id) for player_id in self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def to_dict(self) -> dict[str, PlayerStats]:
+        return {str(player_id): self[player_id] for player_id in self._ids}
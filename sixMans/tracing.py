@@ -0,0 +1,139 @@
+import contextlib
+import functools
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterator
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+TRACE_BUFFER_SIZE = 100  # Number of recent traces kept in memory
+
+T = TypeVar("T")
+
+
+class Span:
+    """A timed step of a trace. `end` is None while the step is still running."""
+
+    __slots__ = ("name", "start", "end", "tags", "children")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.start = time.perf_counter()
+        self.end: float | None = None
+        self.tags: dict[str, Any] = {}
+        self.children: list[Span] = []
+
+    def duration(self, now: float | None = None) -> float:
+        """Time spent in the span so far (seconds)."""
+        return (self.end if self.end is not None else now or time.perf_counter()) - self.start
+
+
+class Trace:
+    """A tree of spans for one run of the pop pipeline, along with the IDs of the games it created."""
+
+    __slots__ = ("root", "created_at", "game_ids")
+
+    def __init__(self, root: Span):
+        self.root = root
+        self.created_at = time.time()
+        self.game_ids: set[int] = set()
+
+    @property
+    def finished(self) -> bool:
+        return self.root.end is not None
+
+    def render(self) -> str:
+        """
+        One line per span, indented under its parent. Each line shows when the span started relative to
+        the start of the trace, and how long it took.
+        """
+        now = time.perf_counter()
+        lines = []
+
+        def walk(span: Span, depth: int):
+            tags = "".join(f" {key}={value}" for key, value in span.tags.items())
+            took = f"{span.duration(now) * 1000:.1f}ms" + ("" if span.end is not None else " (running)")
+            lines.append(f"+{(span.start - self.root.start) * 1000:>9.1f}ms {'  ' * depth}{span.name}{tags} {took}")
+            for child in span.children:
+                walk(child, depth + 1)
+
+        walk(self.root, 0)
+        return "\n".join(lines)
+
+
+_current: ContextVar[tuple[Trace, Span] | None] = ContextVar("sixmans_span", default=None)
+
+
+class Tracer:
+    """
+    Records nested timing spans and keeps the most recent traces in a ring buffer.
+
+    The current span is held in a context variable, so spans opened in tasks started from inside a span
+    (like games created concurrently with `asyncio.gather`) are nested under it. Traces are added to the
+    buffer when they start, so steps that are still running can be inspected.
+    """
+
+    def __init__(self, size: int = TRACE_BUFFER_SIZE):
+        self.traces: deque[Trace] = deque(maxlen=size)
+
+    @contextlib.contextmanager
+    def span(self, name: str, root: bool = False) -> Iterator[Span | None]:
+        """
+        Time the block as a child of the current span.
+
+        Outside of a trace nothing is recorded, unless `root` is set, which starts a new trace.
+        """
+        current = _current.get()
+        if current is None and not root:
+            yield None
+            return
+
+        span = Span(name)
+        if current is None:
+            trace = Trace(span)
+            self.traces.append(trace)
+        else:
+            trace = current[0]
+            current[1].children.append(span)
+
+        token = _current.set((trace, span))
+        try:
+            yield span
+        finally:
+            span.end = time.perf_counter()
+            _current.reset(token)
+
+    def find(self, game_id: int) -> Trace | None:
+        """Most recent trace that created the game."""
+        for trace in reversed(self.traces):
+            if game_id in trace.game_ids:
+                return trace
+        return None
+
+
+TRACER = Tracer()
+
+
+def traced(name: str, root: bool = False) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Run a coroutine function inside `TRACER.span(name, root)`."""
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs) -> T:
+            with TRACER.span(name, root=root):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def tag(**tags: Any):
+    """Tag the current span. A `game` tag also links the game ID to the trace so it can be found later."""
+    current = _current.get()
+    if current is None:
+        return
+    trace, span = current
+    span.tags.update(tags)
+    if "game" in tags:
+        trace.game_ids.add(tags["game"])
@@ -1,7 +1,8 @@
 import collections
-from typing import TYPE_CHECKING, TypedDict
+from typing import TYPE_CHECKING, Any
 
 import discord
+from typing_extensions import TypedDict
 
 from sixMans.enums import GameMode
 
@@ -25,30 +26,97 @@ class PlayerStats(TypedDict):
     Wins: int
 
 
+# Date (YYYY-MM-DD) -> Queue ID -> Player ID -> Stats
+DailyRollups = dict[str, dict[str, dict[str, PlayerStats]]]
+
+
+class PeriodBucket(TypedDict):
+    GamesPlayed: int
+    Players: dict[str, PlayerStats]
+
+
+# Period key (week, month, year or season) -> Queue ID -> Bucket
+PeriodBucketMap = dict[str, dict[str, PeriodBucket]]
+
+
+class Season(TypedDict):
+    Name: str
+    Start: str
+
+
 class QueueBan(TypedDict):
     expires: int | float
     banned_by: int
     reason: str | None
 
 
+class GameResultEntry(TypedDict):
+    Seq: int
+    Game: int
+    Queue: int
+    FinishedAt: str
+    Season: str | None
+    Scores: list[PlayerScore]
+
+
+class JournalSnapshot(TypedDict):
+    Seq: int
+    Scores: list[PlayerScore]
+    Players: dict[str, PlayerStats]
+    GamesPlayed: int
+    PeriodBuckets: "PeriodBucketMap"
+    Queues: dict[str, dict[str, Any]]
+    Games: list[str]
+
+
+class PendingResult(TypedDict):
+    Game: "Game"
+    Queue: "SixMansQueue"
+    Winners: set[discord.Member]
+    Losers: set[discord.Member]
+
+
+class ChannelResult(TypedDict):
+    Channel: discord.abc.Messageable
+    Result: Any
+    Error: BaseException | None
+    Elapsed: float
+
+
 class SixMansConfig(TypedDict):
     AutoMove: bool
     CategoryChannel: discord.CategoryChannel | None
+    CurrentSeason: Season | None
     DefaultQueueMaxSize: int
     DefaultTeamSelection: GameMode
     Games: dict[discord.Guild, "Game"]
     GamesPlayed: int
     HelperRole: discord.Role | None
+    JournalSeq: int
+    JournalSnapshot: JournalSnapshot | None
+    PeriodBuckets: PeriodBucketMap
+    PickTime: int
     Players: dict[str, PlayerStats]
     PlayerTimeout: int
     QLobby: discord.VoiceChannel | None
     Queues: dict[discord.Guild, list["SixMansQueue"]]
     QueuesEnabled: bool
     ReactToVote: bool
+    ReadyCheck: bool
     Scores: list[PlayerScore]
+    ScoreRetentionDays: int
+    ScoreRollups: DailyRollups
     QueueBans: dict[str, "QueueBan"]
 
 
+class SixMansGlobalConfig(TypedDict):
+    IdleEvictMinutes: int
+    LazyLoading: bool
+    MetricsPath: str | None
+    MetricsPort: int
+    TrustedLoad: bool
+
+
 class OrderedSet(collections.abc.MutableSet):
     def __init__(self, iterable=None):
         self.end = end = []
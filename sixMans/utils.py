@@ -1,6 +1,16 @@
+import asyncio
+import logging
 import struct
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any
+
 import discord
 
+from sixMans.types import ChannelResult
+
+log = logging.getLogger("red.sixMans.utils")
+
 
 def format_team_mentions(team: list[discord.Member], captains: list[discord.Member]) -> str:
     captain_players = [f"{player.mention} (C)" for player in team if player in captains]
@@ -17,3 +27,29 @@ def get_emoji(value):
             return struct.pack("<I", int(value, base=16)).decode("utf-32le")  # i == react_hex
     except (ValueError, TypeError):
         return None
+
+
+async def fan_out(
+    channels: Iterable[discord.abc.Messageable],
+    func: Callable[[Any], Awaitable[Any]],
+) -> list[ChannelResult]:
+    """
+    Run `func(channel)` for every channel concurrently.
+
+    Errors are isolated per channel so a deleted or forbidden channel does not abort the rest.
+    Results are returned in channel order along with how long each call took (seconds).
+    """
+
+    async def run(channel) -> ChannelResult:
+        start = time.perf_counter()
+        try:
+            result = await func(channel)
+            return ChannelResult(Channel=channel, Result=result, Error=None, Elapsed=time.perf_counter() - start)
+        except Exception as exc:
+            log.warning(f"Error sending to channel {channel}: {exc}")
+            return ChannelResult(Channel=channel, Result=None, Error=exc, Elapsed=time.perf_counter() - start)
+
+    results = await asyncio.gather(*(run(c) for c in channels))
+    if results:
+        log.debug("Fan out timings: " + ", ".join(f"{r['Channel']}={r['Elapsed'] * 1000:.1f}ms" for r in results))
+    return list(results)
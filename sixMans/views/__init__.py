@@ -1,14 +1,120 @@
+import asyncio
 import logging
+from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Callable
 
 import discord
 
+from sixMans.editor import CoalescingEditor
+
 if TYPE_CHECKING:
     from sixMans.game import Game
 
 log = logging.getLogger("red.sixMans.views")
 
 
+COMPONENT_PREFIX = "sixmans"
+
+
+def game_custom_id(kind: str, game_id: int | str, arg: object) -> str:
+    """Stable component ID for game prompts: `sixmans:<kind>:<game_id>:<arg>`."""
+    return f"{COMPONENT_PREFIX}:{kind}:{game_id}:{arg}"
+
+
+def custom_id_arg(custom_id: str) -> str:
+    """Return the trailing argument of a game component ID."""
+    return custom_id.rsplit(":", 1)[-1]
+
+
+def parse_game_custom_id(custom_id: str) -> tuple[str, str, str] | None:
+    """Split a game component ID into `(kind, game_id, arg)`. Returns None for other components."""
+    parts = custom_id.split(":", 3)
+    if len(parts) != 4 or parts[0] != COMPONENT_PREFIX:
+        return None
+    return parts[1], parts[2], parts[3]
+
+
+class GamePrompt(ABC):
+    """
+    Button prompt for a game, driven by the cog's component router.
+
+    Prompts are not registered with discord.py. Buttons are rendered by `build_view` and presses are
+    routed to `dispatch` by custom ID, so an open prompt is only its state on the game. The cog's prompt
+    ticker calls `expire` once `deadline` has passed.
+    """
+
+    kind: str = ""  # Custom ID kind handled by this prompt
+
+    def __init__(self, game: "Game", message_id: int | None = None):
+        self.game = game
+        self.channel: discord.TextChannel = game.textChannel
+        self.msg: discord.Message | discord.PartialMessage | None = None
+        if message_id and self.channel:
+            self.msg = self.channel.get_partial_message(message_id)
+        self.editor = CoalescingEditor()
+        self.timed_out = False
+        self._stopped = asyncio.Event()
+
+        # A new prompt replaces an open one of the same kind. The old one finishes as timed out.
+        previous = game.prompts.get(self.kind)
+        if previous:
+            previous.timed_out = True
+            previous.stop()
+        game.prompts[self.kind] = self
+
+    @property
+    def deadline(self) -> float | None:
+        """UTC timestamp after which the prompt times out."""
+        return None
+
+    def buttons(self) -> list[discord.ui.Button]:
+        return []
+
+    def build_view(self) -> discord.ui.View:
+        """Render the prompt buttons. The view is stopped so discord.py doesn't store or dispatch it."""
+        view = discord.ui.View(timeout=None)
+        for button in self.buttons():
+            view.add_item(button)
+        view.stop()
+        return view
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        """Return False to ignore a button press. Responsible for responding to the interaction."""
+        return True
+
+    async def dispatch(self, interaction: discord.Interaction, arg: str):
+        if not await self.interaction_check(interaction):
+            return
+        await self.handle(interaction, arg)
+
+    @abstractmethod
+    async def handle(self, interaction: discord.Interaction, arg: str):
+        """Handle a press of one of the prompt's buttons. `arg` is the trailing part of the button's custom ID."""
+
+    def stop(self):
+        self._stopped.set()
+        if self.game.prompts.get(self.kind) is self:
+            del self.game.prompts[self.kind]
+
+    def is_finished(self) -> bool:
+        return self._stopped.is_set()
+
+    async def wait(self) -> bool:
+        """Wait for the prompt to finish. Returns True if it timed out, like `View.wait()`."""
+        await self._stopped.wait()
+        return self.timed_out
+
+    async def expire(self):
+        if self.is_finished():
+            return
+        self.timed_out = True
+        self.stop()
+        await self.on_timeout()
+
+    async def on_timeout(self):
+        log.debug(f"{type(self).__name__} timed out. Game: {self.game.id}")
+
+
 class AuthorOnlyView(discord.ui.View):
     """View class designed to only interact with the interaction author"""
 
@@ -36,36 +142,6 @@ class AuthorOnlyView(discord.ui.View):
         return True
 
 
-class GameOnlyView(discord.ui.View):
-    """View class designed to only interact with the game players"""
-
-    def __init__(self, game: "Game", timeout: float = 60.0):
-        super().__init__()
-        self.timeout = timeout
-        self.game = game
-        self.msg: discord.Message
-
-    async def on_timeout(self):
-        """Display time out message if we have reference to original"""
-        if self.msg:
-            embed = discord.Embed(
-                title="Cancel Game",
-                description="Game cancel vote has timed out. Please try again.",
-                colour=discord.Colour.yellow(),
-            )
-
-            await self.msg.edit(embed=embed, view=None)
-
-    async def interaction_check(self, interaction: discord.Interaction) -> bool:
-        """Check if the interaction user is the author. Allow or deny callbacks"""
-        if not isinstance(interaction.user, discord.Member):
-            return False
-
-        if interaction.user in self.game.players:
-            return True
-        return False
-
-
 class ConfirmButton(discord.ui.Button):
     def __init__(self, callback: Callable | None = None):
         super().__init__()
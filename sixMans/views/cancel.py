@@ -1,11 +1,12 @@
 import logging
+import time
 from typing import TYPE_CHECKING
 
 import discord
 
 from sixMans.embeds import GreenEmbed, OrangeEmbed
 from sixMans.enums import CancelVote
-from sixMans.views import AuthorOnlyView, GameOnlyView
+from sixMans.views import AuthorOnlyView, GamePrompt, game_custom_id
 
 if TYPE_CHECKING:
     from sixMans.game import Game
@@ -13,13 +14,16 @@ if TYPE_CHECKING:
 log = logging.getLogger("red.sixMans.views.captains")
 
 
-class CancelView(GameOnlyView):
-    """Discord view for force cancelling a game"""
+class CancelView(GamePrompt):
+    """Prompt for players to vote on cancelling a game"""
+
+    kind = "cancel"
 
     def __init__(self, game: "Game", timeout=60.0):
-        super().__init__(game=game, timeout=timeout)
-        self.channel = game.textChannel
+        super().__init__(game)
+        self.timeout = timeout
         self.result = False
+        self._deadline: float | None = None
 
         # Calculate required votes
         if len(self.game.players) < 2:
@@ -35,9 +39,47 @@ class CancelView(GameOnlyView):
         for p in self.game.players:
             self.votes[p] = CancelVote.WAITING
 
+    @property
+    def deadline(self) -> float | None:
+        return self._deadline
+
+    def buttons(self) -> list[discord.ui.Button]:
+        return [
+            discord.ui.Button(label="Cancel", style=discord.ButtonStyle.red, custom_id=game_custom_id(self.kind, self.game.id, "cancel")),
+            discord.ui.Button(label="Play Out", style=discord.ButtonStyle.secondary, custom_id=game_custom_id(self.kind, self.game.id, "play")),
+        ]
+
+    async def handle(self, interaction: discord.Interaction, arg: str):
+        match arg:
+            case "cancel":
+                await self.confirm(interaction)
+            case "play":
+                await self.cancel(interaction)
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        """Only game players can vote"""
+        if not isinstance(interaction.user, discord.Member):
+            return False
+        if interaction.user not in self.game.players:
+            await interaction.response.send_message(content="You are not a valid player in this game.", ephemeral=True)
+            return False
+        return True
+
     async def prompt(self):
+        self._deadline = time.time() + self.timeout
         embed = await self.create_embed()
-        self.msg = await self.channel.send(embed=embed, view=self)
+        self.msg = await self.channel.send(embed=embed, view=self.build_view())
+
+    async def on_timeout(self):
+        """Display time out message if we have reference to original"""
+        if self.msg:
+            embed = discord.Embed(
+                title="Cancel Game",
+                description="Game cancel vote has timed out. Please try again.",
+                colour=discord.Colour.yellow(),
+            )
+
+            await self.editor.flush(self.msg, embed=embed, view=None)
 
     async def create_embed(self) -> discord.Embed:
         embed = OrangeEmbed(
@@ -59,8 +101,7 @@ class CancelView(GameOnlyView):
             return True
         return False
 
-    @discord.ui.button(label="Cancel", style=discord.ButtonStyle.red)
-    async def confirm(self, interaction: discord.Interaction, button: discord.ui.Button):
+    async def confirm(self, interaction: discord.Interaction):
         if not isinstance(interaction.user, discord.Member):
             return
 
@@ -75,15 +116,15 @@ class CancelView(GameOnlyView):
                 description="The game has been forcibly cancelled by a vote.",
             )
             cancel_embed.set_footer(text="This channel and the team voice channels will be deleted in 30 seconds.")
-            await self.msg.edit(embed=cancel_embed, view=None)
+            await self.editor.flush(self.msg, embed=cancel_embed, view=None)
             self.stop()
+            return
 
         # Update vote
         embed = await self.create_embed()
-        await self.msg.edit(embed=embed, view=self)
+        await self.editor.edit(self.msg, embed=embed, view=self.build_view())
 
-    @discord.ui.button(label="Play Out", style=discord.ButtonStyle.secondary)
-    async def cancel(self, interaction: discord.Interaction, button: discord.ui.Button):
+    async def cancel(self, interaction: discord.Interaction):
         if not isinstance(interaction.user, discord.Member):
             return
 
@@ -100,12 +141,13 @@ class CancelView(GameOnlyView):
                 title="Vote Failed",
                 description="The vote to cancel this game has failed. Please try again if this was a mistake.",
             )
-            await self.msg.edit(embed=play_embed, view=None)
+            await self.editor.flush(self.msg, embed=play_embed, view=None)
             self.stop()
+            return
 
         # Update vote
         embed = await self.create_embed()
-        await self.msg.edit(embed=embed, view=self)
+        await self.editor.edit(self.msg, embed=embed, view=self.build_view())
 
 
 class ForceCancelView(AuthorOnlyView):
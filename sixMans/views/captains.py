@@ -1,11 +1,14 @@
 import logging
 import random
+import time
 from pprint import pformat
 from typing import TYPE_CHECKING
 
 import discord
 
 from sixMans import utils
+from sixMans.draft import SUGGESTED_PICKS, auto_pick, rank_picks
+from sixMans.views import GamePrompt, custom_id_arg, game_custom_id
 
 if TYPE_CHECKING:
     from sixMans.game import Game
@@ -13,65 +16,93 @@ if TYPE_CHECKING:
 log = logging.getLogger("red.sixMans.views.captains")
 
 
-class CaptainsView(discord.ui.View):
+class CaptainsView(GamePrompt):
+    """
+    Captains pick.
+
+    Captains, teams and pick order are stored on the game, so the prompt can be rebuilt
+    for the original message after a restart.
+    """
+
+    kind = "pick"
+
     def __init__(self, game: "Game", helper: discord.Role | None = None):
-        super().__init__(timeout=None)
-        self.channel: discord.TextChannel = game.textChannel
-        self.game: "Game" = game
+        super().__init__(game, game.selection_message)
         self.helper: discord.Role | None = helper
-        self.pickable: list[discord.Member] = list(self.game.players)
-        self.orange: list[discord.Member] = []
-        self.blue: list[discord.Member] = []
         self.size = len(game.players)
         self.team_size = len(game.players) / 2
-        self.finished = False
+        self._scores: dict[discord.Member, float] | None = None
 
-        # Assign captains
-        self.captains = random.sample(list(self.pickable), 2)
-        log.debug(f"Captains: {[f'{p.id}: {p.display_name}' for p in self.captains]}")
+        # Embed
+        self.embed: discord.Embed
 
-        # Pick Order
-        self.pick_index = 0
-        self.pick_order: list[discord.Member] = []
-        self.build_snake_order()
+    @property
+    def deadline(self) -> float | None:
+        return self.game.pick_deadline
 
-        self.blue.append(self.captains[0])
-        self.pickable.remove(self.captains[0])
-        self.orange.append(self.captains[1])
-        self.pickable.remove(self.captains[1])
+    @property
+    def captains(self) -> list[discord.Member]:
+        return self.game.captains
 
-        # Blue captain picks first
-        self.picking = self.pick_order[0]
+    @property
+    def blue(self) -> list[discord.Member]:
+        return list(self.game.blue)
 
-        # Embed
-        self.embed: discord.Embed
+    @property
+    def orange(self) -> list[discord.Member]:
+        return list(self.game.orange)
 
-    async def on_interaction(self, interaction: discord.Interaction) -> bool:
-        if interaction.user != self.picking:
-            log.debug(f"{interaction.user} is not picking now...")
-            await interaction.response.send_message(
-                content=f"Please wait until {self.picking.display_name} has selected a player.",
-                ephemeral=True,
-            )
-            return False
-        return True
+    @property
+    def pickable(self) -> list[discord.Member]:
+        return [p for p in self.game.players if p not in self.game.blue and p not in self.game.orange]
+
+    @property
+    def pick_index(self) -> int:
+        return len(self.game.blue) + len(self.game.orange) - len(self.captains)
+
+    @property
+    def picking(self) -> discord.Member:
+        """Captain whose turn it is based on snake draft order."""
+        captain_id = self.game.pick_order[min(self.pick_index, len(self.game.pick_order) - 1)]
+        return next(c for c in self.captains if c.id == captain_id)
+
+    @property
+    def finished(self) -> bool:
+        return bool(self.game.pick_order) and not self.pickable
 
     async def start(self):
         """Start picks for captains"""
-        await self.update_embed()
+        # Assign captains
+        captains = random.sample(list(self.game.players), 2)
+        log.debug(f"Captains: {[f'{p.id}: {p.display_name}' for p in captains]}")
+        self.game.captains = captains
+        self.game.blue = {captains[0]}
+        self.game.orange = {captains[1]}
 
-        # Add player buttons
-        for p in self.pickable:
-            log.debug(f"Creating button for {p.display_name}")
-            button: discord.ui.Button = discord.ui.Button(
+        # Pick Order. Blue captain picks first
+        self.game.pick_order = [c.id for c in self.build_snake_order()]
+        self.game.pick_deadline = self.next_deadline()
+
+        await self.update_embed()
+        self.msg = await self.channel.send(embed=self.embed, view=self.build_view())
+        self.game.selection_message = self.msg.id
+        await self.game.save()
+
+    def buttons(self) -> list[discord.ui.Button]:
+        """Player buttons. Players already on a team keep a disabled button."""
+        return [
+            discord.ui.Button(
                 label=p.display_name,
-                custom_id=str(p.id),
+                custom_id=game_custom_id(self.kind, self.game.id, p.id),
                 style=discord.ButtonStyle.primary,
+                disabled=p in self.game.blue or p in self.game.orange,
             )
-            button.callback = self.process_pick  # type: ignore
-            self.add_item(button)
+            for p in self.game.players
+            if p not in self.captains
+        ]
 
-        self.msg = await self.channel.send(embed=self.embed, view=self)
+    async def handle(self, interaction: discord.Interaction, arg: str):
+        await self.process_pick(interaction)
 
     def build_snake_order(self) -> list:
         """
@@ -81,39 +112,24 @@ class CaptainsView(discord.ui.View):
             raise ValueError("Exactly 2 captains required")
 
         first, second = self.captains
-        self.pick_order = []
+        pick_order: list[discord.Member] = []
 
         total_picks = self.size - 2  # Exclude captains from pick order
 
-        while len(self.pick_order) < total_picks:
+        while len(pick_order) < total_picks:
             # Forward
-            self.pick_order.append(first)
-            if len(self.pick_order) < total_picks:
-                self.pick_order.append(second)
+            pick_order.append(first)
+            if len(pick_order) < total_picks:
+                pick_order.append(second)
 
             # Reverse (snake)
-            if len(self.pick_order) < total_picks:
-                self.pick_order.append(second)
-            if len(self.pick_order) < total_picks:
-                self.pick_order.append(first)
-
-        log.debug("Pick Order: " + " -> ".join(p.display_name for p in self.pick_order))
-        return self.pick_order[:total_picks]
-
-    async def swap_picking(self):
-        for captain in self.captains:
-            if self.picking != captain:
-                self.picking = captain
-                log.debug(f"Now picking: {self.picking}")
-                break
+            if len(pick_order) < total_picks:
+                pick_order.append(second)
+            if len(pick_order) < total_picks:
+                pick_order.append(first)
 
-    async def advance_pick(self):
-        """Advance to the next captain based on snake draft order."""
-        self.pick_index += 1
-
-        if self.pick_index < len(self.pick_order):
-            self.picking = self.pick_order[self.pick_index]
-            log.debug(f"Now picking: {self.picking}")
+        log.debug("Pick Order: " + " -> ".join(p.display_name for p in pick_order))
+        return pick_order[:total_picks]
 
     async def process_pick(self, interaction: discord.Interaction, **kwargs):
         """Process a game mode vote from button press"""
@@ -134,7 +150,7 @@ class CaptainsView(discord.ui.View):
             await interaction.response.send_message(content="It's not your turn to pick. Please wait...", ephemeral=True)
             return
 
-        pick_id = int(interaction.data["custom_id"])  # type: ignore
+        pick_id = int(custom_id_arg(interaction.data["custom_id"]))  # type: ignore
         pick = await self.find_player_by_id(pick_id)
         if not pick:
             await interaction.response.send_message(
@@ -144,96 +160,86 @@ class CaptainsView(discord.ui.View):
             return
         log.debug(f"{interaction.user.display_name} picked {pick.display_name}")
 
-        # Remove player from pickable as soon as possible. Help alleviate a race condition
-        self.pickable.remove(pick)
-
         # Validate teams aren't already full before assigning player to team
-        if self.picking in self.blue:
-            if len(self.blue) >= self.team_size:
-                log.debug(f"Blue team already has {self.team_size} players on it.")
-                await interaction.response.send_message(
-                    content=f"You already have the maximum number of players ({self.team_size})",
-                    ephemeral=True,
-                )
-                # Something is wrong, try switching the picking captain
-                await self.swap_picking()
-                return
-            self.blue.append(pick)
-        else:
-            if len(self.orange) >= self.team_size:
-                log.debug(f"Orange team already has {self.team_size} players on it.")
-                await interaction.response.send_message(
-                    content=f"You already have the maximum number of players ({self.team_size})",
-                    ephemeral=True,
-                )
-                # Something is wrong, try switching the picking captain
-                await self.swap_picking()
-                return
-            self.orange.append(pick)
-
-        self.embed.clear_fields()
-        self.embed.add_field(name="Blue Team", value=utils.format_team_mentions(self.blue, self.captains), inline=True)
-        self.embed.add_field(
-            name="Orange Team",
-            value=utils.format_team_mentions(self.orange, self.captains),
-            inline=True,
-        )
-
-        # Disable buttons here
-        for b in self.children:
-            log.debug(f"Child Type: {type(b)}")
-            log.debug(f"Child Data: {b}")
+        team = self.game.blue if self.picking in self.game.blue else self.game.orange
+        if len(team) >= self.team_size:
+            log.debug(f"{self.picking.display_name}'s team already has {self.team_size} players on it.")
+            await interaction.response.send_message(
+                content=f"You already have the maximum number of players ({self.team_size})",
+                ephemeral=True,
+            )
+            return
 
-            # Validate child is a button
-            if not isinstance(b, discord.ui.Button):
-                log.debug("Not a button")
-                continue
+        if not await self.assign_pick(pick):
+            await interaction.response.send_message("Unable to assign final player to a team. Please open a modmail or contact 6 mans help role.")
+            return
 
-            if not b.custom_id:
-                log.warning(f"Unknown button without an ID in captain selection. Label: {b.label}")
-                continue
+        await interaction.response.defer(thinking=False, ephemeral=True)
 
-            log.debug(f"Button ID: {b.custom_id}")
-            log.debug(f"Pick: {pick_id}")
+    async def assign_pick(self, pick: discord.Member) -> bool:
+        """Add a player to the team of the captain on the clock and move the draft on."""
+        team = self.game.blue if self.picking in self.game.blue else self.game.orange
 
-            if int(b.custom_id) == pick_id:
-                log.debug(f"Disabling {pick} button")
-                b.disabled = True
+        # Assign the player before anything is awaited. Help alleviate a race condition
+        team.add(pick)
 
         # Automatically process last pick
-        if len(self.pickable) == 1:
+        pickable = self.pickable
+        if len(pickable) == 1:
             log.debug("Auto processing last pick")
-            if len(self.blue) < self.team_size:
-                self.blue.append(self.pickable[0])
-            elif len(self.orange) < self.team_size:
-                self.orange.append(self.pickable[0])
+            if len(self.game.blue) < self.team_size:
+                self.game.blue.add(pickable[0])
+            elif len(self.game.orange) < self.team_size:
+                self.game.orange.add(pickable[0])
             else:
                 log.error(f"[{self.game.id}] Can't assign last pick. Both teams are full... ")
-                await interaction.response.send_message("Unable to assign final player to a team. Please open a modmail or contact 6 mans help role.")
-                return
-            self.pickable = []
+                return False
 
-        # Swap picking captain
-        await self.advance_pick()
+        # Restart the pick clock for the next pick
+        self.game.pick_deadline = None if self.finished else self.next_deadline()
 
         # Update embed
         await self.update_embed()
 
-        if len(self.pickable) == 0:
+        if self.finished:
             log.debug("Captains have finished selecting teams.")
-            await self.msg.edit(embed=self.embed, view=None)
-            self.finished = True
+            await self.editor.flush(self.msg, embed=self.embed, view=None)
             self.stop()
         else:
-            await self.msg.edit(embed=self.embed, view=self)
+            await self.game.save()
+            await self.editor.edit(self.msg, embed=self.embed, view=self.build_view())
+        return True
 
-        await interaction.response.defer(thinking=False, ephemeral=True)
+    async def expire(self):
+        """The pick clock ran out. Pick the best remaining player for the captain on the clock."""
+        if self.is_finished() or not self.pickable:
+            return
+        pick = auto_pick(self.pickable, self.scores)
+        if not pick:
+            return
+        log.info(f"[{self.game.id}] Pick clock expired. Auto picking {pick.display_name} for {self.picking.display_name}")
+        await self.assign_pick(pick)
+
+    def next_deadline(self) -> float | None:
+        if not self.game.pick_time:
+            return None
+        return time.time() + self.game.pick_time
+
+    @property
+    def scores(self) -> dict[discord.Member, float]:
+        """Player scores used to rank picks. Calculated once per draft."""
+        if self._scores is None:
+            self._scores = {p: data["Score"] for p, data in self.game.get_player_scores().items()}
+        return self._scores
 
     async def update_embed(self):
-        if len(self.pickable) == 0:
+        pickable = self.pickable
+        if len(pickable) == 0:
             desc = "Teams have been selected!"
         else:
             desc = f"{self.picking.mention}, please select a player."
+            if self.game.pick_deadline:
+                desc += f" The best available player will be picked automatically <t:{int(self.game.pick_deadline)}:R>."
 
         self.embed = discord.Embed(
             title="Captains Pick",
@@ -249,6 +255,15 @@ class CaptainsView(discord.ui.View):
             inline=True,
         )
 
+        # Ranked suggestions for the captain on the clock
+        if len(pickable) > 1:
+            suggestions = rank_picks(pickable, self.scores)[:SUGGESTED_PICKS]
+            self.embed.add_field(
+                name="Suggested Picks",
+                value="\n".join(f"{i}. {p.mention}" for i, p in enumerate(suggestions, start=1)),
+                inline=False,
+            )
+
         # Add help information
         if self.game.helper_role:
             self.embed.set_footer(
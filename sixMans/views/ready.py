@@ -0,0 +1,102 @@
+import asyncio
+import contextlib
+import logging
+import time
+from typing import TYPE_CHECKING
+
+import discord
+
+from sixMans.editor import CoalescingEditor
+from sixMans.metrics import rest
+
+if TYPE_CHECKING:
+    from sixMans.queue import SixMansQueue
+
+log = logging.getLogger("red.sixMans.views.ready")
+
+READY_CHECK_TIMEOUT = 30  # Time popped players have to accept the ready check (seconds)
+
+
+class ReadyCheckView(discord.ui.View):
+    """
+    Ready check posted in the queue channels when a queue pops, before any game channels are created.
+
+    Finishes once every player has accepted or declined, or when the deadline passes. Players who declined
+    or didn't answer are listed by `missing`.
+    """
+
+    def __init__(self, queue: "SixMansQueue", players: list[discord.Member], timeout: float = READY_CHECK_TIMEOUT):
+        # The deadline is absolute, so the inactivity timeout of the view is not used
+        super().__init__(timeout=None)
+        self.queue = queue
+        self.players = players
+        self.ready: set[discord.Member] = set()
+        self.declined: set[discord.Member] = set()
+        self.deadline = time.time() + timeout
+        self.messages: list[discord.Message] = []
+        self.editors: list[CoalescingEditor] = []
+
+    @property
+    def missing(self) -> list[discord.Member]:
+        return [p for p in self.players if p not in self.ready]
+
+    async def run(self):
+        """Post the ready check and wait until everyone has answered or the deadline passes."""
+        results = await self.queue.fan_out(lambda channel: rest("send_message", channel.send(" ".join(p.mention for p in self.players), embed=self.build_embed(), view=self)))
+        self.messages = [r["Result"] for r in results if r["Error"] is None]
+        self.editors = [CoalescingEditor() for _ in self.messages]
+
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self.wait(), timeout=max(self.deadline - time.time(), 0))
+        self.stop()
+        log.debug(f"Ready check finished. Queue: {self.queue.name} Ready: {len(self.ready)}/{len(self.players)}")
+        for msg, editor in zip(self.messages, self.editors, strict=True):
+            await editor.flush(msg, embed=self.build_embed(final=True), view=None)
+
+    def build_embed(self, final: bool = False) -> discord.Embed:
+        if not final:
+            description = f"The **{self.queue.name}** queue popped! Accept <t:{int(self.deadline)}:R> to play."
+            color = discord.Color.blue()
+        elif self.missing:
+            description = "Not everyone was ready. Players who declined or didn't answer have been removed from the queue."
+            color = discord.Color.orange()
+        else:
+            description = "Everyone is ready! The game is being created."
+            color = discord.Color.green()
+
+        embed = discord.Embed(title="Ready Check", description=description, color=color)
+        embed.add_field(name="Players", value="\n".join(f"{self._status(p)} {p.mention}" for p in self.players), inline=False)
+        return embed
+
+    def _status(self, player: discord.Member) -> str:
+        if player in self.ready:
+            return "\N{WHITE HEAVY CHECK MARK}"
+        if player in self.declined:
+            return "\N{CROSS MARK}"
+        return "\N{HOURGLASS WITH FLOWING SAND}"
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user not in self.players:
+            await interaction.response.send_message("This ready check isn't for you.", ephemeral=True)
+            return False
+        return True
+
+    @discord.ui.button(label="Accept", style=discord.ButtonStyle.success)
+    async def accept(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.declined.discard(interaction.user)  # type: ignore[arg-type]
+        self.ready.add(interaction.user)  # type: ignore[arg-type]
+        await self._answered(interaction)
+
+    @discord.ui.button(label="Decline", style=discord.ButtonStyle.red)
+    async def decline(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.ready.discard(interaction.user)  # type: ignore[arg-type]
+        self.declined.add(interaction.user)  # type: ignore[arg-type]
+        await self._answered(interaction)
+
+    async def _answered(self, interaction: discord.Interaction):
+        await interaction.response.defer()
+        if len(self.ready) + len(self.declined) == len(self.players):
+            self.stop()
+            return
+        for msg, editor in zip(self.messages, self.editors, strict=True):
+            await editor.edit(msg, embed=self.build_embed())
@@ -1,39 +1,70 @@
 import logging
+import time
 from typing import TYPE_CHECKING
 
 import discord
 
 from sixMans.enums import Winner
-from sixMans.views import AuthorOnlyView
+from sixMans.views import AuthorOnlyView, GamePrompt, game_custom_id
 
 if TYPE_CHECKING:
     from sixMans.game import Game
 
 log = logging.getLogger("red.sixMans.views.score")
 
+SCORE_REPORT_TIMEOUT = 120  # Time captains have to confirm a score report (seconds)
 
-class ScoreReportView(discord.ui.View):
-    """Discord view for reporting a game score"""
+
+class ScoreReportView(GamePrompt):
+    """
+    Prompt for reporting a game score.
+
+    Captain answers are stored on the game, so the prompt can be rebuilt for the original message after a restart.
+    """
+
+    kind = "score"
 
     def __init__(self, game: "Game"):
-        super().__init__(timeout=120.0)
+        super().__init__(game, game.score_message)
         self.captains = game.captains
-        self.game = game
-        self.channel = game.textChannel
-        self.answers: dict[discord.Member, Winner] = {}
         self.result = Winner.PENDING
         self.cancelled = False
 
-        for c in self.captains:
-            self.answers[c] = Winner.PENDING
+    @property
+    def deadline(self) -> float | None:
+        return self.game.score_deadline
+
+    def buttons(self) -> list[discord.ui.Button]:
+        return [
+            discord.ui.Button(label="Blue", style=discord.ButtonStyle.blurple, custom_id=game_custom_id(self.kind, self.game.id, "blue")),
+            discord.ui.Button(label="Orange", style=discord.ButtonStyle.green, custom_id=game_custom_id(self.kind, self.game.id, "orange")),
+            discord.ui.Button(label="Cancel", style=discord.ButtonStyle.red, custom_id=game_custom_id(self.kind, self.game.id, "cancel")),
+        ]
+
+    async def handle(self, interaction: discord.Interaction, arg: str):
+        match arg:
+            case "blue":
+                await self.report_blue(interaction)
+            case "orange":
+                await self.report_orange(interaction)
+            case "cancel":
+                await self.cancel_report(interaction)
+
+    @property
+    def answers(self) -> dict[discord.Member, Winner]:
+        return {c: self.game.score_report.get(c.id, Winner.PENDING) for c in self.captains}
 
     async def prompt(self):
+        self.game.score_report = {}
+        self.game.score_deadline = time.time() + SCORE_REPORT_TIMEOUT
         await self.update_embed()
         captains_mention = " ".join(c.mention for c in self.captains)
         if not self.channel:
             log.error("No text channel found for game {}. Cannot prompt score report.".format(self.game.id))
             return
-        self.msg = await self.channel.send(content=captains_mention, embed=self.embed, view=self, allowed_mentions=discord.AllowedMentions(users=True))
+        self.msg = await self.channel.send(content=captains_mention, embed=self.embed, view=self.build_view(), allowed_mentions=discord.AllowedMentions(users=True))
+        self.game.score_message = self.msg.id
+        await self.game.save()
 
     async def update_embed(self):
         selections = []
@@ -54,18 +85,18 @@ class ScoreReportView(discord.ui.View):
                 colour=discord.Colour.yellow(),
             )
 
-            await self.msg.edit(embed=embed, view=None)
+            await self.editor.flush(self.msg, embed=embed, view=None)
 
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         """Check if the interaction user is a game captain"""
         if not isinstance(interaction.user, discord.Member):
             return False
         if interaction.user not in self.captains:
+            await interaction.response.send_message("Only game captains can report the score.", ephemeral=True)
             return False
         return True
 
-    @discord.ui.button(label="Blue", style=discord.ButtonStyle.blurple)
-    async def report_blue(self, interaction: discord.Interaction, button: discord.ui.Button):
+    async def report_blue(self, interaction: discord.Interaction):
         if not isinstance(interaction.user, discord.Member):
             return
 
@@ -77,11 +108,12 @@ class ScoreReportView(discord.ui.View):
             return
 
         # Update Embed
-        self.answers[interaction.user] = Winner.BLUE
+        self.game.score_report[interaction.user.id] = Winner.BLUE
         await self.update_embed()
-        await self.msg.edit(embed=self.embed, view=self)
+        await self.editor.edit(self.msg, embed=self.embed, view=self.build_view())
 
         if not await self.both_captains_reported():
+            await self.game.save()
             await interaction.response.defer(thinking=False, ephemeral=True)
             return
 
@@ -91,15 +123,14 @@ class ScoreReportView(discord.ui.View):
                 description="The captains did not select a winner unanimously. Please try again...",
                 color=discord.Color.red(),
             )
-            await self.msg.edit(embed=embed, view=None)
+            await self.editor.flush(self.msg, embed=embed, view=None)
             self.stop()
             return
 
         # Finish and display winner
         await self.display_winner()
 
-    @discord.ui.button(label="Orange", style=discord.ButtonStyle.green)
-    async def report_orange(self, interaction: discord.Interaction, button: discord.ui.Button):
+    async def report_orange(self, interaction: discord.Interaction):
         if not isinstance(interaction.user, discord.Member):
             return
 
@@ -111,11 +142,12 @@ class ScoreReportView(discord.ui.View):
             return
 
         # Update Embed
-        self.answers[interaction.user] = Winner.ORANGE
+        self.game.score_report[interaction.user.id] = Winner.ORANGE
         await self.update_embed()
-        await self.msg.edit(embed=self.embed, view=self)
+        await self.editor.edit(self.msg, embed=self.embed, view=self.build_view())
 
         if not await self.both_captains_reported():
+            await self.game.save()
             await interaction.response.defer(thinking=False, ephemeral=True)
             return
 
@@ -125,7 +157,7 @@ class ScoreReportView(discord.ui.View):
                 description="The captains did not select a winner unanimously. Please try again...",
                 color=discord.Color.red(),
             )
-            await self.msg.edit(embed=embed, view=None)
+            await self.editor.flush(self.msg, embed=embed, view=None)
             self.stop()
             return
 
@@ -140,11 +172,12 @@ class ScoreReportView(discord.ui.View):
             return
 
         # Update Embed
-        self.answers[member] = winner
+        self.game.score_report[member.id] = winner
         await self.update_embed()
-        await self.msg.edit(embed=self.embed, view=self)
+        await self.editor.edit(self.msg, embed=self.embed, view=self.build_view())
 
         if not await self.both_captains_reported():
+            await self.game.save()
             return
 
         if not await self.unanimous_vote():
@@ -153,15 +186,14 @@ class ScoreReportView(discord.ui.View):
                 description="The captains did not select a winner unanimously. Please try again...",
                 color=discord.Color.red(),
             )
-            await self.msg.edit(embed=embed, view=None)
+            await self.editor.flush(self.msg, embed=embed, view=None)
             self.stop()
             return
 
         # Finish and display winner
         await self.display_winner()
 
-    @discord.ui.button(label="Cancel", style=discord.ButtonStyle.red)
-    async def cancel_report(self, interaction: discord.Interaction, button: discord.ui.Button):
+    async def cancel_report(self, interaction: discord.Interaction):
         if not isinstance(interaction.user, discord.Member):
             return
 
@@ -172,7 +204,7 @@ class ScoreReportView(discord.ui.View):
             description=f"{interaction.user.mention} has cancelled score reporting.",
             color=discord.Color.red(),
         )
-        await self.msg.edit(embed=embed, view=None)
+        await self.editor.flush(self.msg, embed=embed, view=None)
         self.stop()
 
     async def unanimous_vote(self) -> bool:
@@ -202,7 +234,7 @@ class ScoreReportView(discord.ui.View):
         )
 
         embed.set_footer(text="This channel and the team voice channels will be deleted in 30 seconds.")
-        await self.msg.edit(embed=embed, view=None)
+        await self.editor.flush(self.msg, embed=embed, view=None)
         self.stop()
 
 
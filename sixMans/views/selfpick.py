@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 import discord
 
 from sixMans.utils import get_emoji
+from sixMans.views import GamePrompt, game_custom_id
 
 if TYPE_CHECKING:
     from sixMans.game import Game
@@ -11,21 +12,52 @@ if TYPE_CHECKING:
 log = logging.getLogger("red.sixMans.views.selfpick")
 
 
-class SelfPickingView(discord.ui.View):
+class SelfPickingView(GamePrompt):
+    """
+    Self picking.
+
+    Teams are stored on the game, so the prompt can be rebuilt for the original message after a restart.
+    """
+
+    kind = "team"
+
     def __init__(self, game: "Game", helper: discord.Role | None = None):
-        super().__init__(timeout=None)
-        self.channel: discord.TextChannel = game.textChannel
-        self.game: "Game" = game
+        super().__init__(game, game.selection_message)
         self.helper: discord.Role | None = helper
         self.players: list[discord.Member] = list(self.game.players)
-        self.unplaced: list[discord.Member] = list(self.game.players)
-        self.orange: list[discord.Member] = []
-        self.blue: list[discord.Member] = []
         self.size = len(game.players)
         self.team_size = len(game.players) / 2
-        self.finished = False
 
-    async def on_interaction(self, interaction: discord.Interaction) -> bool:
+    @property
+    def blue(self) -> list[discord.Member]:
+        return list(self.game.blue)
+
+    @property
+    def orange(self) -> list[discord.Member]:
+        return list(self.game.orange)
+
+    @property
+    def unplaced(self) -> list[discord.Member]:
+        return [p for p in self.players if p not in self.game.blue and p not in self.game.orange]
+
+    @property
+    def finished(self) -> bool:
+        return bool(self.players) and not self.unplaced
+
+    def buttons(self) -> list[discord.ui.Button]:
+        return [
+            discord.ui.Button(label="Blue", style=discord.ButtonStyle.blurple, emoji=chr(0x1F535), custom_id=game_custom_id(self.kind, self.game.id, "blue")),
+            discord.ui.Button(label="Orange", style=discord.ButtonStyle.gray, emoji=chr(0x1F7E0), custom_id=game_custom_id(self.kind, self.game.id, "orange")),
+        ]
+
+    async def handle(self, interaction: discord.Interaction, arg: str):
+        match arg:
+            case "blue":
+                await self.pick_blue(interaction)
+            case "orange":
+                await self.pick_orange(interaction)
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
         if interaction.user not in self.players:
             await interaction.response.send_message(
                 content="You are not an active player in this game...",
@@ -37,7 +69,9 @@ class SelfPickingView(discord.ui.View):
     async def prompt(self):
         """Start self picking"""
         await self.update_embed()
-        self.msg = await self.channel.send(embed=self.embed, view=self)
+        self.msg = await self.channel.send(embed=self.embed, view=self.build_view())
+        self.game.selection_message = self.msg.id
+        await self.game.save()
 
     async def update_embed(self):
         self.embed = discord.Embed(
@@ -84,8 +118,7 @@ class SelfPickingView(discord.ui.View):
             return True
         return False
 
-    @discord.ui.button(label="Blue", style=discord.ButtonStyle.blurple, emoji=chr(0x1F535))
-    async def pick_blue(self, interaction: discord.Interaction, button: discord.ui.Button):
+    async def pick_blue(self, interaction: discord.Interaction):
         if not isinstance(interaction.user, discord.Member):
             return
 
@@ -97,20 +130,19 @@ class SelfPickingView(discord.ui.View):
             await interaction.response.send_message("Blue team is already full.", ephemeral=True)
             return
 
-        self.blue.append(interaction.user)
-        self.unplaced.remove(interaction.user)
+        self.game.blue.add(interaction.user)
         await self.update_embed()
 
-        if len(self.unplaced) == 0:
-            await self.msg.edit(embed=self.embed, view=None)
+        if self.finished:
+            await self.editor.flush(self.msg, embed=self.embed, view=None)
             self.stop()
         else:
-            await self.msg.edit(embed=self.embed, view=self)
+            await self.game.save()
+            await self.editor.edit(self.msg, embed=self.embed, view=self.build_view())
 
         await interaction.response.defer(thinking=False, ephemeral=True)
 
-    @discord.ui.button(label="Orange", style=discord.ButtonStyle.gray, emoji=chr(0x1F7E0))
-    async def pick_orange(self, interaction: discord.Interaction, button: discord.ui.Button):
+    async def pick_orange(self, interaction: discord.Interaction):
         if not isinstance(interaction.user, discord.Member):
             return
 
@@ -122,14 +154,14 @@ class SelfPickingView(discord.ui.View):
             await interaction.response.send_message("Orange team is already full.", ephemeral=True)
             return
 
-        self.orange.append(interaction.user)
-        self.unplaced.remove(interaction.user)
+        self.game.orange.add(interaction.user)
         await self.update_embed()
 
-        if len(self.unplaced) == 0:
-            await self.msg.edit(embed=self.embed, view=None)
+        if self.finished:
+            await self.editor.flush(self.msg, embed=self.embed, view=None)
             self.stop()
         else:
-            await self.msg.edit(embed=self.embed, view=self)
+            await self.game.save()
+            await self.editor.edit(self.msg, embed=self.embed, view=self.build_view())
 
         await interaction.response.defer(thinking=False, ephemeral=True)
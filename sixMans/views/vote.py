@@ -1,40 +1,78 @@
 import logging
+import time
 from typing import TYPE_CHECKING
 
 import discord
 
 from sixMans.enums import GameMode
+from sixMans.views import GamePrompt, custom_id_arg, game_custom_id
 
 if TYPE_CHECKING:
     from sixMans.game import Game
 
 log = logging.getLogger("red.sixMans.views.vote")
 
+VOTE_TIMEOUT = 900  # Time players have to vote on a game mode (seconds)
+
+
+class GameModeVote(GamePrompt):
+    """
+    Game mode vote.
+
+    Votes are stored on the game, so the prompt can be rebuilt for the original message after a restart.
+    """
+
+    kind = "vote"
 
-class GameModeVote(discord.ui.View):
     def __init__(self, game: "Game", helper: discord.Role | None = None):
-        super().__init__(timeout=900.0)
-        self.channel: discord.TextChannel = game.textChannel
-        self.game: "Game" = game
+        super().__init__(game, game.selection_message)
         self.helper: discord.Role | None = helper
         self.options: list[str] = GameMode.to_options()
-        self.picked: list[discord.Member] = []
         self.result: GameMode | None = None
-        self.votes: dict = GameMode.to_dict()
         self.size = len(game.players)
-        log.debug(f"Starting game mode vote: {self.channel}")
+        log.debug(f"Game mode vote: {self.channel}")
+
+    @property
+    def deadline(self) -> float | None:
+        return self.game.vote_deadline
+
+    def buttons(self) -> list[discord.ui.Button]:
+        return [
+            discord.ui.Button(
+                label=mode.value,
+                custom_id=game_custom_id(self.kind, self.game.id, mode.value),
+                style=discord.ButtonStyle.primary,
+            )
+            for mode in GameMode.to_dict()
+        ]
+
+    async def handle(self, interaction: discord.Interaction, arg: str):
+        await self.process_vote(interaction)
+
+    @property
+    def votes(self) -> dict[GameMode, int]:
+        votes: dict[GameMode, int] = GameMode.to_dict()
+        for mode in self.game.mode_votes.values():
+            votes[mode] += 1
+        return votes
 
     async def start(self):
         """Initiate voting for game mode."""
-        self.embed = discord.Embed(
+        self.game.mode_votes = {}
+        self.game.vote_deadline = time.time() + VOTE_TIMEOUT
+        self.msg = await self.channel.send(embed=self.build_embed(), view=self.build_view())
+        self.game.selection_message = self.msg.id
+        await self.game.save()
+
+    def build_embed(self) -> discord.Embed:
+        embed = discord.Embed(
             title="Game Mode Vote",
             description="Please vote for your preferred game mode!",
             color=discord.Color.blue(),
         )
-        self.embed.set_footer(text=f"Game ID: {self.game.id}")
 
-        self.embed.add_field(name="Game Mode", value="\n".join(self.options), inline=True)
-        self.embed.add_field(
+        embed.add_field(name="Game Mode", value="\n".join(self.options), inline=True)
+        embed.add_field(
             name="Votes",
             value="\n".join([str(v) for v in self.votes.values()]),
             inline=True,
@@ -43,26 +81,15 @@ class GameModeVote(discord.ui.View):
         # Add 6 Mans helper role if available.
         log.debug(f"6 Mans Helper: {type(self.game.helper_role)} {self.game.helper_role}")
         if self.game.helper_role:
-            self.embed.set_footer(
+            embed.set_footer(
                 text=(
                     f"If you need help or have questions please contact someone with the {self.game.helper_role.name} role. "
                     "For suggestions or improvements, reach out to the RSC Development Committee."
                 )
             )
         else:
-            self.embed.set_footer(text=("If you encounter any issues with the RSC 6 Mans bot or have suggestions. Please contact the RSC Development Committee."))
-
-        # Create Buttons
-        for mode in self.votes:
-            log.debug(f"Adding game mode button: {mode}")
-            button: discord.ui.Button = discord.ui.Button(
-                label=mode.value,
-                custom_id=mode.value,
-                style=discord.ButtonStyle.primary,
-            )
-            button.callback = self.process_vote  # type: ignore
-            self.add_item(button)
-        self.msg = await self.channel.send(embed=self.embed, view=self)
+            embed.set_footer(text=("If you encounter any issues with the RSC 6 Mans bot or have suggestions. Please contact the RSC Development Committee."))
+        return embed
 
     async def process_vote(self, interaction: discord.Interaction):
         """Process a game mode vote from button press"""
@@ -71,37 +98,28 @@ class GameModeVote(discord.ui.View):
             return
 
         log.debug(f"Interaction Data Type: {type(interaction.data)}")
-        mode = GameMode(interaction.data["custom_id"])  # type: ignore
+        mode = GameMode(custom_id_arg(interaction.data["custom_id"]))  # type: ignore
         log.debug(f"{interaction.user} vote: {mode}")
         # Check if user has already voted.
-        if interaction.user in self.picked:
+        if interaction.user.id in self.game.mode_votes:
             log.debug(f"{interaction.user} has already voted.")
             await interaction.response.send_message(
                 content="You've already voted.",
                 ephemeral=True,
             )
             return
-        self.picked.append(interaction.user)
-
-        self.votes[mode] += 1
+        self.game.mode_votes[interaction.user.id] = mode
         log.debug(self.votes)
 
-        # Remove and re-add Votes field. Issues with updating in place.
-        self.embed.remove_field(1)
-        self.embed.add_field(
-            name="Votes",
-            value="\n".join([str(v) for v in self.votes.values()]),
-            inline=True,
-        )
-
+        # Defer interaction and update embed
+        await interaction.response.defer()
         if self.vote_finished:
             log.debug("Game mode vote Finished.")
             self.stop()
-            await self.msg.edit(embed=self.embed, view=None)
-
-        # Defer interaction and update embed
-        await interaction.response.defer()
-        await self.msg.edit(embed=self.embed)
+            await self.editor.flush(self.msg, embed=self.build_embed(), view=None)
+        else:
+            await self.game.save()
+            await self.editor.edit(self.msg, embed=self.build_embed())
 
     async def on_timeout(self):
         """Pick the leading game mode when the vote times out."""
@@ -118,12 +136,14 @@ class GameModeVote(discord.ui.View):
             description=f"Vote timed out. **{self.result.value}** has been selected.",
             color=discord.Color.yellow(),
         )
-        await self.msg.edit(embed=embed, view=None)
+        if self.msg:
+            await self.editor.flush(self.msg, embed=embed, view=None)
 
     @property
     def vote_finished(self) -> bool:
-        top_mode = max(self.votes, key=self.votes.get)  # type: ignore
-        if len(self.picked) == self.size or self.votes[top_mode] > (self.size / 2):
+        votes = self.votes
+        top_mode = max(votes, key=votes.get)  # type: ignore
+        if len(self.game.mode_votes) == self.size or votes[top_mode] > (self.size / 2):
             self.result = top_mode
             return True
         else:
@@ -48,6 +48,7 @@ def make_text_channel() -> MagicMock:
     msg = MagicMock(spec=discord.Message)
     msg.edit = AsyncMock()
     channel.send.return_value = msg
+    channel.get_partial_message.return_value = msg
     return channel
 
 
@@ -77,6 +78,22 @@ class FakeGame:
         self.helper_role = None
         self.queue = FakeQueue()
         self.id = "test-game-id"
+        self.blue = set()
+        self.orange = set()
+        self.selection_message = None
+        self.mode_votes = {}
+        self.vote_deadline = None
+        self.pick_order = []
+        self.pick_time = 0
+        self.pick_deadline = None
+        self.score_message = None
+        self.score_report = {}
+        self.score_deadline = None
+        self.prompts = {}
+        self.save = AsyncMock()
+
+    def get_player_scores(self):
+        return {p: {"Rank": 1, "QWP": None, "Score": 1} for p in self.players}
 
 
 # ---------------------------------------------------------------------------
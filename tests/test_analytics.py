@@ -0,0 +1,222 @@
+"""Tests for per-queue wait time and throughput analytics (sixMans/analytics.py)."""
+
+import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import discord
+import pytest
+
+from sixMans.analytics import (
+    ANALYTICS_WINDOW_DAYS,
+    HOURS_PER_WEEK,
+    WAIT_BUCKET_COUNT,
+    WAIT_BUCKETS,
+    QueueAnalytics,
+    _epoch_day,
+    _epoch_hour,
+    _epoch_hour_of_week,
+    format_eta,
+    format_hour_of_week,
+    hour_of_week,
+)
+from sixMans.queue import SixMansQueue
+from sixMans.sixMans import SixMans
+
+from .conftest import make_member
+
+# A Monday
+NOW = datetime.datetime(2026, 10, 19, 20, 30, tzinfo=datetime.timezone.utc)
+
+
+def test_wait_histogram_and_percentiles():
+    stats = QueueAnalytics()
+    stats.record_pop([10, 20, 45, 90, 5000], NOW)
+
+    slot = _epoch_day(NOW) % ANALYTICS_WINDOW_DAYS * WAIT_BUCKET_COUNT
+    assert stats.wait_histogram[slot : slot + WAIT_BUCKET_COUNT].tolist() == [2, 1, 1, 0, 0, 0, 0, 0, 1]
+    assert stats.average_wait(NOW) == (10 + 20 + 45 + 90 + 5000) / 5
+    assert stats.wait_percentile(50, NOW) == 60
+    # Beyond the last bucket
+    assert stats.wait_percentile(100, NOW) is None
+    assert QueueAnalytics().wait_percentile(50, NOW) is None
+    assert len(stats.wait_histogram) == ANALYTICS_WINDOW_DAYS * (len(WAIT_BUCKETS) + 1)
+
+
+def test_hourly_pops_roll_over():
+    stats = QueueAnalytics()
+    stats.record_pop([], NOW)
+    stats.record_pop([], NOW + datetime.timedelta(hours=1))
+    assert stats.pops_since(1, NOW + datetime.timedelta(hours=1)) == 1
+    assert stats.pops_since(24, NOW + datetime.timedelta(hours=1)) == 2
+
+    # A day later the ring has been cleared without growing
+    later = NOW + datetime.timedelta(hours=30)
+    assert stats.pops_since(24, later) == 0
+    assert len(stats.hourly_pops) == 24
+    assert stats.pops == 2
+
+
+def test_rates_and_heatmaps():
+    stats = QueueAnalytics()
+    for _ in range(4):
+        stats.record_join(NOW)
+    stats.record_timeout(NOW)
+    stats.record_dequeue(NOW)
+    stats.record_dequeue(NOW)
+
+    assert stats.timeout_rate(NOW) == 0.25
+    assert stats.dequeue_rate(NOW) == 0.5
+    assert hour_of_week(NOW) == 20
+    assert stats.busiest_hours() == [20]
+    assert format_hour_of_week(20) == "Mon 20:00 UTC"
+    rows = stats.render_heatmap().splitlines()
+    assert len(rows) == 7
+    assert rows[0] == "Mon " + " " * 20 + "█" + " " * 3
+    assert len(stats.join_heatmap) == HOURS_PER_WEEK
+
+
+def test_old_activity_ages_out_of_the_window():
+    stats = QueueAnalytics()
+    for _ in range(4):
+        stats.record_join(NOW)
+    stats.record_timeout(NOW)
+    stats.record_pop([600, 600], NOW)
+
+    later = NOW + datetime.timedelta(days=3)
+    stats.record_join(later)
+    stats.record_dequeue(later)
+    stats.record_pop([30], later)
+    assert stats.joins(later) == 5
+    assert stats.timeout_rate(later) == 0.2
+    assert stats.average_wait(later) == (600 + 600 + 30) / 3
+
+    # A week after the first day only the later activity is left
+    week = NOW + datetime.timedelta(days=ANALYTICS_WINDOW_DAYS)
+    assert stats.joins(week) == 1
+    assert stats.timeout_rate(week) == 0
+    assert stats.dequeue_rate(week) == 1
+    assert stats.average_wait(week) == 30
+    assert stats.wait_percentile(90, week) == 30
+
+    # Long gaps clear everything without growing the rings
+    assert stats.joins(week + datetime.timedelta(days=30)) == 0
+    assert stats.average_wait(week + datetime.timedelta(days=30)) is None
+    assert len(stats.daily_joins) == ANALYTICS_WINDOW_DAYS
+    assert stats.pops == 2
+
+
+def test_analytics_round_trip():
+    stats = QueueAnalytics()
+    stats.record_join(NOW)
+    stats.record_pop([30], NOW)
+    restored = QueueAnalytics(stats.to_dict())
+    assert restored.to_dict() == stats.to_dict()
+
+
+def test_queue_pop_records_waits():
+    queue = SixMansQueue(name="Test", guild=None, channels=[], points={}, players={}, gamesPlayed=0, maxSize=2, id=1)  # type: ignore[arg-type]
+    for i in range(1, 4):
+        queue._put(make_member(f"P{i}", i), joined=NOW - datetime.timedelta(seconds=100 * i))
+
+    players = queue._pop_players(NOW)
+    # Pops are recorded once the game is created
+    assert queue.analytics.pops == 0
+    queue.record_game(players, NOW)
+    assert queue.analytics.pops == 1
+    assert queue.analytics.average_wait(NOW) == (100 + 200) / 2
+    assert not queue.heldJoinLog
+    assert queue._to_dict()["Analytics"]["Pops"] == 1
+
+    with patch("sixMans.sixMans.Config.get_conf"):
+        cog = SixMans(MagicMock())
+    embed = cog.embed_queue_stats(queue)
+    assert [field.name for field in embed.fields][:3] == ["Wait Time", "Throughput", "Joins"]
+
+
+def test_epoch_hour_of_week_matches_calendar():
+    for hours in range(0, 24 * 9, 5):
+        at = NOW + datetime.timedelta(hours=hours)
+        assert _epoch_hour_of_week(_epoch_hour(at)) == hour_of_week(at)
+
+
+def test_arrival_rate_learns_per_hour_of_week():
+    stats = QueueAnalytics()
+    # 12 joins in Monday 20:00, then a week later 6 joins in the same hour
+    for minute in range(12):
+        stats.record_join(NOW + datetime.timedelta(minutes=minute * 2))
+    next_week = NOW + datetime.timedelta(weeks=1)
+    for minute in range(6):
+        stats.record_join(next_week + datetime.timedelta(minutes=minute * 5))
+
+    assert stats.arrival_rates[hour_of_week(NOW)] == 12
+    assert stats.arrival_rate(next_week + datetime.timedelta(hours=1)) == 12 + 0.3 * (6 - 12)
+    # Hours without history fall back to the average of known hours
+    assert stats.arrival_rate(next_week + datetime.timedelta(hours=5)) > 0
+
+
+def test_pop_eta():
+    stats = QueueAnalytics()
+    assert stats.pop_eta(3, NOW) is None
+    assert stats.pop_eta(0, NOW) == 0
+
+    stats.arrival_rates[hour_of_week(NOW)] = 6
+    assert stats.pop_eta(3, NOW) == 1800
+    # A quarter of players leave before a pop
+    for _ in range(4):
+        stats.record_join(NOW)
+    stats.record_dequeue(NOW)
+    assert stats.pop_eta(3, NOW) == 2400
+
+    assert format_eta(None) == "Not enough queue history yet"
+    assert format_eta(1800, NOW) == f"<t:{int(NOW.timestamp()) + 1800}:R>"
+    assert format_eta(10**6) == "More than 12 hours"
+
+
+def test_matchmaking_queue_eta_is_capped_by_wait_time():
+    queue = SixMansQueue(name="Test", guild=None, channels=[], points={}, players={}, gamesPlayed=0, maxSize=2, id=1, matchmaking=True, match_wait=120)  # type: ignore[arg-type]
+    for i in range(1, 3):
+        queue._put(make_member(f"P{i}", i), joined=NOW - datetime.timedelta(seconds=20))
+    assert queue.pop_eta(NOW) == 100
+
+
+def test_ready_check_rollback_and_replacements():
+    queue = SixMansQueue(name="Test", guild=None, channels=[], points={}, players={}, gamesPlayed=0, maxSize=2, id=1)  # type: ignore[arg-type]
+    a, b, c = (make_member(name, i) for i, name in enumerate("ABC", start=1))
+    for i, player in enumerate((a, b, c), start=1):
+        queue._put(player, joined=NOW - datetime.timedelta(seconds=100 * i))
+
+    players = queue._pop_players(NOW)
+    # B declined and C replaces them
+    queue._release([b])
+    replacement = queue._take_next(1)
+    assert replacement == [c]
+    queue.record_game([a, c], NOW)
+    assert queue.analytics.popped_players(NOW) == 2
+    assert queue.analytics.average_wait(NOW) == (100 + 300) / 2
+    assert not queue.heldJoinLog
+
+    # A ready check that can't fill the game puts players back without counting a pop
+    queue._put(b, joined=NOW)
+    players = queue._pop_players(NOW)
+    queue._put(a, joined=NOW)
+    queue._requeue(players[:1])
+    assert queue.analytics.pops == 1
+    assert not queue.heldJoinLog
+
+
+@pytest.mark.asyncio
+async def test_changed_analytics_are_saved_by_key():
+    guild = MagicMock(spec=discord.Guild)
+    queue = SixMansQueue(name="Test", guild=guild, channels=[], points={}, players={}, gamesPlayed=0, maxSize=2, id=1)
+    with patch("sixMans.sixMans.Config.get_conf"):
+        cog = SixMans(MagicMock())
+    set_raw = cog.config.guild.return_value.Queues.set_raw = AsyncMock()
+    cog.queues[guild] = [queue]
+
+    await cog._save_analytics(guild)
+    set_raw.assert_not_awaited()
+
+    queue.analytics.record_join(NOW)
+    await cog._save_analytics(guild)
+    set_raw.assert_awaited_once_with("1", "Analytics", value=queue.analytics.to_dict())
+    assert not queue.analytics.dirty
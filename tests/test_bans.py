@@ -0,0 +1,35 @@
+"""Tests for the in-memory queue ban table (sixMans/bans.py)."""
+
+from sixMans.bans import QueueBanTable
+
+
+def make_ban(expires: float, reason: str | None = None) -> dict:
+    return {"expires": expires, "reason": reason, "banned_by": 999}
+
+
+def test_expired_ban_is_not_enforced():
+    table = QueueBanTable({"1": make_ban(100), "2": make_ban(300)})
+    assert table.get(1, now=200) is None
+    assert table.get(2, now=200)["expires"] == 300
+    # Expired bans stay in place until the sweep removes them
+    assert "1" in table
+
+
+def test_pop_expired_removes_only_expired_bans():
+    table = QueueBanTable({"1": make_ban(100), "2": make_ban(300), "3": make_ban(150)})
+    assert sorted(table.pop_expired(now=200)) == ["1", "3"]
+    assert list(table.bans) == ["2"]
+    assert table.next_expiry() == 300
+    assert table.pop_expired(now=200) == []
+
+
+def test_replaced_and_lifted_bans_leave_no_stale_expiry():
+    table = QueueBanTable({"1": make_ban(100)})
+    # Extending a ban should not let the old expiry lift it
+    table.add(1, make_ban(500))
+    table.add(2, make_ban(120))
+    table.remove(2)
+
+    assert table.pop_expired(now=200) == []
+    assert table.get(1, now=200)["expires"] == 500
+    assert table.next_expiry() == 500
@@ -0,0 +1,72 @@
+"""Tests for the live queue board (sixMans/board.py).
+
+Covers:
+- A burst of queue changes results in a single send/edit per channel.
+- An existing board is edited in place instead of reposted.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+import pytest
+
+from sixMans.board import QueueBoard
+from sixMans.utils import fan_out
+
+from .conftest import make_member, make_text_channel
+
+
+def make_queue(channels):
+    queue = MagicMock()
+    queue.name = "Test Queue"
+    queue.maxSize = 6
+    queue.channels = channels
+    queue.queue.queue = []
+    queue.fan_out = lambda func: fan_out(channels, func)
+    return queue
+
+
+def make_board_channel(channel_id: int, last_message_id: int | None = None):
+    channel = make_text_channel()
+    channel.id = channel_id
+    channel.last_message_id = last_message_id
+    channel.send.return_value.id = 1000 + channel_id
+    channel.send.return_value.created_at = discord.utils.utcnow()
+    partial = MagicMock()
+    partial.edit = AsyncMock()
+    partial.delete = AsyncMock()
+    channel.get_partial_message = MagicMock(return_value=partial)
+    return channel
+
+
+@pytest.mark.asyncio
+async def test_burst_of_joins_is_one_update_per_channel():
+    channels = [make_board_channel(1), make_board_channel(2)]
+    queue = make_queue(channels)
+    save = AsyncMock()
+    board = QueueBoard(queue, delay=0.01, save_callback=save)
+
+    for i in range(6):
+        queue.queue.queue.append(make_member(f"P{i}", i))
+        board.refresh(f"P{i} joined the queue.")
+    await asyncio.sleep(0.05)
+
+    for channel in channels:
+        channel.send.assert_called_once()
+    assert board.message_ids == {1: 1001, 2: 1002}
+    assert board.last_event == "P5 joined the queue."
+    save.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_existing_board_is_edited_in_place():
+    channel = make_board_channel(1, last_message_id=555)
+    board = QueueBoard(make_queue([channel]), message_ids={1: 555}, delay=0.01)
+
+    board.refresh("P1 joined the queue.")
+    await asyncio.sleep(0.05)
+
+    channel.send.assert_not_called()
+    channel.get_partial_message.assert_called_with(555)
+    channel.get_partial_message.return_value.edit.assert_awaited_once()
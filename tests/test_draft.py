@@ -0,0 +1,68 @@
+"""Tests for captains draft suggestions and the pick clock (sixMans/draft.py)."""
+
+import time
+
+import pytest
+
+from sixMans.draft import auto_pick, draft_time_limit, rank_picks
+from sixMans.views.captains import CaptainsView
+
+from .conftest import FakeGame, make_member
+
+
+def test_rank_picks_orders_by_score_then_id():
+    a, b, c, d = (make_member(name, i) for i, name in enumerate("ABCD", start=1))
+    scores = {a: 0.5, b: 1.5, c: 1.5, d: 1.0}
+
+    assert rank_picks([d, c, b, a], scores) == [b, c, d, a]
+    assert auto_pick([a, d], scores) == d
+    assert auto_pick([], scores) is None
+    # Players without a score are ranked as average
+    e = make_member("E", 5)
+    assert rank_picks([a, e], scores) == [e, a]
+
+
+def test_draft_time_is_bounded_by_pick_clock():
+    assert draft_time_limit(picks=4, pick_time=30) == 120
+
+
+@pytest.mark.asyncio
+async def test_expired_pick_clock_auto_picks_best_player(players):
+    game = FakeGame(players=players)
+    game.pick_time = 30
+    view = CaptainsView(game=game)
+    await view.start()
+    assert view.deadline is not None and view.deadline > time.time()
+
+    first = view.picking
+    best = rank_picks(view.pickable, view.scores)[0]
+    await view.expire()
+
+    assert best in game.blue
+    assert view.picking != first
+    assert not view.is_finished()
+    game.textChannel.send.return_value.edit.assert_awaited()
+
+
+@pytest.mark.asyncio
+async def test_pick_clock_completes_draft(players):
+    game = FakeGame(players=players)
+    game.pick_time = 30
+    view = CaptainsView(game=game)
+    await view.start()
+
+    # One expiry per pick. The last pick is assigned automatically.
+    for _ in range(len(players) - 3):
+        await view.expire()
+
+    assert view.finished and view.is_finished()
+    assert len(game.blue) == len(game.orange) == 3
+    assert game.pick_deadline is None
+
+
+@pytest.mark.asyncio
+async def test_no_pick_clock_by_default(players):
+    view = CaptainsView(game=FakeGame(players=players))
+    await view.start()
+    assert view.deadline is None
+    assert any(field.name == "Suggested Picks" for field in view.embed.fields)
@@ -0,0 +1,95 @@
+"""Tests for coalesced message edits (sixMans/editor.py)."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+import pytest
+
+from sixMans.editor import CoalescingEditor
+from sixMans.enums import GameMode
+from sixMans.views.vote import GameModeVote
+
+from .conftest import FakeGame, make_interaction, make_member
+
+
+class FakeClock:
+    """Virtual clock for the editor. Sleepers only wake when the test advances it."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleepers: list[tuple[float, asyncio.Future]] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float):
+        if seconds <= 0:
+            return await asyncio.sleep(0)
+        wake = asyncio.get_running_loop().create_future()
+        self.sleepers.append((self.now + seconds, wake))
+        await wake
+
+    def advance(self, seconds: float):
+        self.now += seconds
+        for deadline, wake in self.sleepers:
+            if deadline <= self.now and not wake.done():
+                wake.set_result(None)
+        self.sleepers = [(deadline, wake) for deadline, wake in self.sleepers if not wake.done()]
+
+
+def make_message() -> MagicMock:
+    message = MagicMock(spec=discord.Message)
+    message.edit = AsyncMock()
+    return message
+
+
+@pytest.mark.asyncio
+async def test_rapid_edits_are_merged():
+    message = make_message()
+    clock = FakeClock()
+    editor = CoalescingEditor(interval=1, clock=clock, sleep=clock.sleep)
+    for votes in range(1, 7):
+        await editor.edit(message, content=str(votes))
+        clock.advance(0.1)
+    assert message.edit.await_count == 1
+
+    clock.advance(0.5)
+    await editor._task
+    assert message.edit.await_count == 2
+    assert message.edit.await_args_list[0].kwargs == {"content": "1"}
+    assert message.edit.await_args_list[-1].kwargs == {"content": "6"}
+
+
+@pytest.mark.asyncio
+async def test_flush_applies_final_state_immediately():
+    message = make_message()
+    editor = CoalescingEditor(interval=60)
+    await editor.edit(message, content="1", view="buttons")
+    await editor.edit(message, content="2")
+    await editor.flush(message, view=None)
+
+    assert message.edit.await_count == 2
+    assert message.edit.await_args_list[-1].kwargs == {"content": "2", "view": None}
+    assert not editor.pending
+
+
+@pytest.mark.asyncio
+async def test_six_votes_cause_at_most_two_edits():
+    players = [make_member(f"P{i}", i) for i in range(1, 7)]
+    game = FakeGame(players=players)
+    view = GameModeVote(game=game)
+    clock = FakeClock()
+    view.editor = CoalescingEditor(clock=clock, sleep=clock.sleep)
+    await view.start()
+    msg = view.msg
+
+    # Split votes so the vote only finishes on the last one
+    modes = [GameMode.RANDOM, GameMode.RANDOM, GameMode.CAPTAINS, GameMode.CAPTAINS, GameMode.BALANCED, GameMode.SELF_PICK]
+    for player, mode in zip(players, modes, strict=True):
+        await view.process_vote(make_interaction(player, data={"custom_id": mode.value}))
+        clock.advance(0.1)
+
+    assert view.is_finished()
+    assert msg.edit.await_count <= 2
+    assert msg.edit.await_args.kwargs["view"] is None
@@ -0,0 +1,52 @@
+"""Tests for concurrent queue channel fan out (sixMans/utils.py)."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import discord
+import pytest
+
+from sixMans.utils import fan_out
+
+from .conftest import make_text_channel
+
+
+@pytest.mark.asyncio
+async def test_failed_channel_does_not_abort_others():
+    ok1, broken, ok2 = make_text_channel(), make_text_channel(), make_text_channel()
+    broken.send.side_effect = discord.Forbidden(MagicMock(status=403), "Missing Access")
+
+    results = await fan_out([ok1, broken, ok2], lambda c: c.send("hello"))
+
+    assert [r["Channel"] for r in results] == [ok1, broken, ok2]
+    assert results[0]["Error"] is None and results[2]["Error"] is None
+    assert isinstance(results[1]["Error"], discord.Forbidden)
+    assert results[1]["Result"] is None
+    ok1.send.assert_awaited_once_with("hello")
+    ok2.send.assert_awaited_once_with("hello")
+    assert all(r["Elapsed"] >= 0 for r in results)
+
+
+@pytest.mark.asyncio
+async def test_channels_are_sent_concurrently():
+    channels = [make_text_channel() for _ in range(4)]
+    in_flight = max_in_flight = 0
+    all_started = asyncio.Event()
+
+    async def send(channel):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        if in_flight == len(channels):
+            all_started.set()
+        try:
+            # Sent one at a time, the first send would never see the others start
+            await asyncio.wait_for(all_started.wait(), timeout=1)
+            return channel
+        finally:
+            in_flight -= 1
+
+    results = await fan_out(channels, send)
+
+    assert [r["Result"] for r in results] == channels
+    assert max_in_flight == len(channels)
@@ -0,0 +1,83 @@
+"""Tests for linked queue groups and the shared pop arbiter (sixMans/groups.py)."""
+
+import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import discord
+import pytest
+
+from sixMans.groups import member_index, next_pop, queue_group, take_from_queues
+from sixMans.queue import SixMansQueue
+from sixMans.sixMans import SixMans
+
+from .conftest import make_member
+
+NOW = datetime.datetime(2026, 10, 18, 12, 0, tzinfo=datetime.timezone.utc)
+
+
+def make_queue(id: int, group: str | None = "ranked", priority: int = 0, guild=None) -> SixMansQueue:
+    return SixMansQueue(name=f"Q{id}", guild=guild, channels=[], points={}, players={}, gamesPlayed=0, maxSize=2, id=id, group=group, priority=priority)  # type: ignore[arg-type]
+
+
+def join(queue: SixMansQueue, *players, start: int = 0):
+    for i, player in enumerate(players):
+        queue._put(player, joined=NOW + datetime.timedelta(seconds=start + i))
+
+
+def test_next_pop_honors_priority_then_fastest_game():
+    a, b, c, d = (make_member(name, i) for i, name in enumerate("ABCD", start=1))
+    casual, ranked, other = make_queue(1), make_queue(2), make_queue(3)
+    join(casual, a, b)
+    join(ranked, c, d, start=10)
+    join(other, a, c, start=5)
+
+    # Casual filled first
+    assert next_pop([casual, ranked, other]) is casual
+    ranked.priority = 1
+    assert next_pop([casual, ranked, other]) is ranked
+    assert next_pop([make_queue(4)]) is None
+
+
+def test_queue_group_keeps_ungrouped_queues_alone():
+    linked, sibling, alone = make_queue(1), make_queue(2), make_queue(3, group=None)
+    queues = [linked, sibling, alone]
+    assert queue_group(queues, linked) == [linked, sibling]
+    assert queue_group(queues, alone) == [alone]
+
+
+def test_take_from_queues_removes_players_everywhere():
+    a, b, c = (make_member(name, i) for i, name in enumerate("ABC", start=1))
+    first, second = make_queue(1), make_queue(2)
+    join(first, a, b, c)
+    join(second, a, c)
+
+    removed = take_from_queues(member_index([first, second]), [a, c])
+    assert list(first.queue.queue) == [b]
+    assert list(second.queue.queue) == []
+    assert removed == {first: [a, c], second: [a, c]}
+    assert a.id not in first.activeJoinLog
+
+
+@pytest.mark.asyncio
+async def test_pop_queue_pops_every_game_the_group_can_form():
+    guild = MagicMock(spec=discord.Guild)
+    with patch("sixMans.sixMans.Config.get_conf"):
+        cog = SixMans(MagicMock())
+    cog._save_queue_members = AsyncMock()
+    cog.create_game = AsyncMock()
+
+    a, b, c, d, e = (make_member(name, i) for i, name in enumerate("ABCDE", start=1))
+    casual, ranked = make_queue(1, guild=guild), make_queue(2, priority=1, guild=guild)
+    join(casual, a, b, c, d)
+    join(ranked, a, e)
+    cog.queues[guild] = [casual, ranked]
+
+    assert await cog._pop_queue(guild, casual)
+    casual.board.cancel()
+    ranked.board.cancel()
+
+    # Ranked pops first and takes A. Casual still has enough players for a game without them.
+    popped = [(call.args[1], call.kwargs["players"]) for call in cog.create_game.await_args_list]
+    assert popped == [(ranked, [a, e]), (casual, [b, c])]
+    assert list(casual.queue.queue) == [d]
+    cog._save_queue_members.assert_awaited_once_with(casual)
@@ -0,0 +1,43 @@
+"""Tests for per-guild game result ingestion (sixMans/ingest.py)."""
+
+import asyncio
+
+import pytest
+
+from sixMans.ingest import ResultIngestor
+
+
+@pytest.mark.asyncio
+async def test_concurrent_results_are_batched_in_order():
+    batches: list[list] = []
+    totals = {"points": 0}
+
+    async def apply_batch(results):
+        # Read-modify-write with an await in between. Would lose updates if batches overlapped.
+        current = totals["points"]
+        await asyncio.sleep(0)
+        totals["points"] = current + sum(results)
+        batches.append(results)
+
+    ingestor = ResultIngestor("Test", apply_batch, window=0.01)
+    await asyncio.gather(*(ingestor.submit(i) for i in range(1, 11)))
+    await ingestor.close()
+
+    assert totals["points"] == 55
+    assert [r for batch in batches for r in batch] == list(range(1, 11))
+    assert len(batches) < 10
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_reported_to_submitters():
+    async def apply_batch(results):
+        raise RuntimeError("disk full")
+
+    ingestor = ResultIngestor("Test", apply_batch, window=0)
+    with pytest.raises(RuntimeError):
+        await ingestor.submit(1)
+
+    # The consumer keeps running after a failure
+    ingestor.apply_batch = lambda results: asyncio.sleep(0)
+    await ingestor.submit(2)
+    await ingestor.close()
@@ -0,0 +1,199 @@
+"""Tests for the game result journal (sixMans/journal.py)."""
+
+import copy
+from unittest.mock import MagicMock, patch
+
+import discord
+import pytest
+
+from sixMans.journal import Journal, apply_game_result
+from sixMans.sixMans import SixMans
+
+
+def make_result(game: int, queue: int = 1) -> dict:
+    scores = [
+        {"Game": game, "Queue": queue, "Player": 1, "Win": 1, "Points": 15, "DateTime": "14-Oct-2026 (20:00:00.000000)"},
+        {"Game": game, "Queue": queue, "Player": 2, "Win": 0, "Points": 5, "DateTime": "14-Oct-2026 (20:00:00.000000)"},
+    ]
+    return {"Game": game, "Queue": queue, "FinishedAt": "2026-10-14T20:00:00", "Season": None, "Scores": scores}
+
+
+def make_state() -> dict:
+    return {
+        "Scores": [],
+        "Players": {},
+        "GamesPlayed": 0,
+        "PeriodBuckets": {},
+        "Queues": {"1": {"Players": {}, "GamesPlayed": 0}},
+        "Games": {"10": {}, "11": {}},
+    }
+
+
+@pytest.mark.asyncio
+async def test_pending_results_survive_reopen(tmp_path):
+    path = tmp_path / "1.jsonl"
+    journal = await Journal.open(path, applied_seq=0)
+    await journal.append(make_result(10))
+    await journal.append(make_result(11))
+
+    reopened = await Journal.open(path, applied_seq=1)
+    assert [e["Game"] for e in reopened.pending] == [11]
+    assert reopened.seq == 2
+
+    # A crash mid-append leaves a partial line which is discarded on open
+    with path.open("a") as f:
+        f.write('{"Seq": 3, "Ga')
+    reopened = await Journal.open(path, applied_seq=0)
+    assert reopened.seq == 2
+    assert path.read_text().endswith("\n")
+
+
+@pytest.mark.asyncio
+async def test_truncate_keeps_unsnapshotted_entries(tmp_path):
+    journal = await Journal.open(tmp_path / "1.jsonl", applied_seq=0)
+    for game in (10, 11, 12):
+        await journal.append(make_result(game))
+
+    await journal.truncate(2)
+    assert [e["Seq"] for e in journal.pending] == [3]
+    reopened = await Journal.open(journal.path, applied_seq=2)
+    assert [e["Seq"] for e in reopened.pending] == [3]
+
+
+@pytest.mark.asyncio
+async def test_replay_is_deterministic_and_queue_totals_idempotent(tmp_path):
+    journal = await Journal.open(tmp_path / "1.jsonl", applied_seq=0)
+    await journal.append(make_result(10))
+    await journal.append(make_result(11))
+
+    state = journal.overlay(make_state())
+    assert state["GamesPlayed"] == 2
+    assert state["Players"]["1"] == {"Points": 30, "GamesPlayed": 2, "Wins": 2}
+    assert [s["Game"] for s in state["Scores"]] == [11, 11, 10, 10]
+    assert state["Games"] == {}
+    assert state["Queues"]["1"]["JournalSeq"] == 2
+
+    # Queue totals saved after the first result are not counted twice
+    partial = make_state()
+    partial["Queues"]["1"] = {"Players": {"1": {"Points": 15, "GamesPlayed": 1, "Wins": 1}}, "GamesPlayed": 1, "JournalSeq": 1}
+    for entry in journal.pending:
+        apply_game_result(partial, entry)
+    assert partial["Queues"]["1"]["GamesPlayed"] == 2
+    assert partial["Queues"]["1"]["Players"]["1"]["Points"] == 30
+
+
+class FakeValue:
+    """In-memory stand-in for a Config value group."""
+
+    def __init__(self, data: dict, key: str):
+        self.data = data
+        self.key = key
+
+    async def __call__(self):
+        return copy.deepcopy(self.data.get(self.key))
+
+    async def set(self, value):
+        if self.key in self.data.get("_fail_on", ()):
+            self.data["_fail_on"].remove(self.key)
+            raise OSError("Simulated crash")
+        self.data[self.key] = copy.deepcopy(value)
+
+    async def clear(self):
+        self.data.pop(self.key, None)
+
+    async def get_raw(self, *path, default=None):
+        node = self.data[self.key]
+        for part in path:
+            if part not in node:
+                return default
+            node = node[part]
+        return copy.deepcopy(node)
+
+    async def set_raw(self, *path, value):
+        node = self.data[self.key]
+        for part in path[:-1]:
+            node = node.setdefault(part, {})
+        node[path[-1]] = copy.deepcopy(value)
+
+    async def clear_raw(self, *path):
+        node = self.data[self.key]
+        for part in path[:-1]:
+            node = node[part]
+        node.pop(path[-1], None)
+
+
+class FakeGuildConfig:
+    def __init__(self, data: dict):
+        self.data = data
+
+    def __getattr__(self, key: str) -> FakeValue:
+        return FakeValue(self.data, key)
+
+    async def all(self):
+        raise AssertionError("The whole guild should not be read")
+
+
+@pytest.mark.asyncio
+async def test_snapshot_only_writes_journaled_keys(tmp_path):
+    with patch("sixMans.sixMans.Config.get_conf"):
+        cog = SixMans(MagicMock())
+    guild = MagicMock(spec=discord.Guild)
+    data = make_state()
+    data["JournalSeq"] = 0
+    data["Queues"]["1"]["Members"] = {"5": 1.0}
+    data["Queues"]["2"] = {"Players": {}, "GamesPlayed": 0, "Members": {"6": 2.0}}
+    cog.config.guild = MagicMock(return_value=FakeGuildConfig(data))
+
+    journal = await Journal.open(tmp_path / "1.jsonl", applied_seq=0)
+    await journal.append(make_result(10))
+    cog.journals[guild] = journal
+    await cog._snapshot(guild)
+
+    assert data["GamesPlayed"] == 1
+    assert data["JournalSeq"] == 1
+    assert data["Queues"]["1"]["GamesPlayed"] == 1
+    # Queue members, other queues and other games are left alone
+    assert data["Queues"]["1"]["Members"] == {"5": 1.0}
+    assert data["Queues"]["2"]["Members"] == {"6": 2.0}
+    assert data["Games"] == {"11": {}}
+    assert "JournalSnapshot" not in data
+    assert not journal.pending
+
+
+@pytest.mark.asyncio
+async def test_interrupted_snapshot_is_finished_instead_of_replayed(tmp_path):
+    data = make_state()
+    data["JournalSeq"] = 0
+    journal = await Journal.open(tmp_path / "1.jsonl", applied_seq=0)
+    await journal.append(make_result(10))
+    await journal.append(make_result(11))
+
+    with patch("sixMans.sixMans.Config.get_conf"):
+        cog = SixMans(MagicMock())
+    guild = MagicMock(spec=discord.Guild)
+    cog.config.guild = MagicMock(return_value=FakeGuildConfig(data))
+    cog.journals[guild] = journal
+    # Stop after the scores and players are written but before the journal sequence is
+    data["_fail_on"] = ["GamesPlayed"]
+    with pytest.raises(OSError):
+        await cog._snapshot(guild)
+    assert len(data["Scores"]) == 4
+    assert data["JournalSeq"] == 0
+
+    # Restart
+    with patch("sixMans.sixMans.Config.get_conf"):
+        cog = SixMans(MagicMock())
+    cog.config.guild = MagicMock(return_value=FakeGuildConfig(data))
+    cog.journal_dir = tmp_path
+    guild.id = 1
+    await cog._recover_journal(guild)
+
+    assert len(data["Scores"]) == 4
+    assert data["Players"]["1"] == {"Points": 30, "GamesPlayed": 2, "Wins": 2}
+    assert data["GamesPlayed"] == 2
+    assert data["PeriodBuckets"] == journal.overlay({"PeriodBuckets": {}})["PeriodBuckets"]
+    assert data["Queues"]["1"]["GamesPlayed"] == 2
+    assert data["Games"] == {}
+    assert data["JournalSeq"] == 2
+    assert "JournalSnapshot" not in data
+    assert not cog.journals[guild].pending
@@ -0,0 +1,140 @@
+"""Tests for balanced matchmaking from a larger queue pool (sixMans/matchmaking.py)."""
+
+import datetime
+import itertools
+import random
+import sys
+from typing import Any
+
+import pytest
+
+from sixMans import matchmaking
+from sixMans.matchmaking import find_match, player_rating
+from sixMans.queue import SixMansQueue
+
+from .conftest import make_member
+
+
+def best_imbalance(ratings: list[float], team_size: int, required: int) -> float:
+    best = float("inf")
+    for picked in itertools.combinations(range(len(ratings)), team_size * 2):
+        if not set(range(required)) <= set(picked):
+            continue
+        for blue in itertools.combinations(picked, team_size):
+            diff = sum(ratings[i] for i in blue) - sum(ratings[i] for i in picked if i not in blue)
+            best = min(best, abs(diff))
+    return best
+
+
+def test_find_match_is_optimal():
+    rng = random.Random(44)
+    for _ in range(50):
+        ratings = [round(rng.random(), 2) for _ in range(rng.randint(6, 10))]
+        required = rng.randint(1, 4)
+        blue, orange, imbalance = find_match(list(range(len(ratings))), ratings, 3, required=required)  # type: ignore[misc]
+
+        assert len(blue) == len(orange) == 3
+        assert set(range(required)) <= set(blue) | set(orange)
+        assert abs(sum(ratings[i] for i in blue) - sum(ratings[i] for i in orange)) == pytest.approx(imbalance)
+        assert imbalance == pytest.approx(best_imbalance(ratings, 3, required))
+
+
+def test_find_match_prefers_earlier_players():
+    blue, orange, imbalance = find_match(list("ABCDEFGH"), [0.5] * 8, 3)  # type: ignore[misc]
+    assert imbalance == 0
+    assert sorted(blue + orange) == list("ABCDEF")
+    assert find_match(list("ABC"), [0.5] * 3, 3) is None
+
+
+def lines_run(func, *args) -> tuple[Any, int]:
+    """Call `func`, counting the lines of sixMans/matchmaking.py it runs. A measure of work that doesn't depend on the machine."""
+    lines = 0
+
+    def trace(frame, event, arg):
+        nonlocal lines
+        if frame.f_code.co_filename != matchmaking.__file__:
+            return None
+        if event == "line":
+            lines += 1
+        return trace
+
+    previous = sys.gettrace()
+    sys.settrace(trace)
+    try:
+        result = func(*args)
+    finally:
+        sys.settrace(previous)
+    return result, lines
+
+
+def test_find_match_work_is_bounded_for_large_pools():
+    rng = random.Random(30)
+    ratings = [rng.random() for _ in range(30)]
+    for team_size in (2, 3, 4, 5):
+        match, lines = lines_run(find_match, list(range(30)), ratings, team_size)
+        assert match is not None
+        # A few lines per DP cell, however the ratings are spread
+        assert lines < 10 * len(ratings) * (team_size + 1) ** 2
+
+
+def test_player_rating():
+    assert player_rating(None) == 0.5
+    assert player_rating({"Points": 0, "GamesPlayed": 0, "Wins": 0}) == 0.5
+    assert player_rating({"Points": 30, "GamesPlayed": 3, "Wins": 2}) == 0.67
+
+
+def make_queue(players=None, **kwargs) -> SixMansQueue:
+    return SixMansQueue(name="Test", guild=None, channels=[], points={}, players=players or {}, gamesPlayed=0, maxSize=6, id=1, **kwargs)  # type: ignore[arg-type]
+
+
+def test_matchmaking_queue_waits_for_margin_or_deadline():
+    queue = make_queue(matchmaking=True, match_margin=2, match_wait=60)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    for i in range(1, 7):
+        queue._put(make_member(f"P{i}", i), joined=now)
+
+    assert queue.queue_full()
+    assert not queue.ready_to_pop(now)
+    assert queue.ready_to_pop(now + datetime.timedelta(seconds=60))
+
+    for i in range(7, 9):
+        queue._put(make_member(f"P{i}", i), joined=now)
+    assert queue.ready_to_pop(now)
+
+
+def test_matchmaking_pop_picks_balanced_players():
+    # Everyone is average except the second player, who unbalances any game they are in
+    players = {str(i): {"Points": 0, "GamesPlayed": 10, "Wins": 5} for i in range(1, 9)}
+    players["2"] = {"Points": 0, "GamesPlayed": 10, "Wins": 10}
+    queue = make_queue(players=players, matchmaking=True)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    members = [make_member(f"P{i}", i) for i in range(1, 9)]
+    for i, member in enumerate(members):
+        queue._put(member, joined=now + datetime.timedelta(seconds=i))
+
+    picked = queue._pop_players(now + datetime.timedelta(seconds=10))
+    assert {m.id for m in picked} == {1, 3, 4, 5, 6, 7}
+    assert list(queue.queue.queue) == [members[1], members[7]]
+    assert all(m.id not in queue.activeJoinLog for m in picked)
+
+
+def test_overdue_players_are_always_picked():
+    # The second player unbalances the game but has waited too long to be skipped
+    queue = make_queue(players={"2": {"Points": 0, "GamesPlayed": 10, "Wins": 10}}, matchmaking=True, match_margin=2, match_wait=60)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    members = [make_member(f"P{i}", i) for i in range(1, 9)]
+    for i, member in enumerate(members):
+        # The first four have waited past the deadline
+        queue._put(member, joined=now - datetime.timedelta(seconds=120 if i < 4 else 0))
+
+    picked = queue._pop_players(now)
+    assert set(members[:4]) <= set(picked)
+
+
+def test_regular_queue_pops_in_join_order():
+    queue = make_queue()
+    members = [make_member(f"P{i}", i) for i in range(1, 9)]
+    for member in members:
+        queue._put(member)
+    assert queue.ready_to_pop()
+    assert queue._pop_players() == members[:6]
@@ -0,0 +1,145 @@
+"""Tests for the metrics registry and Prometheus exporter (sixMans/metrics.py)."""
+
+import socket
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiohttp
+import discord
+import pytest
+
+from sixMans.metrics import (
+    CONFIG_BYTES,
+    CONFIG_OPERATIONS,
+    REGISTRY,
+    REST_CALLS,
+    REST_FAILURES,
+    MetricsExporter,
+    MetricsRegistry,
+    config_read,
+    config_write,
+    rest,
+)
+from sixMans.queue import SixMansQueue
+from sixMans.sixMans import SixMans
+
+from .conftest import make_member
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    REGISTRY.clear()
+    yield
+    REGISTRY.clear()
+    REGISTRY.enabled = False
+
+
+def test_render_prometheus_text():
+    registry = MetricsRegistry()
+    calls = registry.counter("calls_total", "Calls.", ("operation",))
+    size = registry.gauge("size", "Size.")
+    latency = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+
+    calls.inc('say "hi"')
+    calls.inc('say "hi"', amount=2)
+    size.set(3)
+    for value in (0.05, 0.5, 5):
+        latency.observe(value)
+
+    assert registry.render().splitlines() == [
+        "# HELP calls_total Calls.",
+        "# TYPE calls_total counter",
+        'calls_total{operation="say \\"hi\\""} 3',
+        "# HELP size Size.",
+        "# TYPE size gauge",
+        "size 3",
+        "# HELP latency_seconds Latency.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{le="0.1"} 1',
+        'latency_seconds_bucket{le="1"} 2',
+        'latency_seconds_bucket{le="+Inf"} 3',
+        "latency_seconds_sum 5.55",
+        "latency_seconds_count 3",
+    ]
+    with pytest.raises(ValueError):
+        registry.counter("calls_total", "Again.")
+
+
+@pytest.mark.asyncio
+async def test_rest_counts_failures():
+    async def fail():
+        raise discord.HTTPException(MagicMock(status=500), "error")
+
+    assert await rest("send_message", AsyncMock(return_value=1)()) == 1
+    with pytest.raises(discord.HTTPException):
+        await rest("send_message", fail())
+
+    assert REST_CALLS.values == {("send_message",): 2}
+    assert REST_FAILURES.values == {("send_message",): 1}
+
+
+def test_config_sizes_are_only_measured_while_exporting():
+    config_read("Games", {"1": {}})
+    assert CONFIG_OPERATIONS.values == {("Games", "read"): 1}
+    assert CONFIG_BYTES.values == {}
+
+    REGISTRY.enabled = True
+    config_read("Games", {"1": {}})
+    assert CONFIG_BYTES.values == {("Games", "read"): len('{"1": {}}')}
+
+    # Score history is counted but never serialised
+    with patch("sixMans.metrics.json.dumps") as dumps:
+        config_write("Scores", [{"Game": 1}])
+    dumps.assert_not_called()
+    assert CONFIG_OPERATIONS.values[("Scores", "write")] == 1
+    assert ("Scores", "write") not in CONFIG_BYTES.values
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.mark.asyncio
+async def test_exporter_serves_and_writes_metrics(tmp_path):
+    REST_CALLS.inc("create_channel")
+    path = tmp_path / "sixmans.prom"
+    port = free_port()
+    exporter = MetricsExporter()
+    await exporter.start(port, str(path))
+    try:
+        assert REGISTRY.enabled
+        async with aiohttp.ClientSession() as session, session.get(f"http://127.0.0.1:{port}/metrics") as resp:
+            body = await resp.text()
+        assert resp.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+        assert 'sixmans_rest_calls_total{operation="create_channel"} 1' in body
+
+        await exporter.write()
+        assert path.read_text() == REGISTRY.render()
+    finally:
+        await exporter.stop()
+    assert not REGISTRY.enabled
+    assert not exporter.running
+
+
+@pytest.mark.asyncio
+async def test_cog_gauges_and_command_latency():
+    with patch("sixMans.sixMans.Config.get_conf"):
+        cog = SixMans(MagicMock())
+    guild = MagicMock(spec=discord.Guild)
+    guild.id = 42
+    queue = SixMansQueue(name="Test", guild=guild, channels=[], points={}, players={}, gamesPlayed=0, maxSize=2, id=1)
+    queue._put(make_member("A", 1))
+    cog.queues[guild] = [queue]
+    cog.games[guild] = [MagicMock(prompts={"vote": MagicMock()})]
+
+    text = REGISTRY.render()
+    assert 'sixmans_queue_players{guild="42",queue="Test"} 1' in text
+    assert 'sixmans_active_games{guild="42"} 1' in text
+    assert 'sixmans_open_views{kind="vote"} 1' in text
+
+    ctx = MagicMock(guild=None)
+    ctx.command.qualified_name = "queue"
+    await cog.cog_before_invoke(ctx)
+    await cog.cog_after_invoke(ctx)
+    assert 'sixmans_command_duration_seconds_count{command="queue"} 1' in REGISTRY.render()
@@ -0,0 +1,63 @@
+"""Tests for trusted (unvalidated) loading of saved queues and games."""
+
+import pytest
+from pydantic import ValidationError
+
+from sixMans.enums import GameMode, GameState, Winner
+from sixMans.models.game import GameData, GuildGameData
+from sixMans.models.queue import GuildQueueData, QueueData
+
+QUEUE = {
+    "Name": "Test Queue",
+    "Channels": [10, 11],
+    "Points": {"Play": 5, "Win": 10},
+    "Players": {"1": {"GamesPlayed": 3, "Points": 25, "Wins": 1}},
+    "GamesPlayed": 3,
+    "TeamSelection": "Vote",
+    "MaxSize": 6,
+    # JSON object keys are always strings
+    "BoardMessages": {"10": 555},
+}
+
+GAME = {
+    "Players": [1, 2],
+    "Captains": [],
+    "Blue": [1],
+    "Orange": [2],
+    "RoomName": "room",
+    "RoomPass": "pass",
+    "VoiceChannels": [],
+    "QueueId": 1,
+    "TeamSelection": "Random",
+    "State": "Ongoing",
+    "Prefix": "?",
+    "Winner": "pending",
+    "InfoMessage": 123,
+    "TextChannel": 20,
+}
+
+
+def test_trusted_queue_matches_validated_queue():
+    trusted = QueueData.trusted(QUEUE)
+    validated = QueueData(**QUEUE)
+
+    assert trusted.BoardMessages == validated.BoardMessages == {10: 555}
+    assert dict(trusted.Points) == dict(validated.Points)
+    assert trusted.player_dict() == validated.player_dict()
+    # Trusted player rows are used as-is
+    assert trusted.player_dict() is QUEUE["Players"]
+
+
+def test_trusted_game_restores_enums():
+    game = GameData.trusted(GAME)
+    assert game.State is GameState.ONGOING
+    assert game.TeamSelection is GameMode.RANDOM
+    assert game.Winner is Winner.PENDING
+    assert game == GameData(**GAME)
+
+
+def test_full_validation_reports_bad_rows():
+    bad_queue = {**QUEUE, "Players": {"1": {"GamesPlayed": "many"}}}
+    with pytest.raises(ValidationError):
+        GuildQueueData.model_validate({"1": bad_queue})
+    GuildGameData.model_validate({"1": GAME})
@@ -0,0 +1,83 @@
+"""Tests for calendar and season leaderboard buckets (sixMans/periods.py)."""
+
+import datetime
+
+from sixMans.periods import (
+    add_game_to_buckets,
+    merge_rebuilt_buckets,
+    period_keys,
+    period_standings,
+    rebuild_buckets,
+    season_key,
+    week_key,
+)
+from sixMans.retention import SCORE_DATETIME_FORMAT
+
+
+def make_scores(game: int, queue: int, when: datetime.datetime, winners: list[int], losers: list[int]) -> list[dict]:
+    date_time = when.strftime(SCORE_DATETIME_FORMAT)
+    scores = [{"Game": game, "Queue": queue, "Player": p, "Win": 1, "Points": 15, "DateTime": date_time} for p in winners]
+    scores += [{"Game": game, "Queue": queue, "Player": p, "Win": 0, "Points": 5, "DateTime": date_time} for p in losers]
+    return scores
+
+
+def test_week_key_is_monday_aligned():
+    sunday = datetime.datetime(2026, 10, 18, 23, 59)
+    monday = datetime.datetime(2026, 10, 19, 0, 1)
+    assert week_key(sunday) == week_key(datetime.datetime(2026, 10, 12))
+    assert week_key(sunday) != week_key(monday)
+
+
+def test_guild_standings_sum_queue_buckets():
+    when = datetime.datetime(2026, 10, 14, 20, 0)
+    keys = period_keys(when, "S1")
+    buckets: dict = {}
+    add_game_to_buckets(buckets, keys, 1, make_scores(1, 1, when, [1, 2], [3, 4]))
+    add_game_to_buckets(buckets, keys, 2, make_scores(2, 2, when, [1, 3], [2, 4]))
+
+    players, games = period_standings(buckets, week_key(when))
+    assert games == 2
+    assert players["1"] == {"Points": 30, "GamesPlayed": 2, "Wins": 2}
+    assert players["4"] == {"Points": 10, "GamesPlayed": 2, "Wins": 0}
+
+    players, games = period_standings(buckets, season_key("S1"), queue_id=2)
+    assert games == 1
+    assert players["2"]["Wins"] == 0
+
+
+def test_rebuild_matches_incremental_updates():
+    season_start = datetime.datetime(2026, 10, 1)
+    before = datetime.datetime(2026, 9, 30, 12, 0)
+    after = datetime.datetime(2026, 10, 2, 12, 0)
+    # Scores are stored newest first
+    scores = make_scores(2, 1, after, [1, 2], [3, 4]) + make_scores(1, 1, before, [3, 4], [1, 2])
+
+    buckets = rebuild_buckets(scores, {"Name": "S1", "Start": season_start.isoformat()})
+
+    _, season_games = period_standings(buckets, season_key("S1"))
+    assert season_games == 1
+    players, month_games = period_standings(buckets, "M2026-09")
+    assert month_games == 1
+    assert players["3"]["Wins"] == 1
+
+
+def test_merge_keeps_compacted_periods_and_ended_seasons():
+    cutoff = datetime.datetime(2026, 10, 1)
+    old = datetime.datetime(2026, 9, 15, 12, 0)
+    recent = datetime.datetime(2026, 10, 14, 12, 0)
+    existing: dict = {}
+    add_game_to_buckets(existing, period_keys(old, "S0"), 1, make_scores(1, 1, old, [1], [2]))
+    add_game_to_buckets(existing, period_keys(recent), 1, make_scores(2, 1, recent, [1], [2]))
+    add_game_to_buckets(existing, period_keys(recent), 1, make_scores(2, 1, recent, [1], [2]))
+
+    # The September game was compacted, so only the October game is left in the raw scores
+    season = {"Name": "S1", "Start": cutoff.isoformat()}
+    rebuilt = rebuild_buckets(make_scores(2, 1, recent, [1], [2]), season)
+    merged = merge_rebuilt_buckets(existing, rebuilt, cutoff, season)
+
+    assert merged["M2026-09"] == existing["M2026-09"]
+    assert merged[season_key("S0")] == existing[season_key("S0")]
+    # The year started before the cutoff, so it can't be rebuilt from raw scores
+    assert period_standings(merged, "Y2026")[1] == 3
+    assert period_standings(merged, "M2026-10")[1] == 1
+    assert period_standings(merged, season_key("S1"))[1] == 1
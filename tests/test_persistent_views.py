@@ -0,0 +1,138 @@
+"""Tests for game prompts: routing state, and rebuilding from state stored on the game after a restart."""
+
+from unittest.mock import MagicMock, patch
+
+import discord
+import pytest
+
+from sixMans.enums import GameMode, Winner
+from sixMans.sixMans import SixMans
+from sixMans.views.captains import CaptainsView
+from sixMans.views.score import ScoreReportView
+from sixMans.views.selfpick import SelfPickingView
+from sixMans.views.vote import GameModeVote
+
+from .conftest import FakeGame, make_interaction, make_member
+
+
+@pytest.mark.asyncio
+async def test_prompts_register_on_game_with_stable_custom_ids(game):
+    game.captains = list(game.captains)
+    for view in (GameModeVote(game), CaptainsView(game), SelfPickingView(game), ScoreReportView(game)):
+        assert game.prompts[view.kind] is view
+        rendered = view.build_view()
+        # Rendered but never stored by discord.py
+        assert rendered.is_finished()
+        for item in rendered.children:
+            assert item.custom_id.startswith(f"sixmans:{view.kind}:{game.id}:")
+
+
+@pytest.mark.asyncio
+async def test_restored_vote_keeps_existing_votes(players):
+    game = FakeGame(players=players)
+    view = GameModeVote(game=game)
+    await view.start()
+    await view.process_vote(make_interaction(players[0], data={"custom_id": f"sixmans:vote:{game.id}:{GameMode.CAPTAINS.value}"}))
+    assert game.mode_votes == {players[0].id: GameMode.CAPTAINS}
+    game.save.assert_awaited()
+
+    # Rebuilt for the same message after a restart
+    restored = GameModeVote(game=game)
+    assert restored.msg is not None
+    assert restored.votes[GameMode.CAPTAINS] == 1
+
+    i = make_interaction(players[0], data={"custom_id": f"sixmans:vote:{game.id}:{GameMode.RANDOM.value}"})
+    await restored.process_vote(i)
+    assert restored.votes[GameMode.RANDOM] == 0
+    i.response.send_message.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_restored_captains_pick_continues_snake_order(players):
+    game = FakeGame(players=players)
+    view = CaptainsView(game=game)
+    await view.start()
+    first, second = game.captains
+    assert game.pick_order == [first.id, second.id, second.id, first.id]
+
+    pick = view.pickable[0]
+    await view.process_pick(make_interaction(first, data={"custom_id": f"sixmans:pick:{game.id}:{pick.id}"}))
+    assert pick in game.blue
+
+    restored = CaptainsView(game=game)
+    assert restored.picking == second
+    disabled = {b.custom_id for b in restored.build_view().children if b.disabled}
+    assert disabled == {f"sixmans:pick:{game.id}:{pick.id}"}
+
+
+@pytest.mark.asyncio
+async def test_restored_score_report_keeps_answers(game, captains):
+    view = ScoreReportView(game=game)
+    await view.prompt()
+    await view.report_blue(make_interaction(captains[0]))
+
+    restored = ScoreReportView(game=game)
+    assert await restored.already_answered(captains[0])
+    await restored.report_blue(make_interaction(captains[1]))
+    assert restored.result == Winner.BLUE
+
+
+@pytest.mark.asyncio
+async def test_self_picking_finishes_when_everyone_is_placed():
+    players = [make_member(f"P{i}", i) for i in range(1, 3)]
+    game = FakeGame(players=players)
+    view = SelfPickingView(game=game)
+    await view.prompt()
+
+    await view.pick_blue(make_interaction(players[0]))
+    assert not view.finished
+    await SelfPickingView(game=game).pick_orange(make_interaction(players[1]))
+    assert SelfPickingView(game=game).finished
+
+
+@pytest.mark.asyncio
+async def test_expired_prompt_times_out_and_unregisters(game, players):
+    view = GameModeVote(game=game)
+    await view.start()
+    await view.process_vote(make_interaction(players[0], data={"custom_id": f"sixmans:vote:{game.id}:{GameMode.CAPTAINS.value}"}))
+
+    await view.expire()
+    assert await view.wait() is True
+    assert view.result == GameMode.CAPTAINS
+    assert "vote" not in game.prompts
+
+
+@pytest.mark.asyncio
+async def test_new_prompt_replaces_open_one(game):
+    first = ScoreReportView(game=game)
+    second = ScoreReportView(game=game)
+    assert await first.wait() is True
+    assert game.prompts["score"] is second
+
+
+@pytest.mark.asyncio
+async def test_router_dispatches_by_custom_id(players):
+    with patch("sixMans.sixMans.Config.get_conf"):
+        cog = SixMans(MagicMock())
+    game = FakeGame(players=players)
+    game.id = 42
+    guild = game.queue.guild
+    cog.queues[guild] = []
+    cog.games[guild] = [game]
+    view = GameModeVote(game=game)
+    await view.start()
+
+    interaction = make_interaction(players[0], data={"custom_id": f"sixmans:vote:42:{GameMode.BALANCED.value}"})
+    interaction.type = discord.InteractionType.component
+    interaction.guild = guild
+    await cog.on_interaction(interaction)
+    assert game.mode_votes == {players[0].id: GameMode.BALANCED}
+
+    # Presses on a finished prompt get an ephemeral notice
+    view.stop()
+    stale = make_interaction(players[1], data={"custom_id": f"sixmans:vote:42:{GameMode.BALANCED.value}"})
+    stale.type = discord.InteractionType.component
+    stale.guild = guild
+    await cog.on_interaction(stale)
+    stale.response.send_message.assert_called_once()
+    assert players[1].id not in game.mode_votes
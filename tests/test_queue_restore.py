@@ -0,0 +1,62 @@
+"""Tests for persisting and restoring queue membership across restarts."""
+
+import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import discord
+import pytest
+
+from sixMans.queue import SixMansQueue
+from sixMans.sixMans import QUEUE_RESTORE_GRACE_TIME, SixMans
+
+from .conftest import make_member
+
+
+def make_queue(guild) -> SixMansQueue:
+    return SixMansQueue(name="Test", guild=guild, channels=[], points={}, players={}, gamesPlayed=0, maxSize=6, id=1)
+
+
+@pytest.fixture
+def cog():
+    with patch("sixMans.sixMans.Config.get_conf"):
+        cog = SixMans(MagicMock())
+    cog.create_timeout_task = AsyncMock()
+    cog._save_queue_members = AsyncMock()
+    return cog
+
+
+def test_membership_is_in_queue_order():
+    queue = make_queue(MagicMock(spec=discord.Guild))
+    joined = datetime.datetime(2026, 10, 18, 12, 0, tzinfo=datetime.timezone.utc)
+    queue._put(make_member("B", 2), joined=joined)
+    queue._put(make_member("A", 1), joined=joined + datetime.timedelta(seconds=5))
+
+    assert list(queue.membership()) == ["2", "1"]
+    assert queue._to_dict()["Members"]["2"] == joined.timestamp()
+
+    queue.clear()
+    assert queue.membership() == {}
+
+
+@pytest.mark.asyncio
+async def test_restore_keeps_order_and_remaining_timeout(cog):
+    members = {i: make_member(f"P{i}", i) for i in range(1, 4)}
+    guild = MagicMock(spec=discord.Guild)
+    guild.name = "Test Guild"
+    guild.get_member = lambda pid: members.get(pid)
+    cog.player_timeout_time[guild] = 600
+    queue = make_queue(guild)
+
+    now = datetime.datetime.now(datetime.timezone.utc).timestamp()
+    saved = {"2": now - 100, "1": now - 300, "3": now - 3600, "99": now - 50}
+    await cog._restore_queue_members(queue, saved)
+    queue.board.cancel()
+
+    assert [p.id for p in queue.queue.queue] == [3, 1, 2]
+    timeouts = {call.args[0].id: call.args[2] for call in cog.create_timeout_task.await_args_list}
+    assert timeouts[1] == pytest.approx(300, abs=5)
+    assert timeouts[2] == pytest.approx(500, abs=5)
+    # Timed out during downtime, so only the grace period is left
+    assert timeouts[3] == QUEUE_RESTORE_GRACE_TIME
+    # The player who left the guild is dropped from the saved membership
+    cog._save_queue_members.assert_awaited_once_with(queue)
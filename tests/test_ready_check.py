@@ -0,0 +1,145 @@
+"""Tests for the ready check between a queue pop and game creation (sixMans/views/ready.py)."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import discord
+import pytest
+
+from sixMans.queue import SixMansQueue
+from sixMans.sixMans import SixMans
+from sixMans.views.ready import ReadyCheckView
+
+from .conftest import make_interaction, make_member, make_text_channel
+
+
+def make_queue(guild=None) -> SixMansQueue:
+    return SixMansQueue(name="Test", guild=guild, channels=[make_text_channel()], points={}, players={}, gamesPlayed=0, maxSize=2, id=1)  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_ready_check_finishes_when_everyone_answers():
+    a, b = make_member("A", 1), make_member("B", 2)
+    check = ReadyCheckView(make_queue(), [a, b], timeout=5)
+    task = asyncio.create_task(check.run())
+    await asyncio.sleep(0)
+
+    await check.accept.callback(make_interaction(a))
+    assert not task.done()
+    await check.decline.callback(make_interaction(b))
+    await asyncio.wait_for(task, timeout=1)
+
+    assert check.ready == {a}
+    assert check.missing == [b]
+    msg = check.messages[0]
+    assert msg.edit.await_args.kwargs["view"] is None
+
+
+@pytest.mark.asyncio
+async def test_ready_check_times_out_players_who_dont_answer():
+    a, b = make_member("A", 1), make_member("B", 2)
+    check = ReadyCheckView(make_queue(), [a, b], timeout=0.05)
+    task = asyncio.create_task(check.run())
+    await asyncio.sleep(0)
+    await check.accept.callback(make_interaction(a))
+    await asyncio.wait_for(task, timeout=1)
+
+    assert check.missing == [b]
+    assert check.is_finished()
+
+
+@pytest.mark.asyncio
+async def test_ready_check_rejects_other_members():
+    check = ReadyCheckView(make_queue(), [make_member("A", 1)])
+    interaction = make_interaction(make_member("X", 99))
+    assert not await check.interaction_check(interaction)
+    interaction.response.send_message.assert_awaited_once()
+
+
+def scripted_check(declined: set[int]):
+    """Stand-in for the ready check view where everyone except `declined` accepts."""
+
+    class ScriptedCheck:
+        def __init__(self, queue, players):
+            self.players = players
+            self.ready: set = set()
+
+        @property
+        def missing(self):
+            return [p for p in self.players if p not in self.ready]
+
+        async def run(self):
+            self.ready = {p for p in self.players if p.id not in declined}
+
+    return ScriptedCheck
+
+
+@pytest.fixture
+def cog():
+    with patch("sixMans.sixMans.Config.get_conf"):
+        cog = SixMans(MagicMock())
+    cog._save_queue_members = AsyncMock()
+    return cog
+
+
+@pytest.mark.asyncio
+async def test_decliners_are_replaced_from_the_queue(cog):
+    guild = MagicMock(spec=discord.Guild)
+    queue = make_queue(guild)
+    a, b, c = make_member("A", 1), make_member("B", 2), make_member("C", 3)
+    queue._put(c)
+    cog.queues[guild] = [queue]
+
+    with patch("sixMans.sixMans.ReadyCheckView", scripted_check(declined={2})):
+        players = await cog._ready_check(guild, queue, [a, b])
+
+    assert players == [a, c]
+    assert queue.queue.qsize() == 0
+
+
+@pytest.mark.asyncio
+async def test_accepted_players_keep_their_place_when_queue_runs_out(cog):
+    guild = MagicMock(spec=discord.Guild)
+    queue = make_queue(guild)
+    a, b, c = make_member("A", 1), make_member("B", 2), make_member("C", 3)
+    queue._put(c)
+    cog.queues[guild] = [queue]
+
+    with patch("sixMans.sixMans.ReadyCheckView", scripted_check(declined={2, 3})):
+        players = await cog._ready_check(guild, queue, [a, b])
+    queue.board.cancel()
+
+    assert players is None
+    # C declined too, so only A is left waiting
+    assert list(queue.queue.queue) == [a]
+    assert list(queue.membership()) == ["1"]
+
+
+@pytest.mark.asyncio
+async def test_players_cant_queue_again_until_their_game_exists(cog):
+    guild = MagicMock(spec=discord.Guild)
+    queue = make_queue(guild)
+    a, b, c = make_member("A", 1), make_member("B", 2), make_member("C", 3)
+    queue._put(c)
+    cog.queues[guild] = [queue]
+    cog.games[guild] = []
+    cog.queues_enabled[guild] = True
+    cog._is_ready_check = AsyncMock(return_value=True)
+    cog.check_banned = AsyncMock(return_value=None)
+    cog.get_queue_by_text_channel = MagicMock(return_value=queue)
+    ctx = MagicMock(guild=guild, channel=make_text_channel(), author=a)
+    ctx.send = AsyncMock()
+
+    async def start_game(guild, six_mans_queue, players, prefix):
+        assert cog._is_starting(guild, a) and cog._is_starting(guild, c)
+        assert not cog._is_starting(guild, b)
+        await cog.queue.callback(cog, ctx)
+        ctx.send.assert_awaited_once_with(":x: Your game is still being created")
+        assert queue.queue.qsize() == 0
+
+    cog._start_game = start_game
+    with patch("sixMans.sixMans.ReadyCheckView", scripted_check(declined={2})):
+        await cog.create_game(guild, queue, players=[a, b])
+    queue.board.cancel()
+
+    assert not cog.starting_players[guild]
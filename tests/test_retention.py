@@ -0,0 +1,114 @@
+"""Tests for score history retention (sixMans/retention.py).
+
+Covers:
+- Only rows older than the cutoff are compacted.
+- Compacted rollups still answer windowed queries.
+- Compaction yields between batches.
+"""
+
+import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import discord
+import pytest
+
+from sixMans.retention import (
+    SCORE_DATETIME_FORMAT,
+    compact_scores,
+    expired_score_count,
+    retention_cutoff,
+    rollup_stats_since,
+)
+from sixMans.sixMans import SixMans
+
+
+def make_score(player: int, days_ago: int, win: int = 1, queue: int = 1, now: datetime.datetime | None = None) -> dict:
+    now = now or datetime.datetime(2026, 6, 1, 12, 0, 0)
+    when = now - datetime.timedelta(days=days_ago)
+    return {
+        "Game": days_ago,
+        "Queue": queue,
+        "Player": player,
+        "Win": win,
+        "Points": 15 if win else 5,
+        "DateTime": when.strftime(SCORE_DATETIME_FORMAT),
+    }
+
+
+NOW = datetime.datetime(2026, 6, 1, 12, 0, 0)
+
+
+def test_expired_rows_are_tail_suffix():
+    # Newest first, as stored by the cog
+    scores = [make_score(1, d) for d in (0, 10, 500, 600)]
+    cutoff = retention_cutoff(400, now=NOW)
+    assert expired_score_count(scores, cutoff) == 2
+
+
+def test_compaction_rollups_answer_windowed_queries():
+    scores = [make_score(1, 0), make_score(1, 450, win=1), make_score(2, 450, win=0), make_score(1, 451, win=0)]
+    cutoff = retention_cutoff(400, now=NOW)
+    rollups: dict = {}
+
+    progress = list(compact_scores(scores, rollups, cutoff))
+    assert progress[-1] == 3
+    # Source list is left untouched for the caller to trim
+    assert len(scores) == 4
+
+    start = NOW - datetime.timedelta(days=455)
+    players, rows = rollup_stats_since(rollups, start)
+    assert rows == 3
+    assert players["1"] == {"Points": 20, "GamesPlayed": 2, "Wins": 1}
+    assert players["2"] == {"Points": 5, "GamesPlayed": 1, "Wins": 0}
+
+    # Days before the window start are excluded
+    start = NOW - datetime.timedelta(days=450)
+    players, rows = rollup_stats_since(rollups, start)
+    assert rows == 2
+    assert players["1"]["GamesPlayed"] == 1
+
+
+def test_rollups_filter_by_queue():
+    scores = [make_score(1, 450, queue=1), make_score(1, 450, queue=2)]
+    rollups: dict = {}
+    list(compact_scores(scores, rollups, retention_cutoff(400, now=NOW)))
+
+    players, rows = rollup_stats_since(rollups, NOW - datetime.timedelta(days=500), queue_id=2)
+    assert rows == 1
+    assert players["1"]["GamesPlayed"] == 1
+
+
+def test_compaction_yields_per_batch():
+    scores = [make_score(p, 500) for p in range(10)]
+    steps = list(compact_scores(scores, {}, retention_cutoff(400, now=NOW), batch_size=3))
+    assert steps[:3] == [3, 6, 9]
+    assert steps[-1] == 10
+
+
+def test_nothing_to_compact():
+    scores = [make_score(1, 1)]
+    assert list(compact_scores(scores, {}, retention_cutoff(400, now=NOW))) == []
+
+
+@pytest.mark.asyncio
+async def test_windowed_leaderboard_combines_scores_and_rollups():
+    with patch("sixMans.sixMans.Config.get_conf"):
+        cog = SixMans(MagicMock())
+    guild = MagicMock(spec=discord.Guild)
+    cog.queueMaxSize[guild] = 2
+    now = datetime.datetime.now()
+    scores = [make_score(1, 1, now=now), make_score(2, 1, win=0, now=now), make_score(1, 10, now=now), make_score(3, 450, now=now)]
+    rollups: dict = {}
+    list(compact_scores(scores[3:], rollups, retention_cutoff(400, now=now)))
+    cog._scores = AsyncMock(return_value=scores[:3])
+    cog._score_rollups = AsyncMock(return_value=rollups)
+    cog._score_retention_days = AsyncMock(return_value=400)
+
+    players, games_played = await cog._scores_since(guild, now - datetime.timedelta(days=7), None)
+    assert players == {"1": {"Points": 15, "GamesPlayed": 1, "Wins": 1}, "2": {"Points": 5, "GamesPlayed": 1, "Wins": 0}}
+    assert games_played == 1
+
+    players, games_played = await cog._scores_since(guild, now - datetime.timedelta(days=500), None)
+    assert players["1"] == {"Points": 30, "GamesPlayed": 2, "Wins": 2}
+    assert players["3"] == {"Points": 15, "GamesPlayed": 1, "Wins": 1}
+    assert games_played == 2
@@ -15,17 +15,17 @@ from .conftest import make_interaction
 
 
 # ---------------------------------------------------------------------------
-# Helpers — discord.ui.button decorator wraps methods as Button objects,
-# so we need to call .callback(interaction) to invoke them in tests.
+# Helpers — button presses are routed to these handlers by the cog's
+# component router.
 # ---------------------------------------------------------------------------
 
 
 async def vote_blue(view: ScoreReportView, interaction):
-    await view.report_blue.callback(interaction)
+    await view.report_blue(interaction)
 
 
 async def vote_orange(view: ScoreReportView, interaction):
-    await view.report_orange.callback(interaction)
+    await view.report_orange(interaction)
 
 
 # ---------------------------------------------------------------------------
@@ -22,13 +22,13 @@ async def test_orange_full_error_message():
 
     # Fill orange team (2 players)
     i1 = make_interaction(players[0])
-    await view.pick_orange.callback(i1)
+    await view.pick_orange(i1)
     i2 = make_interaction(players[1])
-    await view.pick_orange.callback(i2)
+    await view.pick_orange(i2)
 
     # Third player tries to join orange — should get "Orange" error
     i3 = make_interaction(players[2])
-    await view.pick_orange.callback(i3)
+    await view.pick_orange(i3)
 
     i3.response.send_message.assert_called_once()
     error_msg = i3.response.send_message.call_args[0][0]
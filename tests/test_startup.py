@@ -0,0 +1,179 @@
+"""Tests for cog startup: concurrent guild loading, reconnects, lazy loading and game task deduplication."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import discord
+import pytest
+
+from sixMans import sixMans as six_mans_module
+from sixMans.enums import StartupState
+from sixMans.sixMans import SixMans
+
+
+def make_guild(guild_id: int) -> MagicMock:
+    guild = MagicMock(spec=discord.Guild)
+    guild.id = guild_id
+    guild.name = f"Guild {guild_id}"
+    return guild
+
+
+@pytest.fixture
+def cog():
+    bot = MagicMock()
+    bot.guilds = [make_guild(i) for i in range(6)]
+    with patch("sixMans.sixMans.Config.get_conf"):
+        cog = SixMans(bot)
+    return cog
+
+
+@pytest.mark.asyncio
+async def test_guilds_load_concurrently_with_bound(cog, monkeypatch):
+    monkeypatch.setattr(six_mans_module, "GUILD_LOAD_CONCURRENCY", 2)
+    running = 0
+    peak = 0
+
+    async def load_guild(guild):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        cog.queues[guild] = []
+        cog.games[guild] = []
+        running -= 1
+
+    cog._load_guild = load_guild
+    await cog._load_all_guilds()
+
+    assert peak == 2
+    assert set(cog.queues) == set(cog.bot.guilds)
+
+
+@pytest.mark.asyncio
+async def test_failing_guild_does_not_block_others(cog):
+    broken = cog.bot.guilds[0]
+
+    async def load_guild(guild):
+        if guild is broken:
+            raise RuntimeError("corrupt data")
+        cog.queues[guild] = []
+        cog.games[guild] = []
+
+    cog._load_guild = load_guild
+    await cog._load_all_guilds()
+
+    assert broken not in cog.queues
+    assert len(cog.queues) == len(cog.bot.guilds) - 1
+
+
+@pytest.mark.asyncio
+async def test_reconnect_only_loads_new_guilds(cog):
+    loaded = []
+
+    async def load_guild(guild):
+        loaded.append(guild)
+        cog.queues[guild] = []
+        cog.games[guild] = []
+
+    cog._load_guild = load_guild
+    await cog.on_ready()
+    assert cog.startup_state == StartupState.READY
+    assert len(loaded) == 6
+
+    # Reconnect with one new guild
+    new_guild = make_guild(99)
+    cog.bot.guilds.append(new_guild)
+    await cog.on_ready()
+    assert loaded[6:] == [new_guild]
+
+
+@pytest.mark.asyncio
+async def test_game_task_is_not_duplicated(cog):
+    game = MagicMock()
+    game.id = 1
+    release = asyncio.Event()
+    calls = 0
+
+    async def selection():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+
+    first = cog._start_game_task(game, selection)
+    second = cog._start_game_task(game, selection)
+    await asyncio.sleep(0)
+    assert first is second
+    assert calls == 1
+
+    release.set()
+    await first
+    await asyncio.sleep(0)
+    assert 1 not in cog.game_tasks
+
+
+@pytest.mark.asyncio
+async def test_lazy_guild_loads_on_first_use_and_evicts_when_idle(cog):
+    cog.lazy_loading = True
+    guild = cog.bot.guilds[0]
+    loads = 0
+
+    async def load_guild(guild):
+        nonlocal loads
+        loads += 1
+        queue = MagicMock()
+        queue.queue.queue = []
+        queue.analytics.dirty = False
+        cog.queues[guild] = [queue]
+        cog.games[guild] = []
+
+    cog._load_guild = load_guild
+    await asyncio.gather(cog.ensure_guild(guild), cog.ensure_guild(guild))
+    assert loads == 1
+
+    # Players waiting in a queue keep the guild loaded
+    cog.queues[guild][0].queue.queue = [MagicMock()]
+    assert not cog._is_idle(guild)
+
+    cog.queues[guild][0].queue.queue = []
+    assert cog._is_idle(guild)
+    ingestor = MagicMock(close=AsyncMock())
+    cog.ingestors[guild] = ingestor
+    await cog._evict_guild(guild)
+    assert guild not in cog.queues
+    assert guild not in cog.last_used
+    assert guild not in cog.ingestors
+    assert guild not in cog._guild_locks
+    ingestor.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_lazy_startup_loads_guilds_with_queued_players(cog):
+    cog.lazy_loading = True
+    with_game, with_members, empty = cog.bot.guilds[:3]
+    cog.bot.guilds = [with_game, with_members, empty]
+    games = {with_game: {"1": {}}}
+    queues = {with_members: {"1": {"Members": {"5": 1.0}}}, empty: {"2": {"Members": {}}}}
+    cog._games = AsyncMock(side_effect=lambda guild: games.get(guild, {}))
+    cog._queues = AsyncMock(side_effect=lambda guild: queues.get(guild, {}))
+    cog._load_guilds = AsyncMock()
+
+    await cog._load_all_guilds()
+    cog._load_guilds.assert_awaited_once_with([with_game, with_members])
+
+
+@pytest.mark.asyncio
+async def test_settings_load_reads_only_settings(cog):
+    stored = dict(six_mans_module.defaults, CurrentSeason={"Name": "S1", "Start": "2026-10-01"}, Scores=[{"Game": 1}])
+
+    async def get_raw(key):
+        return stored[key]
+
+    conf = MagicMock()
+    conf.get_raw = AsyncMock(side_effect=get_raw)
+    cog.config.guild = MagicMock(return_value=conf)
+
+    settings = await cog._load_settings(make_guild(1))
+    assert settings.CurrentSeason == {"Name": "S1", "Start": "2026-10-01"}
+    read = {call.args[0] for call in conf.get_raw.await_args_list}
+    assert read == set(type(settings).model_fields)
+    conf.all.assert_not_called()
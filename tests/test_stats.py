@@ -0,0 +1,39 @@
+"""Tests for the array-backed player stats table (sixMans/stats.py)."""
+
+from sixMans.queue import SixMansQueue
+from sixMans.stats import PlayerStatsTable
+
+
+def test_table_matches_saved_shape():
+    saved = {"1": {"Points": 25, "GamesPlayed": 3, "Wins": 1}, "2": {"Points": 5, "GamesPlayed": 1, "Wins": 0}}
+    table = PlayerStatsTable(saved)
+
+    assert len(table) == 2
+    assert table["1"] == table[1] == saved["1"]
+    assert "2" in table and 2 in table and "3" not in table
+    assert table.get(3) is None
+    assert table.to_dict() == saved
+
+
+def test_record_adds_new_and_existing_players():
+    table = PlayerStatsTable({"1": {"Points": 25, "GamesPlayed": 3, "Wins": 1}})
+    table.record(1, 15, 1)
+    table.record(7, 5, 0)
+
+    assert table[1] == {"Points": 40, "GamesPlayed": 4, "Wins": 2}
+    assert table[7] == {"Points": 5, "GamesPlayed": 1, "Wins": 0}
+    assert list(table) == ["1", "7"]
+
+
+def test_queue_persists_json_shape():
+    queue = SixMansQueue(
+        name="Test",
+        guild=None,  # type: ignore[arg-type]
+        channels=[],
+        points={"Play": 5, "Win": 10},
+        players={"1": {"Points": 25, "GamesPlayed": 3, "Wins": 1}},
+        gamesPlayed=3,
+        maxSize=6,
+    )
+    queue.players.record(2, 5, 0)
+    assert queue._to_dict()["Players"] == {"1": {"Points": 25, "GamesPlayed": 3, "Wins": 1}, "2": {"Points": 5, "GamesPlayed": 1, "Wins": 0}}
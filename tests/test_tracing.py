@@ -0,0 +1,110 @@
+"""Tests for pop pipeline tracing (sixMans/tracing.py)."""
+
+import asyncio
+import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import discord
+import pytest
+
+from sixMans.queue import SixMansQueue
+from sixMans.sixMans import SixMans
+from sixMans.tracing import TRACER, Tracer, tag, traced
+
+from .conftest import make_member
+
+
+@pytest.mark.asyncio
+async def test_spans_nest_across_tasks():
+    tracer = Tracer()
+
+    async def game(game_id: int, delay: float):
+        with tracer.span("create_game"):
+            tag(game=game_id)
+            with tracer.span("create_game_channels"):
+                await asyncio.sleep(delay)
+
+    with tracer.span("pop_queue", root=True):
+        await asyncio.gather(game(1, 0.02), game(2, 0))
+
+    trace = tracer.find(2)
+    assert trace is tracer.find(1)
+    assert trace.finished
+    first, second = trace.root.children
+    assert first.tags == {"game": 1}
+    assert [c.name for c in first.children] == ["create_game_channels"]
+    assert first.duration() >= 0.02 > second.duration()
+
+    lines = trace.render().splitlines()
+    assert lines[0].startswith("+") and "ms pop_queue " in lines[0]
+    assert "  create_game game=1 " in lines[1]
+    assert "    create_game_channels " in lines[2]
+
+
+def test_spans_outside_a_trace_are_not_recorded():
+    tracer = Tracer(size=2)
+    with tracer.span("send_game_info") as span:
+        assert span is None
+        tag(game=1)
+    assert not tracer.traces
+
+    for name in "abc":
+        with tracer.span(name, root=True):
+            pass
+    assert [t.root.name for t in tracer.traces] == ["b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_unfinished_steps_are_visible():
+    tracer = Tracer()
+    release = asyncio.Event()
+
+    async def pipeline():
+        with tracer.span("pop_queue", root=True):
+            tag(game=7)
+            await release.wait()
+
+    task = asyncio.create_task(pipeline())
+    await asyncio.sleep(0)
+    trace = tracer.find(7)
+    assert not trace.finished
+    assert trace.render().endswith("(running)")
+    release.set()
+    await task
+    assert trace.finished
+
+
+@pytest.mark.asyncio
+async def test_game_trace_command_dumps_pop_pipeline():
+    with patch("sixMans.sixMans.Config.get_conf"):
+        cog = SixMans(MagicMock())
+    cog._save_queue_members = AsyncMock()
+
+    @traced("create_game")
+    async def create_game(guild, queue, prefix="?", players=None):
+        tag(game=1234)
+
+    cog.create_game = create_game
+    guild = MagicMock(spec=discord.Guild)
+    guild.id = 42
+    queue = SixMansQueue(name="Test", guild=guild, channels=[], points={}, players={}, gamesPlayed=0, maxSize=2, id=1)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    for i in range(1, 3):
+        queue._put(make_member(f"P{i}", i), joined=now)
+    cog.queues[guild] = [queue]
+
+    assert await cog._pop_queue(guild, queue)
+    queue.board.cancel()
+
+    ctx = MagicMock(guild=guild)
+    ctx.send = AsyncMock()
+    await cog.gameTrace(cog, ctx, 1234)
+    text = ctx.send.await_args.args[0]
+    assert "pop_queue guild=42 queue=Test" in text
+    assert "create_game game=1234" in text
+
+    # Other guilds can't see the trace
+    ctx.guild = MagicMock(spec=discord.Guild, id=7)
+    await cog.gameTrace(cog, ctx, 1234)
+    assert ctx.send.await_args.kwargs["embed"].title == "Error"
+    TRACER.traces.clear()